@@ -14,8 +14,11 @@ from backend.app.handlers import init_logging
 from backend.app.handlers.database import close_db, init_db
 from backend.app.middlewares import DynamicCORSMiddleware, include_middlewares
 from backend.app.router import root_api_router
-from backend.app.services.init_schedulers import init_schedulers
-from backend.app.utils import AiohttpClient
+from backend.app.services.allowed_origin_registry import allowed_origin_registry
+from backend.app.services.init_schedulers import init_schedulers, shutdown_schedulers
+from backend.app.services.refresh_token_blacklist import refresh_token_blacklist
+from backend.app.services.user_profile_resolver import user_profile_resolver
+from backend.app.utils.upstream_client import upstream_clients
 from backend.config import settings
 
 
@@ -28,12 +31,20 @@ async def on_startup():
     """
     logger.info("Execute FastAPI startup event handler.")
 
-    AiohttpClient.get_aiohttp_client()
     # TODO merge with container
     client = container.database_client()
     await init_db(settings.mongo_settings.DB, client)
+    await refresh_token_blacklist.start()
+    await allowed_origin_registry.start()
+    await container.form_provider_registry().start()
+    if settings.api_settings.IN_PROCESS_PLUGINS:
+        container.form_plugin_client().load_plugins(
+            settings.api_settings.PLUGIN_CONFIG_PATH or None
+        )
     if settings.schedular_settings.ENABLED:
-        await init_schedulers(container.schedular())
+        await init_schedulers(container.schedular(), container.worker_coordinator())
+    if settings.export_settings.JOBS_ENABLED:
+        await container.export_job_runner().start()
 
 
 async def on_shutdown():
@@ -45,13 +56,21 @@ async def on_shutdown():
     """
     logger.info("Execute FastAPI shutdown event handler.")
     # Gracefully close utilities.
+    await refresh_token_blacklist.stop()
+    await allowed_origin_registry.stop()
+    await container.form_provider_registry().stop()
+
+    if settings.export_settings.JOBS_ENABLED:
+        await container.export_job_runner().stop()
+    if settings.schedular_settings.ENABLED:
+        await shutdown_schedulers(container.worker_coordinator())
 
     # TODO merge with container
     client = container.database_client()
     await close_db(client)
 
-    await AiohttpClient.close_aiohttp_client()
-    await container.http_client().aclose()
+    await user_profile_resolver.close()
+    await upstream_clients.aclose()
     container.schedular().shutdown()
 
 
@@ -1,16 +1,22 @@
 import os
 from pathlib import Path
 
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.mongodb import MongoDBJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dependency_injector import containers, providers
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from backend.app.core.plugin_client import FormPluginClient
+from backend.app.repositories.export_job_repository import ExportJobRepository
 from backend.app.repositories.form_plugin_provider_repository import (
     FormPluginProviderRepository,
 )
 from backend.app.repositories.form_repository import FormRepository
 from backend.app.repositories.form_response_repository import FormResponseRepository
+from backend.app.repositories.form_sync_state_repository import (
+    FormSyncStateRepository,
+)
 from backend.app.repositories.responder_groups_repository import (
     ResponderGroupsRepository,
 )
@@ -20,34 +26,43 @@ from backend.app.repositories.workspace_repository import WorkspaceRepository
 from backend.app.repositories.workspace_responders_repository import (
     WorkspaceRespondersRepository,
 )
+from backend.app.repositories.scheduler_worker_repository import (
+    SchedulerWorkerRepository,
+)
 from backend.app.repositories.workspace_user_repository import WorkspaceUserRepository
 from backend.app.schedulers.form_schedular import FormSchedular
+from backend.app.schedulers.sync_executor import SyncExecutor
+from backend.app.schedulers.export_job_runner import ExportJobRunner
+from backend.app.schedulers.worker_coordinator import WorkerCoordinator
 from backend.app.services.auth_service import AuthService
 from backend.app.services.aws_service import AWSS3Service
 from backend.app.services.form_import_service import FormImportService
 from backend.app.services.form_plugin_provider_service import FormPluginProviderService
+from backend.app.services.form_provider_registry import FormProviderRegistry
 from backend.app.services.form_response_service import FormResponseService
 from backend.app.services.form_service import FormService
 from backend.app.services.plugin_proxy_service import PluginProxyService
 from backend.app.services.responder_groups_service import ResponderGroupsService
+from backend.app.services.response_export_service import ResponseExportService
+from backend.app.services.export_job_service import ExportJobService
 from backend.app.services.stripe_service import StripeService
 from backend.app.services.workspace_form_service import WorkspaceFormService
 from backend.app.services.workspace_members_service import WorkspaceMembersService
 from backend.app.services.workspace_responders_service import WorkspaceRespondersService
 from backend.app.services.workspace_service import WorkspaceService
 from backend.app.services.workspace_user_service import WorkspaceUserService
+from backend.app.utils.request_cache import MongoCallCounter
 from backend.config import settings
-from common.services.http_client import HttpClient
 from common.services.jwt_service import JwtService
 
 current_path = Path(os.path.abspath(os.path.dirname(__file__))).absolute()
 
 
 class AppContainer(containers.DeclarativeContainer):
-    http_client: HttpClient = providers.Singleton(HttpClient)
-
     database_client: AsyncIOMotorClient = providers.Singleton(
-        AsyncIOMotorClient, settings.mongo_settings.URI
+        AsyncIOMotorClient,
+        settings.mongo_settings.URI,
+        event_listeners=[MongoCallCounter()],
     )
 
     # Repositories
@@ -71,6 +86,16 @@ class AppContainer(containers.DeclarativeContainer):
 
     responder_groups_repository = providers.Singleton(ResponderGroupsRepository)
 
+    form_sync_state_repo: FormSyncStateRepository = providers.Singleton(
+        FormSyncStateRepository
+    )
+
+    scheduler_worker_repo: SchedulerWorkerRepository = providers.Singleton(
+        SchedulerWorkerRepository
+    )
+
+    export_job_repo: ExportJobRepository = providers.Singleton(ExportJobRepository)
+
     # Services
     aws_service: AWSS3Service = providers.Singleton(
         AWSS3Service,
@@ -82,17 +107,22 @@ class AppContainer(containers.DeclarativeContainer):
         JwtService, settings.auth_settings.JWT_SECRET
     )
 
-    form_provider_service: FormPluginProviderService = providers.Singleton(
-        FormPluginProviderService, form_provider_repo=form_provider_repo
+    form_provider_registry: FormProviderRegistry = providers.Singleton(
+        FormProviderRegistry
     )
 
-    plugin_proxy_service: PluginProxyService = providers.Singleton(
-        PluginProxyService, http_client=http_client
+    form_provider_service: FormPluginProviderService = providers.Singleton(
+        FormPluginProviderService,
+        form_provider_repo=form_provider_repo,
+        form_provider_registry=form_provider_registry,
     )
 
+    plugin_proxy_service: PluginProxyService = providers.Singleton(PluginProxyService)
+
+    form_plugin_client: FormPluginClient = providers.Singleton(FormPluginClient)
+
     auth_service: AuthService = providers.Singleton(
         AuthService,
-        http_client=http_client,
         plugin_proxy_service=plugin_proxy_service,
         form_provider_service=form_provider_service,
         jwt_service=jwt_service,
@@ -110,13 +140,42 @@ class AppContainer(containers.DeclarativeContainer):
         form_response_repo=form_response_repo,
         workspace_form_repo=workspace_form_repo,
         workspace_user_repo=workspace_user_repo,
+        form_repo=form_repo,
     )
 
     workspace_user_service: WorkspaceUserService = providers.Singleton(
         WorkspaceUserService, workspace_user_repository=workspace_user_repo
     )
 
-    job_store = providers.Singleton(MongoDBJobStore, host=settings.mongo_settings.URI)
+    response_export_service: ResponseExportService = providers.Singleton(
+        ResponseExportService,
+        form_response_repo=form_response_repo,
+        form_repo=form_repo,
+        workspace_form_repo=workspace_form_repo,
+        workspace_user_service=workspace_user_service,
+    )
+
+    export_job_service: ExportJobService = providers.Singleton(
+        ExportJobService,
+        export_job_repo=export_job_repo,
+        response_export_service=response_export_service,
+        workspace_user_service=workspace_user_service,
+        aws_service=aws_service,
+    )
+
+    export_job_runner: ExportJobRunner = providers.Singleton(
+        ExportJobRunner,
+        export_job_repo=export_job_repo,
+        export_job_service=export_job_service,
+    )
+
+    # In the distributed mode each worker only schedules the forms it owns so the
+    # jobs are not shared between the workers
+    job_store = (
+        providers.Singleton(MemoryJobStore)
+        if settings.schedular_settings.DISTRIBUTED
+        else providers.Singleton(MongoDBJobStore, host=settings.mongo_settings.URI)
+    )
 
     job_stores = providers.Dict(default=job_store)
 
@@ -129,15 +188,30 @@ class AppContainer(containers.DeclarativeContainer):
         jobstores=job_stores,
     )
 
+    worker_coordinator: WorkerCoordinator = providers.Singleton(
+        WorkerCoordinator, scheduler_worker_repo=scheduler_worker_repo
+    )
+
+    sync_executor: SyncExecutor = providers.Singleton(SyncExecutor)
+
     form_import_service: FormImportService = providers.Singleton(
-        FormImportService, form_service=form_service
+        FormImportService,
+        form_service=form_service,
+        form_repo=form_repo,
+        form_response_repo=form_response_repo,
     )
 
     form_schedular = providers.Singleton(
         FormSchedular,
         form_provider_service=form_provider_service,
+        form_plugin_client=form_plugin_client,
         form_import_service=form_import_service,
         jwt_service=jwt_service,
+        form_sync_state_repo=form_sync_state_repo,
+        worker_coordinator=worker_coordinator,
+        workspace_form_repo=workspace_form_repo,
+        schedular=schedular,
+        sync_executor=sync_executor,
     )
 
     responder_groups_service = providers.Singleton(
@@ -156,13 +230,13 @@ class AppContainer(containers.DeclarativeContainer):
         form_schedular=form_schedular,
         form_import_service=form_import_service,
         schedular=schedular,
+        worker_coordinator=worker_coordinator,
         form_response_service=form_response_service,
         responder_groups_service=responder_groups_service,
     )
 
     workspace_service: WorkspaceService = providers.Singleton(
         WorkspaceService,
-        http_client=http_client,
         workspace_repo=workspace_repo,
         aws_service=aws_service,
         workspace_user_service=workspace_user_service,
@@ -178,13 +252,11 @@ class AppContainer(containers.DeclarativeContainer):
         WorkspaceMembersService,
         workspace_user_service=workspace_user_service,
         workspace_invitation_repo=workspace_invitation_repo,
-        http_client=http_client,
         workspace_form_service=workspace_form_service,
     )
 
     stripe_service: StripeService = providers.Singleton(
         StripeService,
-        http_client=http_client,
         plugin_proxy_service=plugin_proxy_service,
         form_provider_service=form_provider_service,
         jwt_service=jwt_service,
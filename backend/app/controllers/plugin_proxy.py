@@ -7,6 +7,7 @@ from fastapi import Body, Depends
 from starlette.requests import Request
 
 from backend.app.container import container
+from backend.app.core.plugin_client import FormPluginClient
 from backend.app.exceptions import HTTPException
 from backend.app.services.form_plugin_provider_service import FormPluginProviderService
 from backend.app.services.plugin_proxy_service import PluginProxyService
@@ -24,9 +25,11 @@ class PluginProxy(BasePluginRoute):
         self,
         plugin_proxy_service: PluginProxyService = container.plugin_proxy_service(),
         form_provider_service: FormPluginProviderService = container.form_provider_service(),
+        form_plugin_client: FormPluginClient = container.form_plugin_client(),
     ):
         self.plugin_proxy_service = plugin_proxy_service
         self.form_provider_service = form_provider_service
+        self.form_plugin_client = form_plugin_client
 
     async def list_forms(
         self,
@@ -35,10 +38,16 @@ class PluginProxy(BasePluginRoute):
         user: User = Depends(get_logged_user),
     ):
         proxy_url = await self.form_provider_service.get_provider_url(provider)
-        data = await self.plugin_proxy_service.pass_request(
-            request, f"{proxy_url}/{provider}/forms"
+        return await self.form_plugin_client.run(
+            provider,
+            "list_forms",
+            lambda plugin: plugin.list_forms(
+                cookies=request.cookies, params=dict(request.query_params)
+            ),
+            lambda: self.plugin_proxy_service.stream_request(
+                request, f"{proxy_url}/{provider}/forms", provider=provider
+            ),
         )
-        return data
 
     async def get_form(
         self,
@@ -49,10 +58,16 @@ class PluginProxy(BasePluginRoute):
         user: User = Depends(get_logged_user),
     ):
         proxy_url = await self.form_provider_service.get_provider_url(provider)
-        data = await self.plugin_proxy_service.pass_request(
-            request, f"{proxy_url}/{provider}/forms/{form_id}"
+        return await self.form_plugin_client.run(
+            provider,
+            "get_form",
+            lambda plugin: plugin.get_form(
+                form_id, cookies=request.cookies, params=dict(request.query_params)
+            ),
+            lambda: self.plugin_proxy_service.stream_request(
+                request, f"{proxy_url}/{provider}/forms/{form_id}", provider=provider
+            ),
         )
-        return data
 
     async def import_form(
         self,
@@ -61,17 +76,29 @@ class PluginProxy(BasePluginRoute):
         request: Request,
     ):
         proxy_url = await self.form_provider_service.get_provider_url(provider)
-        data = await self.plugin_proxy_service.pass_request(
-            request, f"{proxy_url}/{provider}/forms/{form_id}"
+        return await self.form_plugin_client.run(
+            provider,
+            "get_form",
+            lambda plugin: plugin.get_form(
+                form_id, cookies=request.cookies, params=dict(request.query_params)
+            ),
+            lambda: self.plugin_proxy_service.stream_request(
+                request, f"{proxy_url}/{provider}/forms/{form_id}", provider=provider
+            ),
         )
-        return data
 
     async def import_forms(self, provider: str | FormProvider, request: Request):
         proxy_url = await self.form_provider_service.get_provider_url(provider)
-        data = await self.plugin_proxy_service.pass_request(
-            request, f"{proxy_url}/{provider}/forms"
+        return await self.form_plugin_client.run(
+            provider,
+            "list_forms",
+            lambda plugin: plugin.list_forms(
+                cookies=request.cookies, params=dict(request.query_params)
+            ),
+            lambda: self.plugin_proxy_service.stream_request(
+                request, f"{proxy_url}/{provider}/forms", provider=provider
+            ),
         )
-        return data
 
     async def create_form(
         self,
@@ -82,10 +109,21 @@ class PluginProxy(BasePluginRoute):
         user: User = Depends(get_logged_user),
     ):
         proxy_url = await self.form_provider_service.get_provider_url(provider)
-        data = await self.plugin_proxy_service.pass_request(
-            request, f"{proxy_url}/{provider}/forms", data=request_body
+        return await self.form_plugin_client.run(
+            provider,
+            "create_form",
+            lambda plugin: plugin.create_form(
+                request_body,
+                cookies=request.cookies,
+                params=dict(request.query_params),
+            ),
+            lambda: self.plugin_proxy_service.stream_request(
+                request,
+                f"{proxy_url}/{provider}/forms",
+                provider=provider,
+                data=request_body,
+            ),
         )
-        return data
 
     async def update_form(
         self,
@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from classy_fastapi import Routable, get
+from fastapi import Depends
+
+from backend.app.container import container
+from backend.app.models.scheduler_bootstrap_progress import SchedulerBootstrapMetrics
+from backend.app.router import router
+from backend.app.schedulers.sync_executor import SyncExecutor, SyncExecutorMetrics
+from backend.app.services.init_schedulers import bootstrap_progress
+from backend.app.services.user_service import get_logged_admin
+
+
+@router(prefix="/scheduler", tags=["Scheduler"])
+class SchedulerRouter(Routable):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sync_executor: SyncExecutor = container.sync_executor()
+
+    @get(
+        "/metrics",
+        status_code=HTTPStatus.OK,
+        response_model=SyncExecutorMetrics,
+        dependencies=[Depends(get_logged_admin)],
+    )
+    async def _get_metrics(self):
+        return self._sync_executor.metrics()
+
+    @get(
+        "/bootstrap",
+        status_code=HTTPStatus.OK,
+        response_model=SchedulerBootstrapMetrics,
+        dependencies=[Depends(get_logged_admin)],
+    )
+    async def _get_bootstrap_progress(self):
+        return bootstrap_progress.metrics()
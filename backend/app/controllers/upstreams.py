@@ -0,0 +1,21 @@
+from http import HTTPStatus
+from typing import List
+
+from classy_fastapi import Routable, get
+from fastapi import Depends
+
+from backend.app.router import router
+from backend.app.services.user_service import get_logged_admin
+from backend.app.utils.upstream_client import UpstreamMetrics, upstream_clients
+
+
+@router(prefix="/upstreams", tags=["Upstreams"])
+class UpstreamsRouter(Routable):
+    @get(
+        "/metrics",
+        status_code=HTTPStatus.OK,
+        response_model=List[UpstreamMetrics],
+        dependencies=[Depends(get_logged_admin)],
+    )
+    async def _get_metrics(self):
+        return upstream_clients.metrics()
@@ -0,0 +1,65 @@
+from http import HTTPStatus
+from typing import Optional
+
+from beanie import PydanticObjectId
+from classy_fastapi import get, post
+from fastapi import Depends, Header
+
+from backend.app.container import container
+from backend.app.models.enum.export_format import ExportFormat
+from backend.app.models.filter_queries.form_responses import FormResponseFilterQuery
+from backend.app.models.response_dtos import ExportJobResponse
+from backend.app.router import router
+from backend.app.services.export_job_service import ExportJobService
+from backend.app.services.user_service import get_logged_user
+from backend.app.utils.custom_routable import CustomRoutable
+from common.models.user import User
+
+
+@router(
+    prefix="/workspaces/{workspace_id}/exports",
+    tags=["Workspace Submission Exports"],
+)
+class WorkspaceExportsRouter(CustomRoutable):
+    def __init__(
+        self,
+        export_job_service: ExportJobService = container.export_job_service(),
+        *args,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._export_job_service = export_job_service
+
+    @post("", status_code=HTTPStatus.ACCEPTED, response_model=ExportJobResponse)
+    async def _create_export_job(
+        self,
+        workspace_id: PydanticObjectId,
+        export_format: ExportFormat = ExportFormat.CSV,
+        form_id: Optional[str] = None,
+        filter_query: FormResponseFilterQuery = Depends(None),
+        user: User = Depends(get_logged_user),
+    ):
+        return await self._export_job_service.create_job(
+            workspace_id, user, export_format, form_id, filter_query
+        )
+
+    @get("/{job_id}", response_model=ExportJobResponse)
+    async def _get_export_job(
+        self,
+        workspace_id: PydanticObjectId,
+        job_id: PydanticObjectId,
+        user: User = Depends(get_logged_user),
+    ):
+        return await self._export_job_service.get_job(workspace_id, job_id, user)
+
+    @get("/{job_id}/download")
+    async def _download_export(
+        self,
+        workspace_id: PydanticObjectId,
+        job_id: PydanticObjectId,
+        range_header: Optional[str] = Header(None, alias="Range"),
+        user: User = Depends(get_logged_user),
+    ):
+        return await self._export_job_service.download(
+            workspace_id, job_id, user, range_header
+        )
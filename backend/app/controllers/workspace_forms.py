@@ -71,7 +71,7 @@ class WorkspaceFormsRouter(Routable):
         settings: SettingsPatchDto,
         user: User = Depends(get_logged_user),
     ):
-        data = await self._form_service.patch_settings_in_workspace_form(
+        data = await self.workspace_form_service.patch_form_settings(
             workspace_id, form_id, settings, user
         )
         return WorkspaceFormPatchResponse(**data.dict())
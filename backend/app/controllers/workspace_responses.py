@@ -1,16 +1,20 @@
-from typing import Any
+from typing import Any, Optional
 
 from beanie import PydanticObjectId
 from classy_fastapi import delete, get
 from fastapi import Depends
-from fastapi_pagination import Page
+from fastapi_pagination import Page, Params
+from fastapi_pagination.api import pagination_ctx
 
 from backend.app.container import container
+from backend.app.models.cursor_page import CursorPage, CursorParams
+from backend.app.models.enum.export_format import ExportFormat
 from backend.app.models.filter_queries.form_responses import FormResponseFilterQuery
 from backend.app.models.filter_queries.sort import SortRequest
 from backend.app.models.response_dtos import StandardFormResponseCamelModel
 from backend.app.router import router
 from backend.app.services.form_response_service import FormResponseService
+from backend.app.services.response_export_service import ResponseExportService
 from backend.app.services.user_service import get_logged_user
 from backend.app.utils.custom_routable import CustomRoutable
 from common.models.user import User
@@ -24,15 +28,20 @@ class WorkspaceResponsesRouter(CustomRoutable):
     def __init__(
         self,
         form_response_service: FormResponseService = container.form_response_service(),
+        response_export_service: ResponseExportService = container.response_export_service(),
         *args,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
         self._form_response_service = form_response_service
+        self._response_export_service = response_export_service
 
+    # The pagination params are declared on the route as the response can also be
+    # a cursor page when the client opts in with use_cursor or a cursor
     @get(
         "/forms/{form_id}/submissions",
-        response_model=Page[StandardFormResponseCamelModel],
+        response_model=Page[StandardFormResponseCamelModel]
+        | CursorPage[StandardFormResponseCamelModel],
     )
     async def _get_workspace_form_responses(
         self,
@@ -41,20 +50,65 @@ class WorkspaceResponsesRouter(CustomRoutable):
         filter_query: FormResponseFilterQuery = Depends(None),
         sort: SortRequest = Depends(),
         request_for_deletion: bool = False,
+        use_cursor: bool = False,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        params: Params = Depends(pagination_ctx(Page[StandardFormResponseCamelModel])),
         user: User = Depends(get_logged_user),
     ):
         responses = await self._form_response_service.get_workspace_submissions(
-            workspace_id, request_for_deletion, form_id, filter_query, sort, user
+            workspace_id,
+            request_for_deletion,
+            form_id,
+            filter_query,
+            sort,
+            user,
+            cursor_params=_get_cursor_params(use_cursor, cursor, include_total, params),
         )
         return responses
 
-    @get("/all-submissions", response_model=Page[StandardFormResponseCamelModel | Any])
+    @get("/forms/{form_id}/submissions/export")
+    async def _export_workspace_form_responses(
+        self,
+        workspace_id: PydanticObjectId,
+        form_id: str,
+        export_format: ExportFormat = ExportFormat.CSV,
+        filter_query: FormResponseFilterQuery = Depends(None),
+        user: User = Depends(get_logged_user),
+    ):
+        return await self._response_export_service.export_responses(
+            workspace_id, user, export_format, form_id, filter_query
+        )
+
+    @get("/all-submissions/export")
+    async def _export_all_workspace_responses(
+        self,
+        workspace_id: PydanticObjectId,
+        export_format: ExportFormat = ExportFormat.CSV,
+        filter_query: FormResponseFilterQuery = Depends(None),
+        user: User = Depends(get_logged_user),
+    ):
+        return await self._response_export_service.export_responses(
+            workspace_id, user, export_format, filter_query=filter_query
+        )
+
+    @get(
+        "/all-submissions",
+        response_model=Page[StandardFormResponseCamelModel | Any]
+        | CursorPage[StandardFormResponseCamelModel],
+    )
     async def _get_all_workspace_responses(
         self,
         workspace_id: PydanticObjectId,
         filter_query: FormResponseFilterQuery = Depends(None),
         sort: SortRequest = Depends(None),
         request_for_deletion: bool = False,
+        use_cursor: bool = False,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        params: Params = Depends(
+            pagination_ctx(Page[StandardFormResponseCamelModel | Any])
+        ),
         user=Depends(get_logged_user),
     ):
         responses = await self._form_response_service.get_all_workspace_responses(
@@ -63,6 +117,7 @@ class WorkspaceResponsesRouter(CustomRoutable):
             sort=sort,
             request_for_deletion=request_for_deletion,
             user=user,
+            cursor_params=_get_cursor_params(use_cursor, cursor, include_total, params),
         )
         return responses
 
@@ -101,3 +156,11 @@ class WorkspaceResponsesRouter(CustomRoutable):
             workspace_id, submission_id, user
         )
         return {"message": "Request for deletion created successfully."}
+
+
+def _get_cursor_params(
+    use_cursor: bool, cursor: Optional[str], include_total: bool, params: Params
+) -> Optional[CursorParams]:
+    if not use_cursor and cursor is None:
+        return None
+    return CursorParams(cursor=cursor, size=params.size, include_total=include_total)
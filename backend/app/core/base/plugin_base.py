@@ -4,13 +4,31 @@ from typing import Protocol
 
 from common.enums.form_provider import FormProvider
 
+FORM_OPERATIONS = ("list_forms", "get_form", "create_form", "convert_form")
+
 
 class BasePlugin(Protocol):
-    """Base representation of plugin."""
+    """
+    Base representation of plugin.
+
+    A plugin can run the operations of its provider in-process by defining the
+    coroutines named in `FORM_OPERATIONS`. They mirror the endpoints of the
+    plugin services and receive the cookies and query params of the request:
+
+        list_forms(*, cookies, params=None)
+        get_form(form_id, *, cookies, params=None)
+        create_form(form, *, cookies, params=None)
+        convert_form(raw_form, *, cookies, params=None)
+
+    The operations a plugin doesn't define are sent to its service.
+    """
 
     def __init__(self, provider: str | FormProvider):
         self.provider = provider
 
+    def supports(self, operation: str) -> bool:
+        return operation in FORM_OPERATIONS and callable(getattr(self, operation, None))
+
     def __repr__(self):
         return f"<{self.__class__.__name__}>"
 
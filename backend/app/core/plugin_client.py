@@ -1,26 +1,80 @@
 import json
-from typing import List
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from loguru import logger
 
 from backend.app.core.base.plugin_base import BasePlugin
 from backend.app.core.factory import plugin_factory
 from backend.app.core.loader import plugin_loader
 
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "plugin.json"
+
+T = TypeVar("T")
+
 
 class FormPluginClient:
+    """
+    Runs the form provider plugins loaded in the worker, the operations of the
+    providers that aren't loaded or that their plugin doesn't define are sent to
+    the plugin services instead.
+    """
+
     def __init__(self):
-        self.plugins: List[BasePlugin] = []
+        self.plugins: Dict[str, BasePlugin] = {}
 
-    def load_plugins(self):
-        with open("./plugin.json") as file:
+    def load_plugins(self, config_path: str | Path = None) -> List[BasePlugin]:
+        with open(config_path or DEFAULT_CONFIG_PATH) as file:
             data = json.load(file)
 
-            # load plugins
-            plugin_loader.load_plugins(data.get("plugins", []))
+        # load plugins
+        for plugin_name in data.get("plugins", []):
+            try:
+                plugin_loader.load_plugins([plugin_name])
+            except Exception as e:
+                logger.opt(exception=e).error(f"Failed to load plugin {plugin_name}.")
+
+        for item in data.get("providers", []):
+            try:
+                plugin = plugin_factory.create(item)
+            except ValueError as e:
+                logger.warning(str(e))
+                continue
+            self.plugins[str(plugin.provider)] = plugin
+        logger.info(f"Loaded in-process plugins: {list(self.plugins)}")
+        return list(self.plugins.values())
+
+    def get_plugin(self, provider: str) -> Optional[BasePlugin]:
+        return self.plugins.get(str(provider))
+
+    async def run(
+        self,
+        provider: str,
+        operation: str,
+        call: Callable[[BasePlugin], Awaitable[T]],
+        fallback: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Runs the operation with the plugin of the provider if it is loaded in the
+        worker and defines the operation, otherwise with the fallback sending it
+        to the plugin service.
+
+        Whether the plugin runs the operation is decided before calling it, the
+        errors of the plugin are never retried with the service as the operation
+        could already have side effects.
 
-            self.plugins.extend(
-                [plugin_factory.create(item) for item in data.get("providers", [])]
-            )
-        return self.plugins
+        Args:
+            provider (str): The name of the form provider.
+            operation (str): The name of the operation, one of `FORM_OPERATIONS`.
+            call (Callable[[BasePlugin], Awaitable[T]]): Runs the operation with
+                the plugin.
+            fallback (Callable[[], Awaitable[T]]): Sends the operation to the
+                plugin service.
+        """
+        plugin = self.get_plugin(provider)
+        if plugin and plugin.supports(operation):
+            return await call(plugin)
+        return await fallback()
 
 
 if __name__ == "__main__":
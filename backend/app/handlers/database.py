@@ -9,7 +9,14 @@ from backend.app.schemas.allowed_origin import (
     AllowedOriginsDocument,
 )
 from backend.app.schemas.blacklisted_refresh_tokens import BlackListedRefreshTokens
+from backend.app.schemas.cache_version import CacheVersionDocument
+from backend.app.schemas.export_job import ExportJobDocument
 from backend.app.schemas.form_plugin_config import FormPluginConfigDocument
+from backend.app.schemas.form_sync_state import FormSyncStateDocument
+from backend.app.schemas.scheduler_worker import (
+    SchedulerLeaseDocument,
+    SchedulerWorkerDocument,
+)
 from backend.app.schemas.responder_group import (
     ResponderGroupDocument,
     ResponderGroupMemberDocument,
@@ -56,32 +63,46 @@ async def init_db(db: str, client: AsyncIOMotorClient):
     """
     client.get_io_loop = asyncio.get_running_loop
     db = client[db]
-    document_models.extend(
-        [
-            # TODO Merge on extend below
-            # Add mongo schemas here
-            AllowedOriginsDocument,
-            FormDocument,
-            FormResponseDocument,
-            FormPluginConfigDocument,
-            WorkspaceDocument,
-            WorkspaceFormDocument,
-            WorkspaceUserInvitesDocument,
-            WorkspaceUserDocument,
-            FormResponseDeletionRequest,
-            BlackListedRefreshTokens,
-            ResponderGroupFormDocument,
-            ResponderGroupMemberDocument,
-            ResponderGroupDocument,
-        ]
-    )
     await init_beanie(
         database=db,
-        document_models=document_models,
+        document_models=get_document_models(),
     )
     logger.info("Database connected successfully.")
 
 
+def get_document_models():
+    """
+    Returns the document models of the app. The indexes declared on the models
+    are created by beanie when it is initialized.
+
+    Returns:
+        List[Type[Document]]: The document models.
+    """
+    return [
+        *document_models,
+        # TODO Merge with the models registered with entity
+        # Add mongo schemas here
+        AllowedOriginsDocument,
+        ExportJobDocument,
+        FormDocument,
+        FormResponseDocument,
+        FormPluginConfigDocument,
+        WorkspaceDocument,
+        WorkspaceFormDocument,
+        WorkspaceUserInvitesDocument,
+        WorkspaceUserDocument,
+        FormResponseDeletionRequest,
+        BlackListedRefreshTokens,
+        ResponderGroupFormDocument,
+        ResponderGroupMemberDocument,
+        ResponderGroupDocument,
+        FormSyncStateDocument,
+        SchedulerWorkerDocument,
+        SchedulerLeaseDocument,
+        CacheVersionDocument,
+    ]
+
+
 async def close_db(client: AsyncIOMotorClient):
     """
     Asynchronously closes the database connection.
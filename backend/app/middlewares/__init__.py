@@ -9,6 +9,8 @@ from starlette.responses import Response
 __all__ = ("include_middlewares",)
 
 from backend.app.middlewares.dynamic_cors_middleware import DynamicCORSMiddleware
+from backend.app.utils.request_cache import request_scope
+from backend.config import settings
 
 
 def include_middlewares(app: "FastAPI"):
@@ -37,3 +39,17 @@ def include_middlewares(app: "FastAPI"):
         response: Response = await call_next(request)
         logger.info(response.status_code)
         return response
+
+    @app.middleware("http")
+    async def request_cache(request: "Request", call_next):
+        """
+        Middleware scoping the memoized repository reads to the request.
+
+        In debug mode the number of Mongo commands issued by the request is
+        returned in the X-Mongo-Calls header.
+        """
+        with request_scope() as cache:
+            response: Response = await call_next(request)
+            if settings.DEBUG:
+                response.headers["X-Mongo-Calls"] = str(cache.mongo_calls)
+            return response
@@ -1,25 +1,19 @@
-import datetime
-
+from starlette.datastructures import Headers
 from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
 
-from backend.app.schemas.allowed_origin import AllowedOriginsDocument
-from common.utils.asyncio_run import asyncio_run
+from backend.app.services.allowed_origin_registry import allowed_origin_registry
 
 
 class DynamicCORSMiddleware(CORSMiddleware):
-    allowedOrigins = []
-    time = datetime.datetime.utcnow()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # The origin is resolved before the synchronous checks of the CORS
+        # middleware so that they are served from the in-memory registry
+        if scope["type"] == "http":
+            origin = Headers(scope=scope).get("origin")
+            if origin:
+                await allowed_origin_registry.resolve(origin)
+        await super().__call__(scope, receive, send)
 
     def is_allowed_origin(self, origin: str) -> bool:
-        if (
-            datetime.datetime.utcnow().timestamp()
-            < (self.time.timestamp() + float(60 * 60))
-            and origin in self.allowedOrigins
-        ):
-            return True
-        origins = asyncio_run(AllowedOriginsDocument.find().to_list())
-        all_origins = [o.origin for o in origins]
-        self.allowedOrigins = [*all_origins]
-        allow = origin in all_origins
-        self.time = datetime.datetime.utcnow()
-        return allow
+        return allowed_origin_registry.is_allowed(origin)
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class AuthorizationFacts(BaseModel):
+    """
+    Facts about a workspace document needed to authorize the requesting user,
+    joined with the document by `create_authorization_pipeline`.
+    """
+
+    # The form of the document is imported in the workspace
+    in_workspace: bool = False
+    # The user is an enabled member of the workspace
+    is_member: bool = False
+    workspace_disabled: bool = False
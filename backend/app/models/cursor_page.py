@@ -0,0 +1,25 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+from pydantic.generics import GenericModel
+
+T = TypeVar("T")
+
+
+class CursorParams(BaseModel):
+    """Model for the parameters of a keyset (cursor) paginated listing."""
+
+    # Opaque cursor returned by the previous page, the first page has none
+    cursor: Optional[str]
+    size: int = 50
+    # Counting requires a scan over all the matching documents so it is opt-in
+    include_total: bool = False
+
+
+class CursorPage(GenericModel, Generic[T]):
+    """Model for a page of a keyset (cursor) paginated listing."""
+
+    items: List[T]
+    size: int
+    next_cursor: Optional[str]
+    total: Optional[int]
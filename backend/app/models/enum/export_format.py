@@ -0,0 +1,6 @@
+import enum
+
+
+class ExportFormat(str, enum.Enum):
+    CSV: str = "csv"
+    NDJSON: str = "ndjson"
@@ -1,4 +1,40 @@
+import enum
+from typing import Any, Type
+
 from fastapi_camelcase import CamelModel
+from pydantic import Field
+
+
+class FilterOperator(str, enum.Enum):
+    # value
+    EXACT = "exact"
+    # value* matches the values starting with value
+    PREFIX = "prefix"
+    # min..max matches the values between the bounds, either can be left out
+    RANGE = "range"
+    # words matches the token lists containing all the words, the last one as a
+    # prefix
+    TOKENS = "tokens"
+
+
+def filter_field(
+    stored_name: str, *operators: FilterOperator, value_type: Type = str
+) -> Any:
+    """
+    Declares a filter of a query.
+
+    Args:
+        stored_name (str): The name of the filtered field in the documents.
+        *operators (FilterOperator): The operators the filter supports, the exact
+            match if none are given.
+        value_type (Type): The type the values are parsed into before matching.
+    """
+    return Field(
+        None,
+        stored_name=stored_name,
+        operators=tuple(operators) or (FilterOperator.EXACT,),
+        value_type=value_type,
+    )
 
 
 class BaseFilterQuery(CamelModel):
@@ -1,8 +1,19 @@
 from typing import Optional
 
-from backend.app.models.filter_queries.base_filter_query import BaseFilterQuery
+from backend.app.models.filter_queries.base_filter_query import (
+    BaseFilterQuery,
+    FilterOperator,
+    filter_field,
+)
 
 
 class FormResponseFilterQuery(BaseFilterQuery):
-    data_owner_identifier: Optional[str] = None
-    email: Optional[str] = None
+    data_owner_identifier: Optional[str] = filter_field(
+        "dataOwnerIdentifier", FilterOperator.EXACT, FilterOperator.PREFIX
+    )
+    # Identifier of the responders in the responders listing
+    email: Optional[str] = filter_field(
+        "email", FilterOperator.EXACT, FilterOperator.PREFIX
+    )
+    created_at: Optional[str] = filter_field("created_at", FilterOperator.RANGE)
+    answer: Optional[str] = filter_field("answer_tokens", FilterOperator.TOKENS)
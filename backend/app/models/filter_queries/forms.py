@@ -1,7 +1,13 @@
 from typing import Optional
 
-from backend.app.models.filter_queries.base_filter_query import BaseFilterQuery
+from backend.app.models.filter_queries.base_filter_query import (
+    BaseFilterQuery,
+    FilterOperator,
+    filter_field,
+)
 
 
 class FormsFilterQuery(BaseFilterQuery):
-    form_id: Optional[str]
+    form_id: Optional[str] = filter_field(
+        "form_id", FilterOperator.EXACT, FilterOperator.PREFIX
+    )
@@ -0,0 +1,19 @@
+import datetime as dt
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from common.models.standard_form import StandardForm
+
+
+class FormImportResult(BaseModel):
+    """Model for summarising a form import or a scheduled form sync."""
+
+    form: StandardForm
+    # Time taken in seconds by each bulk write sent for the responses
+    batch_timings: List[float] = []
+    # Latest updated/submitted time among the responses returned by the provider
+    latest_response_at: Optional[dt.datetime]
+    inserted_responses: int = 0
+    updated_responses: int = 0
+    unchanged_responses: int = 0
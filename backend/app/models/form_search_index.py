@@ -0,0 +1,32 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from backend.app.utils.search_tokens import edge_ngrams, tokenize
+
+# Words of the description beyond this are left out of the index
+MAX_INDEXED_WORDS = 200
+
+
+class FormSearchIndex(BaseModel):
+    """Search terms of a form kept on its workspace forms."""
+
+    # Prefixes of the words of the title and the description, matched by the search
+    tokens: List[str] = []
+    # Prefixes of the words of the title, ranked above the description matches
+    title_tokens: List[str] = []
+    # Whole words of the title and the description, ranked above prefix matches
+    words: List[str] = []
+
+    @classmethod
+    def from_form(
+        cls, title: Optional[str], description: Optional[str]
+    ) -> "FormSearchIndex":
+        title_words = tokenize(title)
+        words = list(dict.fromkeys(title_words + tokenize(description)))
+        words = words[:MAX_INDEXED_WORDS]
+        return cls(
+            tokens=edge_ngrams(words),
+            title_tokens=edge_ngrams(title_words),
+            words=words,
+        )
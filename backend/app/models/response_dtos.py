@@ -1,8 +1,13 @@
-from typing import Optional
+import datetime as dt
+from typing import List, Optional
 
+from beanie import PydanticObjectId
 from fastapi_camelcase import CamelModel
+from pydantic import Field
 
+from backend.app.models.enum.export_format import ExportFormat
 from backend.app.models.workspace import WorkspaceFormSettings
+from backend.app.schemas.export_job import ExportJobStatus
 from backend.app.schemas.standard_form_response import FormResponseDocument
 from common.models.standard_form import (
     StandardForm,
@@ -21,7 +26,22 @@ class StandardFormCamelModel(StandardForm, CamelModel):
 class StandardFormResponseCamelModel(FormResponseDocument, CamelModel):
     form_title: Optional[str]
     deletion_status: Optional[str]
+    content_hash: Optional[str] = Field(None, exclude=True)
+    answer_tokens: Optional[List[str]] = Field(None, exclude=True)
 
 
 class WorkspaceFormPatchResponse(CamelModel):
     settings: WorkspaceFormSettingsCamelModal
+
+
+class ExportJobResponse(CamelModel):
+    id: PydanticObjectId
+    status: ExportJobStatus
+    export_format: ExportFormat
+    exported_rows: int
+    total_rows: Optional[int]
+    # Percentage of the responses exported so far
+    progress: Optional[float]
+    error: Optional[str]
+    created_at: Optional[dt.datetime]
+    completed_at: Optional[dt.datetime]
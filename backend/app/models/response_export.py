@@ -0,0 +1,21 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from backend.app.models.enum.export_format import ExportFormat
+
+
+class ExportField(BaseModel):
+    id: str
+    title: Optional[str]
+
+
+class ResponseExportQuery(BaseModel):
+    """Responses exported and how they are encoded."""
+
+    export_format: ExportFormat
+    form_ids: List[str]
+    # Values of the response filters by their field names
+    filters: Dict[str, Any] = {}
+    # Answer columns in the order of the fields of the forms
+    fields: List[ExportField] = []
@@ -0,0 +1,33 @@
+import datetime as dt
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SchedulerBootstrapMetrics(BaseModel):
+    """Model for the progress of the startup scheduling of the forms."""
+
+    is_running: bool
+    total_forms: int
+    scheduled_forms: int
+    skipped_forms: int
+    started_at: Optional[dt.datetime]
+    finished_at: Optional[dt.datetime]
+
+
+class SchedulerBootstrapProgress(BaseModel):
+    """Model for tracking how far the startup scheduling of the forms has got."""
+
+    total_forms: int = 0
+    scheduled_forms: int = 0
+    # Forms whose importer could not be resolved from the auth service
+    skipped_forms: int = 0
+    started_at: Optional[dt.datetime]
+    finished_at: Optional[dt.datetime]
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self.started_at and not self.finished_at)
+
+    def metrics(self) -> SchedulerBootstrapMetrics:
+        return SchedulerBootstrapMetrics(is_running=self.is_running, **self.dict())
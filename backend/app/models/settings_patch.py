@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class SettingsPatchDto(BaseModel):
@@ -8,3 +8,5 @@ class SettingsPatchDto(BaseModel):
     customUrl: Optional[str]
     private: Optional[bool]
     responseDataOwnerField: Optional[str]
+    syncIntervalMinMinutes: Optional[int] = Field(None, ge=1)
+    syncIntervalMaxMinutes: Optional[int] = Field(None, ge=1)
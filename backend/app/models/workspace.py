@@ -37,6 +37,9 @@ class WorkspaceFormSettings(BaseModel):
     private: Optional[bool] = False
     response_data_owner_field: Optional[str]
     provider: Optional[str]
+    # Bounds of the adaptive sync interval, defaults to the schedular settings
+    sync_interval_min_minutes: Optional[int]
+    sync_interval_max_minutes: Optional[int]
 
 
 class WorkspaceResponseDto(WorkspaceRequestDto, CamelModel):
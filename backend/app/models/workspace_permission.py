@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from backend.app.models.enum.workspace_roles import WorkspaceRoles
+
+
+class WorkspacePermission(BaseModel):
+    """
+    Membership of a user in a workspace as needed by the access checks.
+
+    `roles` and `disabled` are None if the user isn't a member of the workspace.
+    """
+
+    roles: Optional[List[WorkspaceRoles]] = None
+    disabled: Optional[bool] = None
+    is_owner: bool = False
+    workspace_disabled: bool = False
+
+    @property
+    def is_member(self) -> bool:
+        return self.roles is not None
+
+    @property
+    def has_access(self) -> bool:
+        return self.is_member and not self.disabled
+
+    @property
+    def is_admin(self) -> bool:
+        return self.is_member and (WorkspaceRoles.ADMIN in self.roles or self.is_owner)
@@ -0,0 +1,168 @@
+import datetime as dt
+from typing import Optional
+
+from beanie import PydanticObjectId
+from pymongo import ReturnDocument
+
+from backend.app.schemas.export_job import (
+    ExportChunk,
+    ExportJobDocument,
+    ExportJobStatus,
+)
+
+
+class ExportJobRepository:
+    async def create(self, export_job: ExportJobDocument) -> ExportJobDocument:
+        return await export_job.save()
+
+    async def get(
+        self, workspace_id: PydanticObjectId, job_id: PydanticObjectId
+    ) -> Optional[ExportJobDocument]:
+        return await ExportJobDocument.find_one(
+            {"_id": job_id, "workspace_id": workspace_id}
+        )
+
+    async def claim_next(
+        self,
+        worker_id: str,
+        host: str,
+        now: dt.datetime,
+        locked_until: dt.datetime,
+        max_attempts: int,
+    ) -> Optional[ExportJobDocument]:
+        """
+        Locks the oldest pending export, or running export whose worker stopped
+        renewing its lock, for the worker. The exports stored on another host are
+        left to its workers.
+        """
+        export_job = await ExportJobDocument.get_motor_collection().find_one_and_update(
+            {
+                "$or": [
+                    {"status": ExportJobStatus.PENDING},
+                    {
+                        "status": ExportJobStatus.RUNNING,
+                        "locked_until": {"$lt": now},
+                    },
+                ],
+                "attempts": {"$lt": max_attempts},
+                "host": {"$in": [None, host]},
+            },
+            {
+                "$set": {
+                    "status": ExportJobStatus.RUNNING,
+                    "locked_by": worker_id,
+                    "locked_until": locked_until,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("_id", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return ExportJobDocument.parse_obj(export_job) if export_job else None
+
+    async def fail_exhausted(self, now: dt.datetime, max_attempts: int) -> int:
+        # Exports whose worker died on every attempt are never claimed again
+        result = await ExportJobDocument.get_motor_collection().update_many(
+            {
+                "status": ExportJobStatus.RUNNING,
+                "locked_until": {"$lt": now},
+                "attempts": {"$gte": max_attempts},
+            },
+            {
+                "$set": {
+                    "status": ExportJobStatus.FAILED,
+                    "error": "The export was interrupted too many times.",
+                    "locked_by": None,
+                }
+            },
+        )
+        return result.modified_count
+
+    async def set_upload_id(
+        self, job_id: PydanticObjectId, worker_id: str, upload_id: str
+    ) -> bool:
+        result = await ExportJobDocument.get_motor_collection().update_one(
+            {"_id": job_id, "locked_by": worker_id},
+            {"$set": {"upload_id": upload_id}},
+        )
+        return result.modified_count == 1
+
+    async def renew_lock(
+        self, job_id: PydanticObjectId, worker_id: str, locked_until: dt.datetime
+    ) -> bool:
+        result = await ExportJobDocument.get_motor_collection().update_one(
+            {"_id": job_id, "locked_by": worker_id},
+            {"$set": {"locked_until": locked_until}},
+        )
+        return result.matched_count == 1
+
+    async def save_chunk(
+        self,
+        job_id: PydanticObjectId,
+        worker_id: str,
+        chunk: ExportChunk,
+        locked_until: dt.datetime,
+    ) -> bool:
+        """
+        Records a written chunk and renews the lock of the worker.
+
+        Returns:
+            bool: False if the export was resumed by another worker in the
+                meantime, the worker must then stop.
+        """
+        result = await ExportJobDocument.get_motor_collection().update_one(
+            {
+                "_id": job_id,
+                "locked_by": worker_id,
+                "chunks.index": {"$ne": chunk.index},
+            },
+            {
+                "$push": {"chunks": chunk.dict()},
+                "$inc": {"exported_rows": chunk.rows},
+                "$set": {"locked_until": locked_until},
+            },
+        )
+        return result.modified_count == 1
+
+    async def complete(
+        self, job_id: PydanticObjectId, worker_id: str, completed_at: dt.datetime
+    ) -> bool:
+        result = await ExportJobDocument.get_motor_collection().update_one(
+            {"_id": job_id, "locked_by": worker_id},
+            {
+                "$set": {
+                    "status": ExportJobStatus.COMPLETED,
+                    "completed_at": completed_at,
+                    "locked_by": None,
+                    "locked_until": None,
+                }
+            },
+        )
+        return result.modified_count == 1
+
+    async def fail(self, job_id: PydanticObjectId, worker_id: str, error: str):
+        await ExportJobDocument.get_motor_collection().update_one(
+            {"_id": job_id, "locked_by": worker_id},
+            {
+                "$set": {
+                    "status": ExportJobStatus.FAILED,
+                    "error": error,
+                    "locked_by": None,
+                    "locked_until": None,
+                }
+            },
+        )
+
+    async def release(
+        self, job_id: PydanticObjectId, worker_id: str, refund_attempt: bool = True
+    ):
+        """
+        Lets any worker resume the export right away, e.g. on shutdown. The
+        attempt is only counted against the export if it failed.
+        """
+        update = {"$set": {"locked_by": None, "locked_until": dt.datetime.utcnow()}}
+        if refund_attempt:
+            update["$inc"] = {"attempts": -1}
+        await ExportJobDocument.get_motor_collection().update_one(
+            {"_id": job_id, "locked_by": worker_id}, update
+        )
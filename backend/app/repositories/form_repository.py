@@ -1,12 +1,22 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from beanie import PydanticObjectId
 from beanie.odm.queries.aggregation import AggregationQuery
+from beanie.odm.utils.dump import get_dict
+from pymongo import ReturnDocument, UpdateOne
 
 from backend.app.exceptions import HTTPException
 from backend.app.schemas.standard_form import FormDocument
+from backend.app.schemas.standard_form_response import (
+    FormResponseDeletionRequest,
+    FormResponseDocument,
+)
+from backend.app.schemas.workspace_form import WorkspaceFormDocument
 from backend.app.utils.aggregation_query_builder import create_filter_pipeline
 
+# Incremented concurrently by the imports and the deletion requests
+COUNTER_FIELDS = ("responses_count", "deletion_requests_count")
+
 
 class FormRepository:
     @staticmethod
@@ -38,46 +48,15 @@ class FormRepository:
         aggregation_pipeline.extend(create_filter_pipeline(sort=sort))
 
         if is_admin:
-            aggregation_pipeline.extend(
-                [
-                    {
-                        "$lookup": {
-                            "from": "form_responses",
-                            "localField": "form_id",
-                            "foreignField": "form_id",
-                            "as": "responses",
-                        }
-                    },
-                    {
-                        "$set": {
-                            "responses": {
-                                "$filter": {
-                                    "input": "$responses",
-                                    "as": "item",
-                                    "cond": {
-                                        "$ne": [{"$type": "$$item.answers"}, "missing"]
-                                    },
-                                }
-                            }
-                        }
-                    },
-                    {"$set": {"responses": {"$size": "$responses"}}},
-                    {
-                        "$lookup": {
-                            "from": "responses_deletion_requests",
-                            "localField": "form_id",
-                            "foreignField": "form_id",
-                            "as": "responses_deletion_requests",
-                        }
-                    },
-                    {
-                        "$set": {
-                            "deletion_requests": {
-                                "$size": "$responses_deletion_requests"
-                            }
-                        }
-                    },
-                ]
+            aggregation_pipeline.append(
+                {
+                    "$set": {
+                        "responses": {"$ifNull": ["$responses_count", 0]},
+                        "deletion_requests": {
+                            "$ifNull": ["$deletion_requests_count", 0]
+                        },
+                    }
+                }
             )
         forms = FormDocument.find({"form_id": {"$in": form_id_list}}).aggregate(
             aggregation_pipeline
@@ -85,34 +64,81 @@ class FormRepository:
         return forms
 
     async def search_form_in_workspace(
-        self, workspace_id: PydanticObjectId, form_ids: List[str], query: str
+        self, workspace_id: PydanticObjectId, terms: List[str], limit: int
     ):
+        """
+        Searches the public forms of the workspace through their search index.
+
+        Every term has to match the start of a word of the title or the
+        description. The forms are ranked by the terms matching their title, then
+        by the terms matching whole words.
+
+        Args:
+            workspace_id (PydanticObjectId): The workspace to search the forms in.
+            terms (List[str]): The normalized search terms.
+            limit (int): The maximum number of forms returned.
+        """
         return (
-            await FormDocument.find(
+            await WorkspaceFormDocument.find(
                 {
-                    "form_id": {"$in": form_ids},
-                    "$or": [
-                        {"title": {"$regex": query, "$options": "i"}},
-                        {"description": {"$regex": query, "$options": "i"}},
-                    ],
+                    "workspace_id": workspace_id,
+                    "search_index.tokens": {"$all": terms},
+                    "settings.private": False,
                 }
             )
             .aggregate(
                 [
+                    {
+                        "$set": {
+                            "search_score": {
+                                "$add": [
+                                    {
+                                        "$multiply": [
+                                            2,
+                                            {
+                                                "$size": {
+                                                    "$setIntersection": [
+                                                        terms,
+                                                        "$search_index.title_tokens",
+                                                    ]
+                                                }
+                                            },
+                                        ]
+                                    },
+                                    {
+                                        "$size": {
+                                            "$setIntersection": [
+                                                terms,
+                                                "$search_index.words",
+                                            ]
+                                        }
+                                    },
+                                ]
+                            }
+                        }
+                    },
+                    {"$sort": {"search_score": -1, "_id": 1}},
+                    {"$limit": limit},
                     {
                         "$lookup": {
-                            "from": "workspace_forms",
+                            "from": "forms",
                             "localField": "form_id",
                             "foreignField": "form_id",
-                            "as": "workspace_form",
+                            "as": "form",
                         }
                     },
-                    {"$unwind": "$workspace_form"},
-                    {"$match": {"workspace_form.workspace_id": workspace_id}},
+                    {"$unwind": "$form"},
                     {
-                        "$set": {
-                            "settings": "$workspace_form.settings",
-                            "imported_by": "$workspace_form.user_id",
+                        "$replaceRoot": {
+                            "newRoot": {
+                                "$mergeObjects": [
+                                    "$form",
+                                    {
+                                        "settings": "$settings",
+                                        "imported_by": "$user_id",
+                                    },
+                                ]
+                            }
                         }
                     },
                 ]
@@ -120,9 +146,120 @@ class FormRepository:
             .to_list()
         )
 
+    async def get_forms_fields(self, form_ids: List[str]) -> List[Dict]:
+        """Returns the ids, titles and fields of the forms in the order of the ids."""
+        forms = (
+            await FormDocument.get_motor_collection()
+            .find(
+                {"form_id": {"$in": form_ids}},
+                {"form_id": 1, "title": 1, "fields.id": 1, "fields.title": 1},
+            )
+            .to_list(length=None)
+        )
+        forms_by_id = {form["form_id"]: form for form in forms}
+        return [forms_by_id[form_id] for form_id in form_ids if form_id in forms_by_id]
+
+    async def get_search_fields(
+        self, form_ids: List[str]
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Returns the title and the description of the forms by their ids."""
+        forms = (
+            await FormDocument.get_motor_collection()
+            .find(
+                {"form_id": {"$in": form_ids}},
+                {"form_id": 1, "title": 1, "description": 1},
+            )
+            .to_list(length=None)
+        )
+        return {
+            form["form_id"]: (form.get("title"), form.get("description"))
+            for form in forms
+        }
+
     async def save_form(self, form: FormDocument):
         return await form.save()
 
+    async def update_form_content(self, form: FormDocument) -> FormDocument:
+        """Updates an existing form without overwriting its counters."""
+        form_data = get_dict(form, to_db=True)
+        for field in ("_id", *COUNTER_FIELDS):
+            form_data.pop(field, None)
+        updated_form = await FormDocument.get_motor_collection().find_one_and_update(
+            {"_id": form.id},
+            {"$set": form_data},
+            return_document=ReturnDocument.AFTER,
+        )
+        return FormDocument.parse_obj(updated_form) if updated_form else form
+
+    async def increment_counters(
+        self, form_id: str, responses: int = 0, deletion_requests: int = 0
+    ):
+        increments = {
+            field: value
+            for field, value in (
+                ("responses_count", responses),
+                ("deletion_requests_count", deletion_requests),
+            )
+            if value
+        }
+        if increments:
+            await FormDocument.get_motor_collection().update_one(
+                {"form_id": form_id}, {"$inc": increments}
+            )
+
+    async def reconcile_counters(self) -> int:
+        """
+        Recounts the responses and deletion requests of every form and fixes the
+        counters that drifted.
+
+        Returns:
+            int: The number of forms whose counters were fixed.
+        """
+        responses_counts = await self._count_by_form_id(
+            FormResponseDocument, {"answers": {"$exists": True}}
+        )
+        deletion_requests_counts = await self._count_by_form_id(
+            FormResponseDeletionRequest
+        )
+        forms = (
+            await FormDocument.get_motor_collection()
+            .find(
+                {},
+                {"form_id": 1, "responses_count": 1, "deletion_requests_count": 1},
+            )
+            .to_list(length=None)
+        )
+
+        operations = []
+        for form in forms:
+            counters = {
+                "responses_count": responses_counts.get(form["form_id"], 0),
+                "deletion_requests_count": deletion_requests_counts.get(
+                    form["form_id"], 0
+                ),
+            }
+            if any(form.get(field) != value for field, value in counters.items()):
+                operations.append(UpdateOne({"_id": form["_id"]}, {"$set": counters}))
+        if operations:
+            await FormDocument.get_motor_collection().bulk_write(
+                operations, ordered=False
+            )
+        return len(operations)
+
+    @staticmethod
+    async def _count_by_form_id(document_model, match_query=None) -> Dict[str, int]:
+        counts = (
+            await document_model.get_motor_collection()
+            .aggregate(
+                [
+                    {"$match": match_query or {}},
+                    {"$group": {"_id": "$form_id", "count": {"$sum": 1}}},
+                ]
+            )
+            .to_list(length=None)
+        )
+        return {count["_id"]: count["count"] for count in counts}
+
     async def delete_form(self, form_id: str):
         form = await FormDocument.find_one({"form_id": form_id})
         if not form:
@@ -1,8 +1,14 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import fastapi_pagination.ext.beanie
+from beanie import PydanticObjectId
+from beanie.odm.utils.dump import get_dict
 from fastapi_pagination import Page
+from pydantic import BaseModel, Field
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult
 
+from backend.app.models.cursor_page import CursorPage, CursorParams
 from backend.app.models.filter_queries.form_responses import FormResponseFilterQuery
 from backend.app.models.filter_queries.sort import SortRequest
 from backend.app.schemas.standard_form_response import (
@@ -10,12 +16,24 @@ from backend.app.schemas.standard_form_response import (
     FormResponseDeletionRequest,
     DeletionRequestStatus,
 )
-from backend.app.utils.aggregation_query_builder import create_filter_pipeline
+from backend.app.utils.aggregation_query_builder import (
+    create_authorization_pipeline,
+    create_filter_pipeline,
+)
+from backend.app.utils.filter_compiler import CompiledFilter, compile_filter
+from backend.app.utils.keyset_pagination import create_keyset_pipeline, encode_cursor
 from common.base.repo import BaseRepository
 from common.enums.form_provider import FormProvider
 from common.models.standard_form import StandardFormResponse
 from common.models.user import User
 
+# Fields of the listed responses that are joined from the other collections
+LOOKUP_FIELDS = ("form_title", "deletion_status")
+# Fields of the responses overwritten by the lookups of the deletion requests
+DELETION_REQUEST_LOOKUP_FIELDS = (*LOOKUP_FIELDS, "created_at", "updated_at")
+# Fields of the responders mapped to the fields of their responses
+RESPONDER_FIELDS = {"email": "dataOwnerIdentifier"}
+
 
 class FormResponseRepository(BaseRepository):
     @staticmethod
@@ -26,11 +44,116 @@ class FormResponseRepository(BaseRepository):
         filter_query: FormResponseFilterQuery = None,
         sort: SortRequest = None,
     ) -> Page[FormResponseDocument]:
+        compiled_filter = FormResponseRepository._compile_filter(
+            filter_query, request_for_deletion
+        )
+        find_query = FormResponseRepository._get_form_responses_query(
+            form_ids, request_for_deletion, extra_find_query
+        )
+        find_query.update(compiled_filter.base)
+        aggregate_query = FormResponseRepository._get_form_responses_lookups(
+            request_for_deletion
+        )
+        if compiled_filter.joined:
+            aggregate_query.append({"$match": compiled_filter.joined})
+        aggregate_query.extend(create_filter_pipeline(sort=sort))
+
+        form_responses_query = FormResponseDocument.find(find_query).aggregate(
+            aggregate_query
+        )
+        form_responses = await fastapi_pagination.ext.beanie.paginate(
+            form_responses_query
+        )
+        return form_responses
+
+    @staticmethod
+    async def get_form_responses_by_cursor(
+        form_ids,
+        request_for_deletion: bool,
+        cursor_params: CursorParams,
+        filter_query: FormResponseFilterQuery = None,
+        sort: SortRequest = None,
+    ) -> CursorPage[Dict[str, Any]]:
+        sort = sort if sort and sort.sort_by else SortRequest()
+        compiled_filter = FormResponseRepository._compile_filter(
+            filter_query, request_for_deletion
+        )
+        find_query = FormResponseRepository._get_form_responses_query(
+            form_ids, request_for_deletion
+        )
+        find_query.update(compiled_filter.base)
+        lookups = FormResponseRepository._get_form_responses_lookups(
+            request_for_deletion
+        )
+        filter_pipeline = (
+            [{"$match": compiled_filter.joined}] if compiled_filter.joined else []
+        )
+        keyset_pipeline = create_keyset_pipeline(
+            sort, cursor_params.cursor, cursor_params.size
+        )
+        # Paging before the lookups lets the sort use the indexes of the responses
+        # unless the sort or the filters depend on the joined fields
+        joins_first = (
+            request_for_deletion
+            or sort.sort_by in LOOKUP_FIELDS
+            or bool(compiled_filter.joined)
+        )
+        if joins_first:
+            aggregate_query = lookups + filter_pipeline + keyset_pipeline
+        else:
+            aggregate_query = keyset_pipeline + lookups
+
+        documents = (
+            await FormResponseDocument.find(find_query)
+            .aggregate(aggregate_query)
+            .to_list()
+        )
+        has_next_page = len(documents) > cursor_params.size
+        documents = documents[: cursor_params.size]
+
+        total = None
+        if cursor_params.include_total:
+            count_query = FormResponseDocument.find(find_query).aggregate(
+                (lookups if joins_first else [])
+                + filter_pipeline
+                + [{"$count": "total"}]
+            )
+            count_result = await count_query.to_list()
+            total = count_result[0]["total"] if count_result else 0
+
+        return CursorPage(
+            items=documents,
+            size=cursor_params.size,
+            next_cursor=encode_cursor(sort, documents[-1]) if has_next_page else None,
+            total=total,
+        )
+
+    @staticmethod
+    def _compile_filter(
+        filter_query: Optional[FormResponseFilterQuery], request_for_deletion: bool
+    ) -> CompiledFilter:
+        return compile_filter(
+            filter_query,
+            joined_fields=(
+                DELETION_REQUEST_LOOKUP_FIELDS
+                if request_for_deletion
+                else LOOKUP_FIELDS
+            ),
+        )
+
+    @staticmethod
+    def _get_form_responses_query(
+        form_ids, request_for_deletion: bool, extra_find_query: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
         find_query = {"form_id": {"$in": form_ids}}
         if not request_for_deletion:
             find_query["answers"] = {"$exists": True}
         if extra_find_query is not None:
             find_query.update(extra_find_query)
+        return find_query
+
+    @staticmethod
+    def _get_form_responses_lookups(request_for_deletion: bool) -> List[Dict[str, Any]]:
         aggregate_query = [
             {
                 "$lookup": {
@@ -42,6 +165,8 @@ class FormResponseRepository(BaseRepository):
             },
             {"$set": {"form_title": "$form.title"}},
             {"$unwind": "$form_title"},
+            # Only used by the answer filter
+            {"$unset": "answer_tokens"},
         ]
 
         if request_for_deletion:
@@ -65,18 +190,52 @@ class FormResponseRepository(BaseRepository):
                     },
                 ]
             )
+        return aggregate_query
 
-        aggregate_query.extend(
-            create_filter_pipeline(filter_object=filter_query, sort=sort)
-        )
+    async def get_response_with_authorization(
+        self, workspace_id: PydanticObjectId, response_id: str, user_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetches the response with its form, deletion status and the authorization
+        facts of the user in the workspace in a single aggregation.
 
-        form_responses_query = FormResponseDocument.find(find_query).aggregate(
-            aggregate_query
-        )
-        form_responses = await fastapi_pagination.ext.beanie.paginate(
-            form_responses_query
-        )
-        return form_responses
+        Returns:
+            Optional[Dict[str, Any]]: The response with `form`, `deletion_status`
+                and `authorization` fields or None if the response doesn't exist.
+        """
+        responses = await FormResponseDocument.aggregate(
+            [
+                {"$match": {"response_id": response_id}},
+                {"$limit": 1},
+                {
+                    "$lookup": {
+                        "from": "forms",
+                        "localField": "form_id",
+                        "foreignField": "form_id",
+                        "as": "form",
+                    }
+                },
+                {
+                    "$lookup": {
+                        "from": "responses_deletion_requests",
+                        "localField": "response_id",
+                        "foreignField": "response_id",
+                        "as": "deletion_request",
+                    }
+                },
+                {
+                    "$set": {
+                        "form": {"$arrayElemAt": ["$form", 0]},
+                        "deletion_status": {
+                            "$arrayElemAt": ["$deletion_request.status", 0]
+                        },
+                    }
+                },
+                {"$unset": ["deletion_request", "answer_tokens"]},
+                *create_authorization_pipeline(workspace_id, user_id),
+            ]
+        ).to_list()
+        return responses[0] if responses else None
 
     async def get_workspace_responders(
         self,
@@ -84,10 +243,20 @@ class FormResponseRepository(BaseRepository):
         filter_query: FormResponseFilterQuery = None,
         sort: SortRequest = None,
     ):
-        find_query = {"form_id": {"$in": form_ids}}
+        find_query = {
+            "form_id": {"$in": form_ids},
+            "dataOwnerIdentifier": {"$exists": True, "$ne": None},
+        }
+        # The responders are identified by the data owner identifier of their
+        # responses so their filters are matched on the responses
+        filter_conditions = [
+            {RESPONDER_FIELDS.get(name, name): condition}
+            for name, condition in compile_filter(filter_query).base.items()
+        ]
+        if filter_conditions:
+            find_query = {"$and": [find_query, *filter_conditions]}
 
         aggregate_query = [
-            {"$match": {"dataOwnerIdentifier": {"$exists": True, "$ne": None}}},
             {
                 "$group": {
                     "_id": "$dataOwnerIdentifier",
@@ -142,12 +311,6 @@ class FormResponseRepository(BaseRepository):
             {"$sort": {"email": 1}},
         ]
 
-        aggregate_query.extend(
-            create_filter_pipeline(
-                filter_object=filter_query, sort=sort, default_sort=False
-            )
-        )
-
         form_responses_query = FormResponseDocument.find(find_query).aggregate(
             aggregate_query
         )
@@ -163,12 +326,22 @@ class FormResponseRepository(BaseRepository):
         filter_query: FormResponseFilterQuery = None,
         sort: SortRequest = None,
         data_subjects: bool = None,
-    ) -> Page[StandardFormResponse]:
+        cursor_params: CursorParams = None,
+    ) -> Page[StandardFormResponse] | CursorPage[Dict[str, Any]]:
         if data_subjects:
             form_responses = await self.get_workspace_responders(
                 form_ids=form_ids, filter_query=filter_query, sort=sort
             )
 
+        elif cursor_params:
+            form_responses = await self.get_form_responses_by_cursor(
+                form_ids,
+                request_for_deletion,
+                cursor_params,
+                filter_query=filter_query,
+                sort=sort,
+            )
+
         else:
             form_responses = await self.get_form_responses(
                 form_ids,
@@ -223,6 +396,135 @@ class FormResponseRepository(BaseRepository):
         )
         return success_deletion_request[0]
 
+    class ResponseHashProjection(BaseModel):
+        id: PydanticObjectId = Field(alias="_id")
+        response_id: str
+        content_hash: Optional[str]
+        # False for the responses deleted on a deletion request
+        has_answers: bool = True
+
+        class Settings:
+            projection = {
+                "_id": 1,
+                "response_id": 1,
+                "content_hash": 1,
+                "has_answers": {"$ne": [{"$type": "$answers"}, "missing"]},
+            }
+
+    async def get_existing_response_hashes(
+        self, response_ids: List[str]
+    ) -> Dict[str, ResponseHashProjection]:
+        existing_responses = await FormResponseDocument.find(
+            {"response_id": {"$in": response_ids}},
+            projection_model=self.ResponseHashProjection,
+        ).to_list()
+        return {response.response_id: response for response in existing_responses}
+
+    async def count_responses_in_forms(
+        self, form_ids: List[str], match_query: Dict[str, Any] = None
+    ) -> int:
+        return await FormResponseDocument.get_motor_collection().count_documents(
+            {
+                "form_id": {"$in": form_ids},
+                "answers": {"$exists": True},
+                **(match_query or {}),
+            }
+        )
+
+    async def iter_response_batches(
+        self,
+        form_ids: List[str],
+        match_query: Dict[str, Any] = None,
+        after_id: PydanticObjectId = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterates over the responses of the forms in batches in _id order.
+
+        Every batch is fetched with its own query starting after the last _id of
+        the previous one, so only a batch is held in memory at a time and the
+        iteration can be resumed from any _id.
+
+        Args:
+            form_ids (List[str]): The forms of the responses.
+            match_query (Dict[str, Any], optional): Extra conditions on the
+                responses, e.g. the compiled filters.
+            after_id (PydanticObjectId, optional): The _id to start after.
+            batch_size (int): The number of responses per batch.
+        """
+        find_query = {
+            "form_id": {"$in": form_ids},
+            "answers": {"$exists": True},
+            **(match_query or {}),
+        }
+        while True:
+            if after_id:
+                find_query["_id"] = {"$gt": after_id}
+            batch = (
+                await FormResponseDocument.get_motor_collection()
+                .find(find_query, {"answer_tokens": 0, "content_hash": 0})
+                .sort("_id", 1)
+                .limit(batch_size)
+                .batch_size(batch_size)
+                .to_list(length=None)
+            )
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1]["_id"]
+
+    async def get_responses_without_tokens(
+        self, after_id: Optional[PydanticObjectId], limit: int
+    ) -> List[Dict[str, Any]]:
+        find_query = {
+            "answers": {"$exists": True},
+            "answer_tokens": {"$exists": False},
+        }
+        if after_id:
+            # Walks the _id index so every batch doesn't scan from the start
+            find_query["_id"] = {"$gt": after_id}
+        return (
+            await FormResponseDocument.get_motor_collection()
+            .find(find_query, {"answers": 1})
+            .sort("_id", 1)
+            .limit(limit)
+            .to_list(length=None)
+        )
+
+    async def set_answer_tokens(self, answer_tokens: Dict[PydanticObjectId, List[str]]):
+        await FormResponseDocument.get_motor_collection().bulk_write(
+            [
+                UpdateOne({"_id": response_id}, {"$set": {"answer_tokens": tokens}})
+                for response_id, tokens in answer_tokens.items()
+            ],
+            ordered=False,
+        )
+
+    async def bulk_upsert(
+        self,
+        responses: List[FormResponseDocument],
+        existing_response_ids: Dict[str, PydanticObjectId],
+    ) -> BulkWriteResult:
+        operations = []
+        for response in responses:
+            existing_id = existing_response_ids.get(response.response_id)
+            # Existing responses are matched on _id so the update never depends on
+            # a secondary index, new ones are upserted on their response_id
+            find_query = (
+                {"_id": existing_id}
+                if existing_id
+                else {"response_id": response.response_id}
+            )
+            operations.append(
+                UpdateOne(
+                    find_query, {"$set": get_dict(response, to_db=True)}, upsert=True
+                )
+            )
+        return await FormResponseDocument.get_motor_collection().bulk_write(
+            operations, ordered=False
+        )
+
     async def get(self, form_id: str, response_id: str) -> StandardFormResponse:
         pass
 
@@ -0,0 +1,62 @@
+import datetime as dt
+from typing import Dict, List
+
+from pymongo.errors import DuplicateKeyError
+
+from backend.app.schemas.form_sync_state import FormSyncStateDocument
+
+
+class FormSyncStateRepository:
+    async def get_or_create(self, form_id: str) -> FormSyncStateDocument:
+        sync_state = await FormSyncStateDocument.find_one({"form_id": form_id})
+        if not sync_state:
+            sync_state = FormSyncStateDocument(form_id=form_id)
+        return sync_state
+
+    async def get_interval_minutes(self, form_ids: List[str]) -> Dict[str, float]:
+        sync_states = await FormSyncStateDocument.find(
+            {"form_id": {"$in": form_ids}, "interval_minutes": {"$ne": None}}
+        ).to_list()
+        return {
+            sync_state.form_id: sync_state.interval_minutes
+            for sync_state in sync_states
+        }
+
+    async def set_interval_minutes(self, form_id: str, interval_minutes: float):
+        # Only the interval is set as the form can be synced concurrently
+        await FormSyncStateDocument.get_motor_collection().update_one(
+            {"form_id": form_id}, {"$set": {"interval_minutes": interval_minutes}}
+        )
+
+    async def save(self, sync_state: FormSyncStateDocument) -> FormSyncStateDocument:
+        return await sync_state.save()
+
+    async def delete_by_form_id(self, form_id: str):
+        return await FormSyncStateDocument.find({"form_id": form_id}).delete()
+
+    async def try_lock(
+        self, form_id: str, worker_id: str, now: dt.datetime, until: dt.datetime
+    ) -> bool:
+        # The upsert fails on the unique form_id when another worker holds the lock
+        try:
+            await FormSyncStateDocument.get_motor_collection().update_one(
+                {
+                    "form_id": form_id,
+                    "$or": [
+                        {"locked_until": None},
+                        {"locked_until": {"$lt": now}},
+                        {"locked_by": worker_id},
+                    ],
+                },
+                {"$set": {"locked_by": worker_id, "locked_until": until}},
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def unlock(self, form_id: str, worker_id: str):
+        await FormSyncStateDocument.get_motor_collection().update_one(
+            {"form_id": form_id, "locked_by": worker_id},
+            {"$set": {"locked_by": None, "locked_until": None}},
+        )
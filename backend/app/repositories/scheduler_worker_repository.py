@@ -0,0 +1,47 @@
+import datetime as dt
+from typing import List
+
+from pymongo.errors import DuplicateKeyError
+
+from backend.app.schemas.scheduler_worker import (
+    SchedulerLeaseDocument,
+    SchedulerWorkerDocument,
+)
+
+
+class SchedulerWorkerRepository:
+    async def heartbeat(self, worker_id: str, now: dt.datetime):
+        await SchedulerWorkerDocument.get_motor_collection().update_one(
+            {"worker_id": worker_id},
+            {"$set": {"heartbeat_at": now}},
+            upsert=True,
+        )
+
+    async def get_live_worker_ids(self, alive_since: dt.datetime) -> List[str]:
+        return await SchedulerWorkerDocument.get_motor_collection().distinct(
+            "worker_id", {"heartbeat_at": {"$gte": alive_since}}
+        )
+
+    async def remove_worker(self, worker_id: str):
+        await SchedulerWorkerDocument.find({"worker_id": worker_id}).delete()
+
+    async def try_acquire_lease(
+        self, name: str, holder: str, now: dt.datetime, expires_at: dt.datetime
+    ) -> bool:
+        # The upsert fails on the unique name when the lease is held by another
+        # worker and has not expired yet
+        try:
+            await SchedulerLeaseDocument.get_motor_collection().update_one(
+                {
+                    "name": name,
+                    "$or": [{"holder": holder}, {"expires_at": {"$lt": now}}],
+                },
+                {"$set": {"holder": holder, "expires_at": expires_at}},
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def release_lease(self, name: str, holder: str):
+        await SchedulerLeaseDocument.find({"name": name, "holder": holder}).delete()
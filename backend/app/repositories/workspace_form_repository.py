@@ -1,7 +1,8 @@
 from http import HTTPStatus
-from typing import Dict, Any
+from typing import Any, Dict, List
 
 from beanie import PydanticObjectId
+from pymongo import UpdateMany
 from pymongo.errors import (
     InvalidOperation,
     InvalidURI,
@@ -10,13 +11,16 @@ from pymongo.errors import (
 )
 
 from backend.app.exceptions import HTTPException
+from backend.app.models.form_search_index import FormSearchIndex
 from backend.app.models.workspace import WorkspaceFormSettings
 from backend.app.schemas.workspace_form import WorkspaceFormDocument
+from backend.app.utils.request_cache import invalidates, memoized_read
 from common.constants import MESSAGE_DATABASE_EXCEPTION, MESSAGE_NOT_FOUND
 from common.models.user import User
 
 
 class WorkspaceFormRepository:
+    @invalidates("workspace_forms")
     async def update(
         self, item_id: str, item: WorkspaceFormDocument
     ) -> WorkspaceFormDocument:
@@ -27,12 +31,14 @@ class WorkspaceFormRepository:
             raise HTTPException(HTTPStatus.NOT_FOUND, "Form not found in ")
         return await item.save()
 
+    @invalidates("workspace_forms")
     async def save_workspace_form(
         self,
         workspace_id: PydanticObjectId,
         form_id: str,
         user_id: str,
         workspace_form_settings: WorkspaceFormSettings,
+        search_index: FormSearchIndex = None,
     ):
         workspace_form = await WorkspaceFormDocument.find_one(
             {"workspace_id": workspace_id, "form_id": form_id, "user_id": user_id}
@@ -44,9 +50,37 @@ class WorkspaceFormRepository:
                 user_id=user_id,
             )
         workspace_form.settings = workspace_form_settings
+        if search_index:
+            workspace_form.search_index = search_index
         await workspace_form.save()
 
+    @invalidates("workspace_forms")
+    async def update_search_indexes(self, search_indexes: Dict[str, FormSearchIndex]):
+        """Sets the search index of the workspace forms of each form id."""
+        if not search_indexes:
+            return
+        await WorkspaceFormDocument.get_motor_collection().bulk_write(
+            [
+                UpdateMany(
+                    {"form_id": form_id},
+                    {"$set": {"search_index": search_index.dict()}},
+                )
+                for form_id, search_index in search_indexes.items()
+            ],
+            ordered=False,
+        )
+
+    async def get_form_ids_without_search_index(self, limit: int) -> List[str]:
+        workspace_forms = (
+            await WorkspaceFormDocument.get_motor_collection()
+            .find({"search_index": None}, {"form_id": 1})
+            .limit(limit)
+            .to_list(length=None)
+        )
+        return list(dict.fromkeys(form["form_id"] for form in workspace_forms))
+
     # TODO : Refactor this functions to include repo related only
+    @memoized_read("workspace_forms")
     async def get_workspace_form_in_workspace(
         self,
         workspace_id: PydanticObjectId,
@@ -73,6 +107,7 @@ class WorkspaceFormRepository:
                 content=MESSAGE_DATABASE_EXCEPTION,
             )
 
+    @memoized_read("workspace_forms")
     async def get_form_ids_in_workspace(
         self,
         workspace_id: PydanticObjectId,
@@ -130,6 +165,7 @@ class WorkspaceFormRepository:
                 content=MESSAGE_DATABASE_EXCEPTION,
             )
 
+    @memoized_read("workspace_forms")
     async def get_workspace_form_with_custom_slug(
         self, workspace_id: PydanticObjectId, custom_url: str
     ):
@@ -137,12 +173,36 @@ class WorkspaceFormRepository:
             {"workspace_id": workspace_id, "settings.custom_url": custom_url}
         )
 
+    @memoized_read("workspace_forms")
     async def get_workspace_ids_for_form_id(self, form_id):
         workspace_forms = await WorkspaceFormDocument.find(
             {"form_id": form_id}
         ).to_list()
         return [workspace_form.workspace_id for workspace_form in workspace_forms]
 
+    @memoized_read("workspace_forms")
+    async def get_workspace_forms_for_form_id(
+        self, form_id: str
+    ) -> List[WorkspaceFormDocument]:
+        return await WorkspaceFormDocument.find({"form_id": form_id}).to_list()
+
+    async def get_settings_for_form_ids(
+        self, form_ids: List[str]
+    ) -> Dict[str, List[WorkspaceFormSettings]]:
+        workspace_forms = (
+            await WorkspaceFormDocument.get_motor_collection()
+            .find({"form_id": {"$in": form_ids}}, {"form_id": 1, "settings": 1})
+            .to_list(length=None)
+        )
+        form_settings: Dict[str, List[WorkspaceFormSettings]] = {}
+        for workspace_form in workspace_forms:
+            if workspace_form.get("settings"):
+                form_settings.setdefault(workspace_form["form_id"], []).append(
+                    WorkspaceFormSettings(**workspace_form["settings"])
+                )
+        return form_settings
+
+    @invalidates("workspace_forms")
     async def delete_form_in_workspace(
         self, workspace_id: PydanticObjectId, form_id: str
     ):
@@ -168,6 +228,7 @@ class WorkspaceFormRepository:
                         content="Form has already been imported to another workspace",
                     )
 
+    @memoized_read("workspace_forms")
     async def get_form_ids_imported_by_user(
         self, workspace_id: PydanticObjectId, user_id: str
     ):
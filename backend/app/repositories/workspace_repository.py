@@ -5,6 +5,7 @@ from beanie import PydanticObjectId
 
 from backend.app.exceptions import HTTPException
 from backend.app.schemas.workspace import WorkspaceDocument
+from backend.app.utils.request_cache import invalidates, memoized_read
 from common.base.repo import BaseRepository, T, U
 from common.enums.form_provider import FormProvider
 
@@ -22,6 +23,7 @@ class WorkspaceRepository(BaseRepository):
     async def delete(self, item_id: str, provider: FormProvider):
         pass
 
+    @invalidates("workspaces")
     async def update(
         self, item_id: PydanticObjectId, item: WorkspaceDocument
     ) -> WorkspaceDocument:
@@ -31,6 +33,7 @@ class WorkspaceRepository(BaseRepository):
         else:
             raise HTTPException(HTTPStatus.NOT_FOUND, "Workspace not found")
 
+    @memoized_read("workspaces")
     async def get_workspace_by_id(
         self, workspace_id: PydanticObjectId
     ) -> WorkspaceDocument:
@@ -41,6 +44,7 @@ class WorkspaceRepository(BaseRepository):
             raise HTTPException(HTTPStatus.NOT_FOUND)
         return workspace
 
+    @memoized_read("workspaces")
     async def get_workspace_by_query(self, query: str):
         workspace = await WorkspaceDocument.find_one(
             {
@@ -64,12 +68,15 @@ class WorkspaceRepository(BaseRepository):
             raise HTTPException(HTTPStatus.NOT_FOUND)
         return workspace
 
+    @memoized_read("workspaces")
     async def get_user_workspaces(self, owner_id: str):
         return await WorkspaceDocument.find({"owner_id": owner_id}).to_list()
 
+    @memoized_read("workspaces")
     async def get_workspace_by_ids(self, workspace_ids: List[PydanticObjectId]):
         return await WorkspaceDocument.find({"_id": {"$in": workspace_ids}}).to_list()
 
+    @memoized_read("workspaces")
     async def get_default_workspace_by_owner_id(
         self, owner_id: str
     ) -> WorkspaceDocument:
@@ -1,49 +1,102 @@
 from http import HTTPStatus
+from typing import Optional
 
 from beanie import PydanticObjectId
 
 from backend.app.exceptions import HTTPException
-from backend.app.models.enum.workspace_roles import WorkspaceRoles
+from backend.app.models.workspace_permission import WorkspacePermission
 from backend.app.schemas.workspace import WorkspaceDocument
 from backend.app.schemas.workspace_user import WorkspaceUserDocument
+from backend.app.utils.ttl_cache import TTLCache
+from backend.config import settings
 from common.models.user import User
 
 
+# Permissions of the users in the workspaces keyed by (workspace_id, user_id).
+# Writes through this repository invalidate the entries of the worker, the TTL
+# bounds how long the other workers may use a stale permission.
+workspace_permission_cache = TTLCache(
+    ttl_seconds=settings.api_settings.WORKSPACE_PERMISSION_CACHE_SECONDS,
+    max_size=settings.api_settings.WORKSPACE_PERMISSION_CACHE_SIZE,
+)
+
+
+def invalidate_workspace_permissions(
+    workspace_id: PydanticObjectId, user_id: PydanticObjectId = None
+):
+    if user_id:
+        workspace_permission_cache.delete((str(workspace_id), str(user_id)))
+    else:
+        workspace_permission_cache.delete_where(lambda key: key[0] == str(workspace_id))
+
+
 class WorkspaceUserRepository:
+    async def get_workspace_permission(
+        self, workspace_id: PydanticObjectId, user_id: str
+    ) -> Optional[WorkspacePermission]:
+        """
+        Returns the permission of the user in the workspace or None if the
+        workspace doesn't exist.
+        """
+        cache_key = (str(workspace_id), str(user_id))
+        permission = workspace_permission_cache.get(cache_key)
+        if permission:
+            return permission
+        workspaces = await WorkspaceDocument.aggregate(
+            [
+                {"$match": {"_id": PydanticObjectId(workspace_id)}},
+                {
+                    "$lookup": {
+                        "from": WorkspaceUserDocument.get_settings().name,
+                        "pipeline": [
+                            {
+                                "$match": {
+                                    "workspace_id": PydanticObjectId(workspace_id),
+                                    "user_id": PydanticObjectId(user_id),
+                                }
+                            },
+                            {"$project": {"roles": 1, "disabled": 1}},
+                        ],
+                        "as": "workspace_users",
+                    }
+                },
+                {
+                    "$project": {
+                        "owner_id": 1,
+                        "disabled": 1,
+                        "workspace_user": {"$arrayElemAt": ["$workspace_users", 0]},
+                    }
+                },
+            ]
+        ).to_list()
+        if not workspaces:
+            return None
+        workspace = workspaces[0]
+        workspace_user = workspace.get("workspace_user")
+        permission = WorkspacePermission(
+            roles=workspace_user.get("roles", []) if workspace_user else None,
+            disabled=workspace_user.get("disabled", False) if workspace_user else None,
+            is_owner=workspace.get("owner_id") == str(user_id),
+            workspace_disabled=bool(workspace.get("disabled")),
+        )
+        workspace_permission_cache.set(cache_key, permission)
+        return permission
+
     async def has_user_access_in_workspace(
         self, workspace_id: PydanticObjectId, user: User
     ) -> bool:
         if not user or not workspace_id:
             return False
-        workspace_user = await WorkspaceUserDocument.find_one(
-            {
-                "workspace_id": PydanticObjectId(workspace_id),
-                "user_id": PydanticObjectId(user.id),
-            }
-        )
-        return True if workspace_user and not workspace_user.disabled else False
+        permission = await self.get_workspace_permission(workspace_id, user.id)
+        return True if permission and permission.has_access else False
 
     async def is_user_admin_in_workspace(
         self, workspace_id: PydanticObjectId, user: User
     ) -> bool:
         if not user or not workspace_id:
             return False
-        workspace_user = await WorkspaceUserDocument.find_one(
-            {
-                "workspace_id": PydanticObjectId(workspace_id),
-                "user_id": PydanticObjectId(user.id),
-            }
-        )
-        workspace = await WorkspaceDocument.get(workspace_id)
-        return (
-            True
-            if workspace_user
-            and (
-                WorkspaceRoles.ADMIN in workspace_user.roles
-                or workspace.owner_id == user.id
-            )
-            else False
-        )
+        permission = await self.get_workspace_permission(workspace_id, user.id)
+        return True if permission and permission.is_admin else False
 
     async def get_workspace_users(self, workspace_id: PydanticObjectId):
         return await WorkspaceUserDocument.find(
@@ -51,7 +104,11 @@ class WorkspaceUserRepository:
         ).to_list()
 
     async def save(self, workspace_user: WorkspaceUserDocument):
-        return await workspace_user.save()
+        workspace_user = await workspace_user.save()
+        invalidate_workspace_permissions(
+            workspace_user.workspace_id, workspace_user.user_id
+        )
+        return workspace_user
 
     async def disable_other_users_in_workspace(
         self, workspace_id: PydanticObjectId, user_id: PydanticObjectId
@@ -63,11 +120,14 @@ class WorkspaceUserRepository:
             if workspace_user.user_id != user_id:
                 workspace_user.disabled = True
                 await workspace_user.save()
+        invalidate_workspace_permissions(workspace_id)
 
     async def enable_all_user_in_workspace(self, workspace_id: PydanticObjectId):
-        return await WorkspaceUserDocument.find(
+        result = await WorkspaceUserDocument.find(
             {"workspace_id": workspace_id}
         ).update_many({"$set": {"disabled": False}})
+        invalidate_workspace_permissions(workspace_id)
+        return result
 
     async def delete(self, workspace_id, user_id):
         workspace_user = await WorkspaceUserDocument.find_one(
@@ -80,7 +140,9 @@ class WorkspaceUserRepository:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, content="Resource doesn't exist"
             )
-        return await WorkspaceUserDocument.delete(workspace_user)
+        result = await WorkspaceUserDocument.delete(workspace_user)
+        invalidate_workspace_permissions(workspace_id, user_id)
+        return result
 
     async def get_mine_workspaces(self, user_id: str):
         return await WorkspaceUserDocument.find(
@@ -0,0 +1,103 @@
+import asyncio
+import datetime as dt
+import os
+import socket
+import uuid
+from typing import Dict, Optional
+
+from beanie import PydanticObjectId
+from loguru import logger
+
+from backend.app.repositories.export_job_repository import ExportJobRepository
+from backend.app.schemas.export_job import ExportJobDocument
+from backend.app.services.export_job_service import ExportJobService
+from backend.config import settings
+
+
+class ExportJobRunner:
+    """
+    Runs the pending export jobs in the background of the worker.
+
+    The jobs are claimed with a lock in the database that the worker renews after
+    every chunk, so the jobs of a worker that died are resumed by another worker
+    once their lock expires, on the same host for the exports stored locally.
+    The jobs still running on shutdown are released to be resumed right away.
+    """
+
+    def __init__(
+        self,
+        export_job_repo: ExportJobRepository,
+        export_job_service: ExportJobService,
+    ):
+        self._export_job_repo = export_job_repo
+        self._export_job_service = export_job_service
+        self.host = socket.gethostname()
+        self.worker_id = f"{self.host}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._running: Dict[PydanticObjectId, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._task = asyncio.create_task(self._poll())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+        running = dict(self._running)
+        for task in running.values():
+            task.cancel()
+        await asyncio.gather(*running.values(), return_exceptions=True)
+        for job_id in running:
+            await self._export_job_repo.release(job_id, self.worker_id)
+
+    async def claim_jobs(self):
+        export_settings = settings.export_settings
+        now = dt.datetime.utcnow()
+        await self._export_job_repo.fail_exhausted(
+            now, export_settings.MAX_JOB_ATTEMPTS
+        )
+        while len(self._running) < export_settings.MAX_CONCURRENT_JOBS:
+            export_job = await self._export_job_repo.claim_next(
+                self.worker_id,
+                host=self.host,
+                now=now,
+                locked_until=now
+                + dt.timedelta(seconds=export_settings.JOB_LOCK_SECONDS),
+                max_attempts=export_settings.MAX_JOB_ATTEMPTS,
+            )
+            if not export_job:
+                return
+            logger.info(
+                f"Export worker {self.worker_id} claimed export {export_job.id}"
+                f" (attempt {export_job.attempts}, {len(export_job.chunks)} chunks"
+                f" written)."
+            )
+            task = asyncio.create_task(self._run(export_job))
+            self._running[export_job.id] = task
+            task.add_done_callback(
+                lambda _, job_id=export_job.id: self._running.pop(job_id, None)
+            )
+
+    async def _run(self, export_job: ExportJobDocument):
+        try:
+            await self._export_job_service.run_job(export_job, self.worker_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.opt(exception=e).error(f"Export {export_job.id} failed.")
+            if export_job.attempts >= settings.export_settings.MAX_JOB_ATTEMPTS:
+                await self._export_job_service.fail_job(
+                    export_job, self.worker_id, str(e) or type(e).__name__
+                )
+            else:
+                # Resumed from its last chunk on a later poll
+                await self._export_job_repo.release(
+                    export_job.id, self.worker_id, refund_attempt=False
+                )
+
+    async def _poll(self):
+        while True:
+            try:
+                await self.claim_jobs()
+            except Exception as e:
+                logger.opt(exception=e).error("Failed to claim the export jobs.")
+            await asyncio.sleep(settings.export_settings.JOBS_POLL_SECONDS)
@@ -1,10 +1,25 @@
-from typing import Any, Dict
+import datetime as dt
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
 
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
 
+from backend.app.core.base.plugin_base import BasePlugin
+from backend.app.core.plugin_client import FormPluginClient
+from backend.app.models.form_import_result import FormImportResult
+from backend.app.models.workspace import WorkspaceFormSettings
+from backend.app.repositories.form_sync_state_repository import (
+    FormSyncStateRepository,
+)
+from backend.app.repositories.workspace_form_repository import WorkspaceFormRepository
+from backend.app.schedulers.sync_executor import SyncExecutor, SyncPriority
+from backend.app.schedulers.worker_coordinator import WorkerCoordinator
+from backend.app.schemas.form_sync_state import FormSyncStateDocument
 from backend.app.services.form_import_service import FormImportService
 from backend.app.services.form_plugin_provider_service import FormPluginProviderService
-from backend.app.utils import AiohttpClient
+from backend.app.utils.dates import as_utc
+from backend.app.utils.upstream_client import get_plugin_upstream, upstream_clients
+from backend.config import settings
 from common.services.jwt_service import JwtService
 
 
@@ -12,37 +27,218 @@ class FormSchedular:
     def __init__(
         self,
         form_provider_service: FormPluginProviderService,
+        form_plugin_client: FormPluginClient,
         form_import_service: FormImportService,
         jwt_service: JwtService,
+        form_sync_state_repo: FormSyncStateRepository,
+        worker_coordinator: WorkerCoordinator,
+        workspace_form_repo: WorkspaceFormRepository,
+        schedular: AsyncIOScheduler,
+        sync_executor: SyncExecutor,
     ):
         self.form_provider_service = form_provider_service
+        self.form_plugin_client = form_plugin_client
         self.form_import_service = form_import_service
         self.jwt_service = jwt_service
+        self.form_sync_state_repo = form_sync_state_repo
+        self.worker_coordinator = worker_coordinator
+        self.workspace_form_repo = workspace_form_repo
+        self.schedular = schedular
+        self.sync_executor = sync_executor
 
     async def update_form(self, *, user, provider, form_id, response_data_owner):
+        if not await self._is_form_in_workspaces(provider, form_id):
+            return
+        if not self.worker_coordinator.enabled:
+            return await self._sync_form(
+                user=user,
+                provider=provider,
+                form_id=form_id,
+                response_data_owner=response_data_owner,
+            )
+
+        # Two workers can briefly own the same form while rebalancing so the sync
+        # is guarded with a lock to not fetch it twice from the provider
+        worker_id = self.worker_coordinator.worker_id
+        now = dt.datetime.utcnow()
+        lock_until = now + dt.timedelta(
+            seconds=settings.schedular_settings.SYNC_LOCK_SECONDS
+        )
+        if not await self.form_sync_state_repo.try_lock(
+            form_id, worker_id, now=now, until=lock_until
+        ):
+            logger.info(f"Form {form_id} is being synced by another worker.")
+            return
+        try:
+            await self._sync_form(
+                user=user,
+                provider=provider,
+                form_id=form_id,
+                response_data_owner=response_data_owner,
+            )
+        finally:
+            await self.form_sync_state_repo.unlock(form_id, worker_id)
+
+    async def _sync_form(self, *, user, provider, form_id, response_data_owner):
         logger.info(f"Job started for form {form_id} by schedular.")
         cookies = {"Authorization": self.jwt_service.encode(user)}
+        sync_state = await self.form_sync_state_repo.get_or_create(form_id)
+        sync_started_at = dt.datetime.utcnow()
+        is_full_sync = self._is_full_sync_due(sync_state, sync_started_at)
+        responses_since = None if is_full_sync else as_utc(sync_state.responses_since)
+        priority = (
+            SyncPriority.STALE
+            if self._is_stale(sync_state, sync_started_at)
+            else SyncPriority.ROUTINE
+        )
+        delta_params = (
+            {"responses_since": responses_since.isoformat()}
+            if responses_since
+            else None
+        )
         # TODO Make it do with proxy service after service and proxy router refactored
         raw_form = await self.perform_request(
             provider=provider,
             append_url=f"/{form_id}",
             method="GET",
             cookies=cookies,
+            params=delta_params,
+            priority=priority,
+            plugin_operation="get_form",
+            plugin_call=lambda plugin: plugin.get_form(
+                form_id, cookies=cookies, params=delta_params
+            ),
         )
+        # The form can be deleted while it is fetched from the provider
+        if not await self._is_form_in_workspaces(provider, form_id):
+            return
         # if the latest status of form is not closed then perform saving
         response_data = await self.perform_conversion_request(
-            provider=provider, raw_form=raw_form, cookies=cookies
+            provider=provider,
+            raw_form=raw_form,
+            cookies=cookies,
+            responses_since=responses_since,
+            priority=priority,
         )
-        standard_form = (
+        import_result = (
             await self.form_import_service.save_converted_form_and_responses(
-                response_data, response_data_owner
+                response_data, response_data_owner, responses_since=responses_since
             )
         )
-        if standard_form:
-            logger.info(f"Form {form_id} is updated successfully by schedular.")
+        if import_result:
+            if import_result.latest_response_at:
+                sync_state.responses_since = import_result.latest_response_at
+            if is_full_sync:
+                sync_state.last_full_sync_at = sync_started_at
+            sync_state.last_synced_at = sync_started_at
+            interval_minutes = await self._get_next_interval(
+                form_id, sync_state, import_result
+            )
+            if interval_minutes != sync_state.interval_minutes:
+                self._reschedule_form(provider, form_id, interval_minutes)
+                sync_state.interval_minutes = interval_minutes
+            await self.form_sync_state_repo.save(sync_state)
+            logger.info(
+                f"Form {form_id} is updated successfully by schedular"
+                f" ({'full' if is_full_sync else 'delta'} sync, next in"
+                f" {interval_minutes:g} minutes)."
+            )
         else:
             logger.error(f"Error while updating form with id {form_id} by schedular")
 
+    @staticmethod
+    def _is_stale(sync_state: FormSyncStateDocument, now: dt.datetime) -> bool:
+        # Forms that missed their interval e.g. due to errors or downtime are
+        # synced ahead of the routine polls
+        if not sync_state.last_synced_at:
+            return True
+        interval_minutes = (
+            sync_state.interval_minutes or settings.schedular_settings.INTERVAL_MINUTES
+        )
+        return now - sync_state.last_synced_at > dt.timedelta(
+            minutes=2 * interval_minutes
+        )
+
+    async def _get_next_interval(
+        self,
+        form_id: str,
+        sync_state: FormSyncStateDocument,
+        import_result: FormImportResult,
+    ) -> float:
+        # Forms receiving responses are polled at the minimum interval while the
+        # interval of the idle ones backs off exponentially up to the maximum
+        interval_bounds = await self._get_interval_bounds(form_id)
+        if import_result.inserted_responses or import_result.updated_responses:
+            return interval_bounds[0]
+        interval = (sync_state.interval_minutes or interval_bounds[0]) * (
+            settings.schedular_settings.INTERVAL_BACKOFF_FACTOR
+        )
+        return clamp_interval(interval, interval_bounds)
+
+    async def apply_interval_bounds(self, provider: str, form_id: str):
+        """
+        Clamps the current interval of the form to its sync interval bounds, e.g.
+        after they were changed in its settings, instead of keeping the previous
+        interval until its next sync.
+        """
+        sync_state = await self.form_sync_state_repo.get_or_create(form_id)
+        interval_minutes = clamp_interval(
+            sync_state.interval_minutes or settings.schedular_settings.INTERVAL_MINUTES,
+            await self._get_interval_bounds(form_id),
+        )
+        if interval_minutes == sync_state.interval_minutes:
+            return
+        if sync_state.id:
+            await self.form_sync_state_repo.set_interval_minutes(
+                form_id, interval_minutes
+            )
+        # In the distributed mode the job of a form owned by another worker is
+        # adjusted on its next sync
+        self._reschedule_form(provider, form_id, interval_minutes)
+
+    async def _get_interval_bounds(self, form_id: str) -> Tuple[float, float]:
+        workspace_forms = (
+            await self.workspace_form_repo.get_workspace_forms_for_form_id(form_id)
+        )
+        return get_interval_bounds(
+            workspace_form.settings
+            for workspace_form in workspace_forms
+            if workspace_form.settings
+        )
+
+    async def _is_form_in_workspaces(self, provider: str, form_id: str) -> bool:
+        # In the distributed mode the form is deleted on the worker handling the
+        # request while its job lives on the worker owning the form, which drops
+        # the job here instead of importing the deleted form again
+        if await self.workspace_form_repo.get_workspace_forms_for_form_id(form_id):
+            return True
+        logger.info(f"Form {form_id} was deleted, removing its sync job.")
+        job_id = f"{provider}_{form_id}"
+        if self.schedular.get_job(job_id):
+            self.schedular.remove_job(job_id)
+        return False
+
+    def _reschedule_form(self, provider: str, form_id: str, interval_minutes: float):
+        job_id = f"{provider}_{form_id}"
+        if self.schedular.get_job(job_id):
+            self.schedular.reschedule_job(
+                job_id, trigger="interval", minutes=interval_minutes
+            )
+
+    async def remove_sync_state(self, form_id: str):
+        await self.form_sync_state_repo.delete_by_form_id(form_id)
+
+    @staticmethod
+    def _is_full_sync_due(sync_state: FormSyncStateDocument, now: dt.datetime):
+        # Deletion requests can only be reconciled against the full list of
+        # responses so a full sync is still performed periodically
+        if not sync_state.responses_since or not sync_state.last_full_sync_at:
+            return True
+        full_sync_interval = dt.timedelta(
+            minutes=settings.schedular_settings.FULL_SYNC_INTERVAL_MINUTES
+        )
+        return now - sync_state.last_full_sync_at >= full_sync_interval
+
     async def perform_conversion_request(
         self,
         *,
@@ -50,14 +246,24 @@ class FormSchedular:
         raw_form: Dict[str, Any],
         convert_responses: bool = True,
         cookies: Dict = None,
+        responses_since: dt.datetime = None,
+        priority: SyncPriority = SyncPriority.ROUTINE,
     ):
+        params = {"convert_responses": str(convert_responses)}
+        if responses_since:
+            params["responses_since"] = responses_since.isoformat()
         return await self.perform_request(
             provider=provider,
             append_url="/convert/standard_form",
             method="POST",
             cookies=cookies,
             json=raw_form,
-            params={"convert_responses": str(convert_responses)},
+            params=params,
+            priority=priority,
+            plugin_operation="convert_form",
+            plugin_call=lambda plugin: plugin.convert_form(
+                raw_form, cookies=cookies, params=params
+            ),
         )
 
     async def perform_request(
@@ -69,16 +275,63 @@ class FormSchedular:
         cookies: Dict,
         params: Dict = None,
         json: Dict = None,
+        priority: SyncPriority = SyncPriority.ROUTINE,
+        plugin_operation: str = None,
+        plugin_call: Callable[[BasePlugin], Awaitable[Any]] = None,
     ):
+        """
+        Performs the request to the plugin of the provider, with `plugin_call` if
+        its plugin is loaded in the worker and defines `plugin_operation`.
+        """
         provider_url = await self.form_provider_service.get_provider_url(provider)
-        # TODO Perform request from containers http client
-        response = await AiohttpClient.get_aiohttp_client().request(
-            method=method,
-            url=f"{provider_url}/{provider}/forms{append_url}",
-            params=params,
-            cookies=cookies,
-            json=json,
-            timeout=60,
-        )
-        data = await response.json()
-        return data
+
+        async def send_request():
+            response = await upstream_clients.get(
+                get_plugin_upstream(provider)
+            ).request(
+                method,
+                f"{provider_url}/{provider}/forms{append_url}",
+                params=params,
+                cookies=cookies,
+                json=json,
+                timeout=60,
+            )
+            return response.json()
+
+        async with self.sync_executor.slot(provider, priority):
+            if not plugin_call:
+                return await send_request()
+            return await self.form_plugin_client.run(
+                provider, plugin_operation, plugin_call, send_request
+            )
+
+
+def get_interval_bounds(
+    form_settings: Iterable[WorkspaceFormSettings],
+) -> Tuple[float, float]:
+    """Returns the minimum and maximum sync intervals of a form by its settings."""
+    schedular_settings = settings.schedular_settings
+    form_settings = list(form_settings)
+    # A form shared between workspaces follows the most frequent of their bounds
+    min_interval = min(
+        (
+            form_setting.sync_interval_min_minutes
+            for form_setting in form_settings
+            if form_setting.sync_interval_min_minutes
+        ),
+        default=schedular_settings.INTERVAL_MINUTES,
+    )
+    max_interval = min(
+        (
+            form_setting.sync_interval_max_minutes
+            for form_setting in form_settings
+            if form_setting.sync_interval_max_minutes
+        ),
+        default=schedular_settings.MAX_INTERVAL_MINUTES,
+    )
+    return min_interval, max(min_interval, max_interval)
+
+
+def clamp_interval(interval: float, interval_bounds: Tuple[float, float]) -> float:
+    min_interval, max_interval = interval_bounds
+    return max(min_interval, min(interval, max_interval))
@@ -0,0 +1,201 @@
+import asyncio
+import contextlib
+import enum
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from backend.config import settings
+
+
+class SyncPriority(enum.IntEnum):
+    MANUAL = 0
+    STALE = 1
+    ROUTINE = 2
+
+
+class ProviderThrottleMetrics(BaseModel):
+    requests: int = 0
+    throttled_requests: int = 0
+    throttled_seconds: float = 0
+
+
+class SyncExecutorMetrics(BaseModel):
+    """Model for the metrics of the requests sent to the form provider plugins."""
+
+    max_concurrency: int
+    active: int
+    queue_depth: int
+    queue_depth_by_priority: Dict[str, int]
+    total_requests: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    providers: Dict[str, ProviderThrottleMetrics]
+
+
+class TokenBucket:
+    """
+    Rate limit of the requests to a provider. Requests waiting for a token are
+    served by their priority and then in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def acquire(self, priority: SyncPriority = SyncPriority.ROUTINE) -> float:
+        """
+        Waits until a token is available and takes it.
+
+        Returns:
+            float: The time in seconds spent waiting for the token.
+        """
+        self._refill()
+        if self._tokens >= 1 and not self._waiters:
+            self._tokens -= 1
+            return 0
+        started_at = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        self._schedule_wakeup()
+        try:
+            # The token is handed over by the wakeup, the cancelled waiters are
+            # skipped by it
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._tokens += 1
+                self._schedule_wakeup()
+            raise
+        return time.monotonic() - started_at
+
+    def _schedule_wakeup(self):
+        if self._timer or not self._waiters:
+            return
+        self._refill()
+        self._timer = asyncio.get_running_loop().call_later(
+            max(0.0, (1 - self._tokens) / self.rate), self._wakeup
+        )
+
+    def _wakeup(self):
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._tokens -= 1
+                waiter.set_result(None)
+        self._schedule_wakeup()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+
+class SyncExecutor:
+    """
+    Runs the requests to the form provider plugins with a global concurrency limit
+    and a token bucket per provider. Requests waiting for a free slot are served
+    by their priority and then in arrival order.
+    """
+
+    def __init__(self):
+        self.max_concurrency = settings.schedular_settings.MAX_CONCURRENT_SYNCS
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._total_requests = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._provider_metrics: Dict[str, ProviderThrottleMetrics] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, provider: str, priority: SyncPriority = SyncPriority.ROUTINE):
+        # The provider token is taken before the slot so a throttled provider
+        # doesn't hold the slots needed by the other providers
+        provider_metrics = self._provider_metrics.setdefault(
+            provider, ProviderThrottleMetrics()
+        )
+        provider_metrics.requests += 1
+        throttled_seconds = await self._get_bucket(provider).acquire(priority)
+        if throttled_seconds:
+            provider_metrics.throttled_requests += 1
+            provider_metrics.throttled_seconds += throttled_seconds
+
+        queued_at = time.monotonic()
+        await self._acquire(priority)
+        try:
+            wait_seconds = time.monotonic() - queued_at
+            self._total_requests += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+            yield
+        finally:
+            self._release()
+
+    def metrics(self) -> SyncExecutorMetrics:
+        queue_depth_by_priority = {priority.name: 0 for priority in SyncPriority}
+        for priority, _, _ in self._waiters:
+            queue_depth_by_priority[SyncPriority(priority).name] += 1
+        return SyncExecutorMetrics(
+            max_concurrency=self.max_concurrency,
+            active=self._active,
+            queue_depth=sum(queue_depth_by_priority.values()),
+            queue_depth_by_priority=queue_depth_by_priority,
+            total_requests=self._total_requests,
+            total_wait_seconds=self._total_wait_seconds,
+            max_wait_seconds=self._max_wait_seconds,
+            providers=self._provider_metrics,
+        )
+
+    async def _acquire(self, priority: SyncPriority):
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        try:
+            # The slot is handed over by the releasing request without decrementing
+            # the active count
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            else:
+                self._waiters = [
+                    entry for entry in self._waiters if entry[2] is not waiter
+                ]
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self):
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            # A cancelled waiter stays queued until its task removes it
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _get_bucket(self, provider: str) -> TokenBucket:
+        if provider not in self._buckets:
+            schedular_settings = settings.schedular_settings
+            self._buckets[provider] = TokenBucket(
+                rate=schedular_settings.PROVIDER_RATE_LIMITS.get(
+                    provider, schedular_settings.PROVIDER_REQUESTS_PER_SECOND
+                ),
+                capacity=schedular_settings.PROVIDER_BURST,
+            )
+        return self._buckets[provider]
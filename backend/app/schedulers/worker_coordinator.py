@@ -0,0 +1,94 @@
+import datetime as dt
+import hashlib
+import os
+import socket
+import uuid
+from typing import List, Tuple
+
+from loguru import logger
+
+from backend.app.repositories.scheduler_worker_repository import (
+    SchedulerWorkerRepository,
+)
+from backend.config import settings
+
+LEADER_LEASE = "scheduler_leader"
+
+
+class WorkerCoordinator:
+    """
+    Coordinates the form sync schedulers running in different workers.
+
+    Every worker sends a heartbeat to the database and the forms are partitioned
+    between the live workers with rendezvous hashing of their form_id, so only the
+    forms of a dead or new worker move on rebalancing. A single worker holds the
+    leader lease and runs the maintenance jobs.
+
+    When the distributed mode is disabled the worker owns every form and is
+    always the leader.
+    """
+
+    def __init__(self, scheduler_worker_repo: SchedulerWorkerRepository):
+        self._scheduler_worker_repo = scheduler_worker_repo
+        self.enabled = settings.schedular_settings.DISTRIBUTED
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.live_worker_ids: List[str] = [self.worker_id]
+        self.is_leader = not self.enabled
+
+    def owns_form(self, form_id: str) -> bool:
+        if not self.enabled:
+            return True
+        return self.worker_id == max(
+            self.live_worker_ids,
+            key=lambda worker_id: _rendezvous_score(worker_id, form_id),
+        )
+
+    async def refresh(self) -> Tuple[bool, bool]:
+        """
+        Sends the heartbeat of the worker and renews the leader lease.
+
+        Returns:
+            Tuple[bool, bool]: Whether the live workers and whether the leadership
+                of this worker changed since the last refresh.
+        """
+        schedular_settings = settings.schedular_settings
+        now = dt.datetime.utcnow()
+        await self._scheduler_worker_repo.heartbeat(self.worker_id, now)
+        live_worker_ids = sorted(
+            await self._scheduler_worker_repo.get_live_worker_ids(
+                now - dt.timedelta(seconds=schedular_settings.WORKER_TIMEOUT_SECONDS)
+            )
+        )
+        is_leader = await self._scheduler_worker_repo.try_acquire_lease(
+            LEADER_LEASE,
+            self.worker_id,
+            now=now,
+            expires_at=now
+            + dt.timedelta(seconds=schedular_settings.WORKER_TIMEOUT_SECONDS),
+        )
+
+        membership_changed = live_worker_ids != self.live_worker_ids
+        leadership_changed = is_leader != self.is_leader
+        if membership_changed:
+            logger.info(
+                f"Scheduler worker {self.worker_id} sees {len(live_worker_ids)}"
+                f" live workers."
+            )
+        if leadership_changed:
+            logger.info(
+                f"Scheduler worker {self.worker_id} "
+                + ("became the leader." if is_leader else "lost the leadership.")
+            )
+        self.live_worker_ids = live_worker_ids
+        self.is_leader = is_leader
+        return membership_changed, leadership_changed
+
+    async def leave(self):
+        await self._scheduler_worker_repo.release_lease(LEADER_LEASE, self.worker_id)
+        await self._scheduler_worker_repo.remove_worker(self.worker_id)
+        self.is_leader = False
+
+
+def _rendezvous_score(worker_id: str, form_id: str) -> int:
+    digest = hashlib.sha1(f"{worker_id}:{form_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
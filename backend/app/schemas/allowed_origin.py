@@ -1,5 +1,7 @@
 import datetime as dt
 
+from pymongo import IndexModel
+
 from common.configs.mongo_document import MongoDocument
 
 
@@ -22,6 +24,7 @@ class AllowedOriginsDocument(MongoDocument):
 
     class Settings:
         name = "allowed_origins"
+        indexes = [IndexModel("origin")]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
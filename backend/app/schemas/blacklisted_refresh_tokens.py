@@ -1,14 +1,21 @@
 import datetime as dt
+from typing import Optional
+
+from pymongo import IndexModel
 
 from common.configs.mongo_document import MongoDocument
 
 
 class BlackListedRefreshTokens(MongoDocument):
     token: str
+    # Key of the token in the in-memory blacklist i.e. its jti, missing for the
+    # tokens blacklisted before it was stored
+    jti: Optional[str]
     expiry: dt.datetime
 
     class Settings:
         name = "blacklisted_refresh_tokens"
+        indexes = [IndexModel("token"), IndexModel("jti")]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
@@ -0,0 +1,17 @@
+from pymongo import IndexModel
+
+from common.configs.mongo_document import MongoDocument
+
+
+class CacheVersionDocument(MongoDocument):
+    """
+    Version of data cached in-process by the workers, incremented when the data
+    changes so that the other workers reload their copy.
+    """
+
+    key: str
+    version: int = 0
+
+    class Settings:
+        name = "cache_versions"
+        indexes = [IndexModel("key", unique=True)]
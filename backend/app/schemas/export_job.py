@@ -0,0 +1,83 @@
+import datetime as dt
+import enum
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel
+from pymongo import IndexModel
+
+from backend.app.models.response_export import ResponseExportQuery
+from common.configs.mongo_document import MongoDocument
+
+
+class ExportJobStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportChunk(BaseModel):
+    """A compressed chunk of an export written to the storage."""
+
+    index: int
+    # Attempt of the export that wrote the chunk. The chunks are stored by their
+    # attempt so a worker that lost its lock cannot overwrite the recorded ones
+    attempt: int
+    rows: int
+    size: int
+    # _id of the last response of the chunk, the export resumes after it. None
+    # for a chunk with the header only
+    last_id: Optional[PydanticObjectId]
+    # ETag of the part of the multipart upload on S3
+    etag: Optional[str]
+
+
+class ExportJobDocument(MongoDocument):
+    """
+    ExportJobDocument is a subclass of MongoDocument. It keeps the state of an
+    export of the responses run in the background.
+
+    Attributes:
+        workspace_id (PydanticObjectId): The workspace of the exported responses.
+        user_id (str): The user who requested the export.
+        query (ResponseExportQuery): The exported responses and their format.
+        status (ExportJobStatus): The status of the export.
+        storage (str): The storage the chunks are written to, local or s3.
+        host (str, optional): The host storing a local export, which is the only
+            one running and serving it.
+        upload_id (str, optional): The multipart upload of the export on S3.
+        chunks (List[ExportChunk]): The chunks written so far, in order.
+        exported_rows (int): The number of responses written so far.
+        total_rows (int, optional): The number of responses to export.
+        locked_by (str, optional): The worker running the export.
+        locked_until (datetime, optional): The time after which the export can be
+            resumed by another worker.
+        attempts (int): The number of times the export was started or resumed.
+        error (str, optional): The reason the export failed.
+        completed_at (datetime, optional): The time the export completed.
+
+    Classes Attributes:
+        Settings:
+            name (str): The name of the collection in the database.
+    """
+
+    workspace_id: PydanticObjectId
+    user_id: str
+    query: ResponseExportQuery
+    status: ExportJobStatus = ExportJobStatus.PENDING
+    storage: str
+    host: Optional[str]
+    upload_id: Optional[str]
+    chunks: List[ExportChunk] = []
+    exported_rows: int = 0
+    total_rows: Optional[int]
+    locked_by: Optional[str]
+    locked_until: Optional[dt.datetime]
+    attempts: int = 0
+    error: Optional[str]
+    completed_at: Optional[dt.datetime]
+
+    class Settings:
+        name = "export_jobs"
+        indexes = [IndexModel([("status", 1), ("locked_until", 1)])]
@@ -1,5 +1,7 @@
 import datetime as dt
 
+from pymongo import IndexModel
+
 from backend.app.models.form_plugin_config import FormProviderConfigDto
 from common.configs.mongo_document import MongoDocument
 
@@ -7,6 +9,7 @@ from common.configs.mongo_document import MongoDocument
 class FormPluginConfigDocument(MongoDocument, FormProviderConfigDto):
     class Settings:
         name = "forms_plugin_configs"
+        indexes = [IndexModel("provider_name")]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
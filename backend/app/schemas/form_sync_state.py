@@ -0,0 +1,40 @@
+import datetime as dt
+from typing import Optional
+
+from beanie import Indexed
+
+from common.configs.mongo_document import MongoDocument
+
+
+class FormSyncStateDocument(MongoDocument):
+    """
+    FormSyncStateDocument is a subclass of MongoDocument. It keeps the state of
+    the scheduled synchronization of a form with its provider.
+
+    Attributes:
+        form_id (str): The ID of the form. This field is indexed and unique.
+        responses_since (datetime, optional): High-water mark of the synced
+            responses i.e. the latest updated/submitted time seen so far.
+        last_full_sync_at (datetime, optional): The last time all the responses
+            of the form were fetched and reconciled.
+        interval_minutes (float, optional): The current adaptive sync interval.
+        last_synced_at (datetime, optional): The last time the form was synced.
+        locked_by (str, optional): The worker currently syncing the form.
+        locked_until (datetime, optional): The time after which the lock can be
+            taken over by another worker.
+
+    Classes Attributes:
+        Settings:
+            name (str): The name of the collection in the database.
+    """
+
+    form_id: Indexed(str, unique=True)
+    responses_since: Optional[dt.datetime]
+    last_full_sync_at: Optional[dt.datetime]
+    interval_minutes: Optional[float]
+    last_synced_at: Optional[dt.datetime]
+    locked_by: Optional[str]
+    locked_until: Optional[dt.datetime]
+
+    class Settings:
+        name = "form_sync_states"
@@ -3,6 +3,7 @@ import enum
 from typing import Optional
 
 from beanie import PydanticObjectId
+from pymongo import IndexModel
 
 from common.configs.mongo_document import MongoDocument
 
@@ -14,6 +15,7 @@ class ResponderGroupDocument(MongoDocument):
 
     class Settings:
         name = "responder_group"
+        indexes = [IndexModel("workspace_id")]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
@@ -32,6 +34,7 @@ class ResponderGroupMemberDocument(MongoDocument):
 
     class Settings:
         name = "responder_group_member"
+        indexes = [IndexModel([("group_id", 1), ("identifier", 1)])]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
@@ -50,6 +53,10 @@ class ResponderGroupFormDocument(MongoDocument):
 
     class Settings:
         name = "responder_group_form"
+        indexes = [
+            IndexModel([("form_id", 1), ("group_id", 1)]),
+            IndexModel("group_id"),
+        ]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
@@ -0,0 +1,59 @@
+import datetime as dt
+
+from beanie import Indexed
+from pymongo import IndexModel
+
+from backend.config import settings
+from common.configs.mongo_document import MongoDocument
+
+
+class SchedulerWorkerDocument(MongoDocument):
+    """
+    SchedulerWorkerDocument is a subclass of MongoDocument. It represents a live
+    worker taking part in the distributed scheduling of the form syncs.
+
+    Attributes:
+        worker_id (str): The ID of the worker. This field is indexed and unique.
+        heartbeat_at (datetime): The last time the worker reported itself alive.
+
+    Classes Attributes:
+        Settings:
+            name (str): The name of the collection in the database.
+            indexes (list): Expires the workers that stopped sending heartbeats.
+    """
+
+    worker_id: Indexed(str, unique=True)
+    heartbeat_at: dt.datetime
+
+    class Settings:
+        name = "scheduler_workers"
+        indexes = [
+            IndexModel(
+                "heartbeat_at",
+                expireAfterSeconds=settings.schedular_settings.WORKER_TIMEOUT_SECONDS
+                * 10,
+            )
+        ]
+
+
+class SchedulerLeaseDocument(MongoDocument):
+    """
+    SchedulerLeaseDocument is a subclass of MongoDocument. It represents a lease
+    that can only be held by a single worker at a time e.g. the leadership.
+
+    Attributes:
+        name (str): The name of the lease. This field is indexed and unique.
+        holder (str): The ID of the worker holding the lease.
+        expires_at (datetime): The time after which the lease can be taken over.
+
+    Classes Attributes:
+        Settings:
+            name (str): The name of the collection in the database.
+    """
+
+    name: Indexed(str, unique=True)
+    holder: str
+    expires_at: dt.datetime
+
+    class Settings:
+        name = "scheduler_leases"
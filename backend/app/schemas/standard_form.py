@@ -1,12 +1,23 @@
 import datetime as dt
+from typing import Optional
+
+from pymongo import IndexModel
 
 from common.configs.mongo_document import MongoDocument
 from common.models.standard_form import StandardForm
 
 
 class FormDocument(MongoDocument, StandardForm):
+    # Hash of the form content used to skip no-op writes on re-sync
+    content_hash: Optional[str]
+    # Counters maintained by the import and the deletion requests so the forms
+    # can be listed without counting their responses
+    responses_count: int = 0
+    deletion_requests_count: int = 0
+
     class Settings:
         name = "forms"
+        indexes = [IndexModel("form_id")]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
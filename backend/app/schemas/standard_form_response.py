@@ -1,6 +1,6 @@
 import datetime as dt
 import enum
-from typing import Optional
+from typing import List, Optional
 
 from pymongo import IndexModel
 
@@ -9,8 +9,21 @@ from common.models.standard_form import StandardFormResponse
 
 
 class FormResponseDocument(MongoDocument, StandardFormResponse):
+    # Hash of the canonicalized answers used to skip no-op writes on re-sync
+    content_hash: Optional[str]
+    # Normalized words of the answers searched by the answer filter
+    answer_tokens: Optional[List[str]]
+
     class Settings:
         name = "form_responses"
+        indexes = [
+            IndexModel("form_id"),
+            IndexModel("response_id"),
+            IndexModel([("dataOwnerIdentifier", 1), ("form_id", 1)]),
+            IndexModel([("form_id", 1), ("answer_tokens", 1)]),
+            # Walked by the exports in _id order
+            IndexModel([("form_id", 1), ("_id", 1)]),
+        ]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
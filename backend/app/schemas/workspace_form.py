@@ -2,7 +2,9 @@ import datetime as dt
 from typing import Optional
 
 from beanie import PydanticObjectId
+from pymongo import IndexModel
 
+from backend.app.models.form_search_index import FormSearchIndex
 from backend.app.models.workspace import WorkspaceFormSettings
 from common.configs.mongo_document import MongoDocument
 
@@ -16,6 +18,7 @@ class WorkspaceFormDocument(MongoDocument):
         workspace_id (PydanticObjectId): The ID of the workspace.
         form_id (str): The ID of the form.
         settings (WorkspaceFormSettings): The settings for the form in the workspace.
+        search_index (FormSearchIndex): The search terms of the form.
 
     Classes Attributes:
         Collection:
@@ -23,15 +26,24 @@ class WorkspaceFormDocument(MongoDocument):
         Settings:
             name (str): The name of the settings for this document.
             bson_encoders (dict): A dictionary of bson encoders for specific data types.
+            indexes (List[IndexModel]): A list of index models for the collection.
     """
 
     workspace_id: PydanticObjectId
     form_id: str
     user_id: str
     settings: Optional[WorkspaceFormSettings]
+    search_index: Optional[FormSearchIndex]
 
     class Settings:
         name = "workspace_forms"
+        indexes = [
+            IndexModel([("workspace_id", 1), ("form_id", 1)]),
+            IndexModel([("workspace_id", 1), ("user_id", 1)]),
+            IndexModel([("workspace_id", 1), ("settings.custom_url", 1)]),
+            IndexModel("form_id"),
+            IndexModel([("workspace_id", 1), ("search_index.tokens", 1)]),
+        ]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
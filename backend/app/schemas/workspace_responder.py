@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict
 
 from beanie import PydanticObjectId
+from pymongo import IndexModel
 
 from backend.app.handlers.database import entity
 from common.configs.mongo_document import MongoDocument
@@ -13,6 +14,7 @@ class WorkspaceTags(MongoDocument):
 
     class Settings:
         name = "workspace_tags"
+        indexes = [IndexModel("workspace_id")]
 
 
 @entity
@@ -25,3 +27,4 @@ class WorkspaceResponderDocument(MongoDocument):
 
     class Settings:
         name = "workspace_responder"
+        indexes = [IndexModel([("workspace_id", 1), ("email", 1)])]
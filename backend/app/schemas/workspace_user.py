@@ -2,6 +2,7 @@ import datetime as dt
 from typing import List
 
 from beanie import PydanticObjectId
+from pymongo import IndexModel
 
 from backend.app.models.enum.workspace_roles import WorkspaceRoles
 from common.configs.mongo_document import MongoDocument
@@ -25,6 +26,7 @@ class WorkspaceUserDocument(MongoDocument):
             name (str): The name of the settings for this document.
             bson_encoders (dict): A dictionary of bson encoders for
                 specific data types.
+            indexes (List[IndexModel]): A list of index models for the collection.
     """
 
     workspace_id: PydanticObjectId
@@ -34,6 +36,10 @@ class WorkspaceUserDocument(MongoDocument):
 
     class Settings:
         name = "workspace_users"
+        indexes = [
+            IndexModel([("workspace_id", 1), ("user_id", 1)]),
+            IndexModel("user_id"),
+        ]
         bson_encoders = {
             dt.datetime: lambda o: dt.datetime.isoformat(o),
             dt.date: lambda o: dt.date.isoformat(o),
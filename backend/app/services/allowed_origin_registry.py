@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+
+from loguru import logger
+
+from backend.app.schemas.allowed_origin import AllowedOriginsDocument
+from backend.config import settings
+
+
+class AllowedOriginRegistry:
+    """
+    In-memory copy of the allowed CORS origins of the worker.
+
+    The origins are reloaded in the background every few minutes so checking an
+    origin is a set lookup. An origin missing from the set is looked up once in
+    the database and, if it isn't allowed either, remembered in a bounded
+    negative cache so that unknown origins don't hit the database on every
+    request.
+
+    The custom domains changed on this worker are applied immediately, the other
+    workers pick them up on their next reload or when the negative cache entry
+    expires.
+    """
+
+    def __init__(self):
+        self._origins: Set[str] = set()
+        self._rejected_origins: OrderedDict[str, float] = OrderedDict()
+        self._pending_lookups: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self.load()
+        self._task = asyncio.create_task(self._poll())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    async def load(self):
+        origins = (
+            await AllowedOriginsDocument.get_motor_collection()
+            .find({}, {"origin": 1})
+            .to_list(length=None)
+        )
+        self._origins = {origin["origin"] for origin in origins}
+        self._rejected_origins.clear()
+        logger.info(f"Loaded {len(self._origins)} allowed origins.")
+
+    def is_allowed(self, origin: str) -> bool:
+        return origin in self._origins
+
+    async def resolve(self, origin: str) -> bool:
+        """
+        Checks if the origin is allowed looking it up in the database if it is
+        neither in the allowed origins nor in the rejected ones.
+        """
+        if origin in self._origins:
+            return True
+        rejected_until = self._rejected_origins.get(origin)
+        if rejected_until and rejected_until > time.monotonic():
+            return False
+        # Concurrent requests from the same unknown origin share a single lookup
+        lookup = self._pending_lookups.get(origin)
+        if not lookup:
+            lookup = asyncio.create_task(self._lookup(origin))
+            self._pending_lookups[origin] = lookup
+            lookup.add_done_callback(lambda _: self._pending_lookups.pop(origin, None))
+        return await asyncio.shield(lookup)
+
+    def add(self, origin: str):
+        self._origins.add(origin)
+        self._rejected_origins.pop(origin, None)
+
+    def remove(self, origin: str):
+        self._origins.discard(origin)
+
+    async def _lookup(self, origin: str) -> bool:
+        allowed_origin = await AllowedOriginsDocument.find_one({"origin": origin})
+        if allowed_origin:
+            self.add(origin)
+            return True
+        self._reject(origin)
+        return False
+
+    def _reject(self, origin: str):
+        api_settings = settings.api_settings
+        self._rejected_origins[origin] = (
+            time.monotonic() + api_settings.CORS_NEGATIVE_CACHE_SECONDS
+        )
+        self._rejected_origins.move_to_end(origin)
+        while len(self._rejected_origins) > api_settings.CORS_NEGATIVE_CACHE_SIZE:
+            self._rejected_origins.popitem(last=False)
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(settings.api_settings.CORS_ORIGINS_REFRESH_SECONDS)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.opt(exception=e).error("Failed to reload the allowed origins.")
+
+
+allowed_origin_registry = AllowedOriginRegistry()
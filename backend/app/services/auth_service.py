@@ -8,11 +8,15 @@ from backend.app.exceptions import HTTPException
 from backend.app.services import workspace_service
 from backend.app.services.form_plugin_provider_service import FormPluginProviderService
 from backend.app.services.plugin_proxy_service import PluginProxyService
+from backend.app.utils.upstream_client import (
+    AUTH_UPSTREAM,
+    get_plugin_upstream,
+    upstream_clients,
+)
 from backend.config import settings
 from common.configs.crypto import Crypto
 from common.enums.roles import Roles
 from common.models.user import OAuthState, User, UserInfo, UserLoginWithOTP
-from common.services.http_client import HttpClient
 from common.services.jwt_service import JwtService
 
 crypto = Crypto(settings.auth_settings.AES_HEX_KEY)
@@ -21,25 +25,23 @@ crypto = Crypto(settings.auth_settings.AES_HEX_KEY)
 class AuthService:
     def __init__(
         self,
-        http_client: HttpClient,
         plugin_proxy_service: PluginProxyService,
         form_provider_service: FormPluginProviderService,
         jwt_service: JwtService,
     ):
-        self.http_client = http_client
         self.plugin_proxy_service = plugin_proxy_service
         self.form_provider_service = form_provider_service
         self.jwt_service = jwt_service
 
     async def get_user_status(self, user: User):
-        response_data = await self.http_client.get(
+        response_data = await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/auth/status",
             params={"user_id": user.id},
         )
         return {"user": response_data}
 
     async def validate_otp(self, login_details: UserLoginWithOTP):
-        response_data = await self.http_client.get(
+        response_data = await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/auth/otp/validate",
             params={"email": login_details.email, "otp_code": login_details.otp_code},
         )
@@ -59,9 +61,9 @@ class AuthService:
             oauth_state.email = user.sub
         state = crypto.encrypt(oauth_state.json())
         authorization_url = f"{provider_url}/{provider_name}/oauth/authorize"
-        response_data = await self.http_client.get(
-            authorization_url, params={"state": state}, timeout=60
-        )
+        response_data = await upstream_clients.get(
+            get_plugin_upstream(provider_name)
+        ).get_json(authorization_url, params={"state": state}, timeout=60)
         oauth_url = response_data.get("oauth_url")
         return oauth_url
 
@@ -74,12 +76,13 @@ class AuthService:
         response_data = await self.plugin_proxy_service.pass_request(
             request,
             provider_config.auth_callback_url,
+            provider=provider_name,
         )
         user_info = UserInfo(**response_data)
 
         jwt_token = self.jwt_service.encode(user_info)
 
-        response_data = await self.http_client.get(
+        response_data = await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.CALLBACK_URI, params={"jwt_token": jwt_token}
         )
         user = User(**response_data)
@@ -93,14 +96,14 @@ class AuthService:
     async def get_basic_auth_url(
         self, provider: str, client_referer_url: str, creator: bool = False
     ):
-        response_data = await self.http_client.get(
+        response_data = await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + f"/auth/{provider}/basic",
             params={"client_referer_url": client_referer_url, "creator": creator},
         )
         return response_data.get("auth_url")
 
     async def basic_auth_callback(self, provider: str, code: str, state: str):
-        response_data = await self.http_client.get(
+        response_data = await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + f"/auth/{provider}/basic/callback",
             params={"code": code, "state": state},
             timeout=120,
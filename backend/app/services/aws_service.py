@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+from typing import Dict, List
 
 import boto3
 from botocore.exceptions import ClientError
@@ -41,3 +43,46 @@ class AWSS3Service:
         wasabi_domain = "https://s3.eu-central-1.wasabisys.com"
         folder = f"/{bucket}/public/{current_time}_{key}"
         return f"{wasabi_domain}{folder}"
+
+    async def create_multipart_upload(self, bucket: str, key: str) -> str:
+        response = await asyncio.to_thread(
+            self._s3.meta.client.create_multipart_upload, Bucket=bucket, Key=key
+        )
+        return response["UploadId"]
+
+    async def upload_part(
+        self, bucket: str, key: str, upload_id: str, part_number: int, body: bytes
+    ) -> str:
+        response = await asyncio.to_thread(
+            self._s3.meta.client.upload_part,
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return response["ETag"]
+
+    async def complete_multipart_upload(
+        self, bucket: str, key: str, upload_id: str, parts: List[Dict]
+    ):
+        await asyncio.to_thread(
+            self._s3.meta.client.complete_multipart_upload,
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    async def abort_multipart_upload(self, bucket: str, key: str, upload_id: str):
+        await asyncio.to_thread(
+            self._s3.meta.client.abort_multipart_upload,
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+        )
+
+    def generate_presigned_url(self, bucket: str, key: str, expires_in: int) -> str:
+        return self._s3.meta.client.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expires_in
+        )
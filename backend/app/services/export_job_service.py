@@ -0,0 +1,380 @@
+import datetime as dt
+import os
+import re
+import socket
+import time
+import zlib
+from http import HTTPStatus
+from typing import Dict, Iterator, Optional, Tuple
+
+from beanie import PydanticObjectId
+from loguru import logger
+from starlette.responses import RedirectResponse, Response, StreamingResponse
+
+from backend.app.exceptions import HTTPException
+from backend.app.models.enum.export_format import ExportFormat
+from backend.app.models.filter_queries.form_responses import FormResponseFilterQuery
+from backend.app.models.response_dtos import ExportJobResponse
+from backend.app.repositories.export_job_repository import ExportJobRepository
+from backend.app.schemas.export_job import (
+    ExportChunk,
+    ExportJobDocument,
+    ExportJobStatus,
+)
+from backend.app.services.aws_service import AWSS3Service
+from backend.app.services.export_storage import (
+    LOCAL_STORAGE,
+    S3_STORAGE,
+    ExportStorage,
+    LocalExportStorage,
+    S3ExportStorage,
+    get_artifact_name,
+)
+from backend.app.services.response_export_service import ResponseExportService
+from backend.app.services.workspace_user_service import WorkspaceUserService
+from backend.app.utils.response_export import ResponseExportEncoder
+from backend.config import settings
+from common.models.user import User
+
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+READ_SIZE = 64 * 1024
+
+
+class ExportJobService:
+    """
+    Runs the exports of the responses in the background.
+
+    The responses are encoded with the streaming export a batch at a time and
+    compressed into chunks of at least `EXPORT_CHUNK_MIN_BYTES`. Every written
+    chunk is recorded with the _id of its last response, so an export
+    interrupted by a crash resumes after the last recorded chunk. The chunks are
+    written under the attempt of the worker, so a worker that lost the export
+    to another one cannot overwrite the chunks recorded by it.
+    """
+
+    def __init__(
+        self,
+        export_job_repo: ExportJobRepository,
+        response_export_service: ResponseExportService,
+        workspace_user_service: WorkspaceUserService,
+        aws_service: AWSS3Service,
+    ):
+        self._export_job_repo = export_job_repo
+        self._response_export_service = response_export_service
+        self._workspace_user_service = workspace_user_service
+        export_settings = settings.export_settings
+        self._storages: Dict[str, ExportStorage] = {
+            LOCAL_STORAGE: LocalExportStorage(export_settings.LOCAL_DIR),
+            S3_STORAGE: S3ExportStorage(
+                aws_service, export_settings.S3_BUCKET, export_settings.S3_PREFIX
+            ),
+        }
+
+    async def create_job(
+        self,
+        workspace_id: PydanticObjectId,
+        user: User,
+        export_format: ExportFormat,
+        form_id: str = None,
+        filter_query: FormResponseFilterQuery = None,
+    ) -> ExportJobResponse:
+        storage = settings.export_settings.STORAGE
+        if storage not in self._storages:
+            raise HTTPException(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                f"Unknown export storage {storage}.",
+            )
+        export_query = await self._response_export_service.create_export_query(
+            workspace_id, user, export_format, form_id, filter_query
+        )
+        export_job = await self._export_job_repo.create(
+            ExportJobDocument(
+                workspace_id=workspace_id,
+                user_id=user.id,
+                query=export_query,
+                storage=storage,
+                host=(
+                    socket.gethostname()
+                    if storage == LOCAL_STORAGE
+                    and not settings.export_settings.LOCAL_DIR_SHARED
+                    else None
+                ),
+                total_rows=await self._response_export_service.count_export_responses(
+                    export_query
+                ),
+            )
+        )
+        return _to_export_job_response(export_job)
+
+    async def get_job(
+        self, workspace_id: PydanticObjectId, job_id: PydanticObjectId, user: User
+    ) -> ExportJobResponse:
+        return _to_export_job_response(
+            await self._get_export_job(workspace_id, job_id, user)
+        )
+
+    async def download(
+        self,
+        workspace_id: PydanticObjectId,
+        job_id: PydanticObjectId,
+        user: User,
+        range_header: Optional[str] = None,
+    ) -> Response:
+        """
+        Redirects to a signed URL of the export on S3 or serves the file of the
+        export, honouring a single byte range.
+        """
+        export_job = await self._get_export_job(workspace_id, job_id, user)
+        if export_job.status != ExportJobStatus.COMPLETED:
+            raise HTTPException(HTTPStatus.CONFLICT, "The export is not completed.")
+        storage = self._storages[export_job.storage]
+        if isinstance(storage, S3ExportStorage):
+            return RedirectResponse(
+                storage.get_download_url(export_job),
+                status_code=HTTPStatus.TEMPORARY_REDIRECT,
+            )
+        if export_job.host and export_job.host != socket.gethostname():
+            raise HTTPException(
+                HTTPStatus.MISDIRECTED_REQUEST,
+                f"The export is stored on the host {export_job.host}.",
+            )
+        path = storage.get_artifact_path(export_job)
+        if not os.path.exists(path):
+            raise HTTPException(HTTPStatus.NOT_FOUND, "Export file not found.")
+        return _serve_file(path, get_artifact_name(export_job), range_header)
+
+    async def run_job(self, export_job: ExportJobDocument, worker_id: str):
+        """
+        Writes the remaining chunks of a claimed export and completes it.
+
+        Returns early if the lock of the worker is taken over by another worker.
+        """
+        storage = self._storages[export_job.storage]
+        if not export_job.upload_id:
+            upload_id = await storage.start(export_job)
+            if upload_id:
+                if not await self._export_job_repo.set_upload_id(
+                    export_job.id, worker_id, upload_id
+                ):
+                    return
+                export_job.upload_id = upload_id
+
+        query = export_job.query
+        after_id = next(
+            (chunk.last_id for chunk in reversed(export_job.chunks) if chunk.last_id),
+            None,
+        )
+        chunk_writer = _ChunkWriter(len(export_job.chunks), after_id)
+        if chunk_writer.index == 0:
+            chunk_writer.write(
+                ResponseExportEncoder(
+                    query.export_format, query.fields
+                ).encode_header(),
+                0,
+                None,
+            )
+        export_settings = settings.export_settings
+        # Filling a chunk can take longer than the lock with a selective filter
+        renew_seconds = export_settings.JOB_LOCK_SECONDS / 4
+        renewed_at = time.monotonic()
+        async for data, rows, last_id in self._response_export_service.iter_export_chunks(
+            query, after_id=after_id
+        ):
+            chunk_writer.write(data, rows, last_id)
+            if chunk_writer.size >= export_settings.CHUNK_MIN_BYTES:
+                if not await self._save_chunk(
+                    export_job, worker_id, storage, chunk_writer
+                ):
+                    return
+                renewed_at = time.monotonic()
+            elif time.monotonic() - renewed_at >= renew_seconds:
+                if not await self._renew_lock(export_job, worker_id):
+                    return
+                renewed_at = time.monotonic()
+        # An export without new responses since its last chunk has nothing left
+        if chunk_writer.rows or not export_job.chunks:
+            if not await self._save_chunk(export_job, worker_id, storage, chunk_writer):
+                return
+
+        # Assembling the artifact of a large export takes a while as well
+        if not await self._renew_lock(export_job, worker_id):
+            return
+        await storage.complete(export_job)
+        await self._export_job_repo.complete(
+            export_job.id, worker_id, dt.datetime.utcnow()
+        )
+        logger.info(
+            f"Completed export {export_job.id} of {export_job.exported_rows} responses"
+            f" in {len(export_job.chunks)} chunks."
+        )
+
+    async def fail_job(self, export_job: ExportJobDocument, worker_id: str, error: str):
+        try:
+            await self._storages[export_job.storage].abort(export_job)
+        except Exception as e:
+            logger.warning(f"Failed to clean up the export {export_job.id}: {e}")
+        await self._export_job_repo.fail(export_job.id, worker_id, error)
+
+    async def _renew_lock(self, export_job: ExportJobDocument, worker_id: str) -> bool:
+        renewed = await self._export_job_repo.renew_lock(
+            export_job.id,
+            worker_id,
+            locked_until=dt.datetime.utcnow()
+            + dt.timedelta(seconds=settings.export_settings.JOB_LOCK_SECONDS),
+        )
+        if not renewed:
+            logger.warning(
+                f"Export {export_job.id} was taken over, stopping worker {worker_id}."
+            )
+        return renewed
+
+    async def _save_chunk(
+        self,
+        export_job: ExportJobDocument,
+        worker_id: str,
+        storage: ExportStorage,
+        chunk_writer: "_ChunkWriter",
+    ) -> bool:
+        data = chunk_writer.flush()
+        chunk = ExportChunk(
+            index=chunk_writer.index,
+            attempt=export_job.attempts,
+            rows=chunk_writer.rows,
+            size=len(data),
+            last_id=chunk_writer.last_id,
+        )
+        chunk.etag = await storage.write_chunk(export_job, chunk, data)
+        saved = await self._export_job_repo.save_chunk(
+            export_job.id,
+            worker_id,
+            chunk,
+            locked_until=dt.datetime.utcnow()
+            + dt.timedelta(seconds=settings.export_settings.JOB_LOCK_SECONDS),
+        )
+        if not saved:
+            logger.warning(
+                f"Export {export_job.id} was taken over, stopping worker {worker_id}."
+            )
+            return False
+        export_job.chunks.append(chunk)
+        export_job.exported_rows += chunk.rows
+        chunk_writer.next()
+        return True
+
+    async def _get_export_job(
+        self, workspace_id: PydanticObjectId, job_id: PydanticObjectId, user: User
+    ) -> ExportJobDocument:
+        await self._workspace_user_service.check_user_has_access_in_workspace(
+            workspace_id, user
+        )
+        export_job = await self._export_job_repo.get(workspace_id, job_id)
+        if not export_job:
+            raise HTTPException(HTTPStatus.NOT_FOUND, "Export not found.")
+        return export_job
+
+
+class _ChunkWriter:
+    """Compresses the encoded responses of a chunk into a gzip member."""
+
+    def __init__(self, index: int, last_id: Optional[PydanticObjectId]):
+        self.index = index
+        self.last_id = last_id
+        self._reset()
+
+    @property
+    def size(self) -> int:
+        return sum(len(part) for part in self._parts)
+
+    def write(self, data: bytes, rows: int, last_id: Optional[PydanticObjectId]):
+        self._parts.append(self._compressor.compress(data))
+        self.rows += rows
+        self.last_id = last_id or self.last_id
+
+    def flush(self) -> bytes:
+        return b"".join(self._parts) + self._compressor.flush()
+
+    def next(self):
+        self.index += 1
+        self._reset()
+
+    def _reset(self):
+        # wbits of 31 writes a gzip header and trailer
+        self._compressor = zlib.compressobj(wbits=31)
+        self._parts = []
+        self.rows = 0
+
+
+def _to_export_job_response(export_job: ExportJobDocument) -> ExportJobResponse:
+    if export_job.status == ExportJobStatus.COMPLETED:
+        progress = 100.0
+    elif export_job.total_rows:
+        progress = round(
+            min(export_job.exported_rows / export_job.total_rows, 1) * 100, 1
+        )
+    else:
+        progress = None
+    return ExportJobResponse(
+        id=export_job.id,
+        status=export_job.status,
+        export_format=export_job.query.export_format,
+        exported_rows=export_job.exported_rows,
+        total_rows=export_job.total_rows,
+        progress=progress,
+        error=export_job.error,
+        created_at=export_job.created_at,
+        completed_at=export_job.completed_at,
+    )
+
+
+def _parse_range(range_header: str, file_size: int) -> Tuple[int, int]:
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match or not any(match.groups()):
+        raise HTTPException(
+            HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, "Invalid range."
+        )
+    start, end = match.groups()
+    if not start:
+        # Suffix range of the last bytes
+        start, end = max(file_size - int(end), 0), file_size - 1
+    else:
+        start, end = int(start), min(int(end), file_size - 1) if end else file_size - 1
+    if start > end or start >= file_size:
+        raise HTTPException(
+            HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, "Invalid range."
+        )
+    return start, end
+
+
+def _read_file(path: str, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            data = file.read(min(READ_SIZE, length))
+            if not data:
+                return
+            length -= len(data)
+            yield data
+
+
+def _serve_file(path: str, file_name: str, range_header: Optional[str]) -> Response:
+    file_size = os.path.getsize(path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{file_name}"',
+    }
+    if range_header:
+        start, end = _parse_range(range_header, file_size)
+        status_code = HTTPStatus.PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    else:
+        start, end = 0, file_size - 1
+        status_code = HTTPStatus.OK
+    length = end - start + 1
+    headers["Content-Length"] = str(length)
+    # Sync iterators are read in the thread pool by the streaming response
+    return StreamingResponse(
+        _read_file(path, start, length),
+        status_code=status_code,
+        media_type="application/gzip",
+        headers=headers,
+    )
@@ -0,0 +1,159 @@
+import asyncio
+import os
+import shutil
+from typing import Optional
+
+from backend.app.schemas.export_job import ExportChunk, ExportJobDocument
+from backend.app.services.aws_service import AWSS3Service
+from backend.config import settings
+
+LOCAL_STORAGE = "local"
+S3_STORAGE = "s3"
+
+
+def get_artifact_name(export_job: ExportJobDocument) -> str:
+    return f"{export_job.id}.{export_job.query.export_format.value}.gz"
+
+
+class ExportStorage:
+    """
+    Storage of the compressed chunks of the exports.
+
+    Every chunk is a complete gzip member, so the artifact is the concatenation
+    of the chunks in order and the chunks already written are kept when an
+    export is resumed. A chunk is stored by its index and attempt, the chunks
+    written by a worker after it lost the export are left out of the artifact.
+    """
+
+    async def start(self, export_job: ExportJobDocument) -> Optional[str]:
+        """Prepares the storage of the export, returns its upload id if any."""
+        return None
+
+    async def write_chunk(
+        self, export_job: ExportJobDocument, chunk: ExportChunk, data: bytes
+    ) -> Optional[str]:
+        """Writes a chunk of the export, returns its ETag if any."""
+        raise NotImplementedError
+
+    async def complete(self, export_job: ExportJobDocument):
+        """Assembles the written chunks into the artifact of the export."""
+        raise NotImplementedError
+
+    async def abort(self, export_job: ExportJobDocument):
+        """Removes everything written for the export."""
+        raise NotImplementedError
+
+
+class LocalExportStorage(ExportStorage):
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def get_artifact_path(self, export_job: ExportJobDocument) -> str:
+        return os.path.join(self.directory, get_artifact_name(export_job))
+
+    async def write_chunk(
+        self, export_job: ExportJobDocument, chunk: ExportChunk, data: bytes
+    ) -> Optional[str]:
+        await asyncio.to_thread(self._write_chunk, export_job, chunk, data)
+        return None
+
+    async def complete(self, export_job: ExportJobDocument):
+        await asyncio.to_thread(self._complete, export_job)
+
+    async def abort(self, export_job: ExportJobDocument):
+        await asyncio.to_thread(
+            shutil.rmtree, self._get_chunks_directory(export_job), True
+        )
+
+    def _get_chunks_directory(self, export_job: ExportJobDocument) -> str:
+        return os.path.join(self.directory, str(export_job.id))
+
+    def _get_chunk_path(self, export_job: ExportJobDocument, chunk: ExportChunk) -> str:
+        return os.path.join(
+            self._get_chunks_directory(export_job),
+            f"{chunk.index:06d}-{chunk.attempt}.gz",
+        )
+
+    def _write_chunk(
+        self, export_job: ExportJobDocument, chunk: ExportChunk, data: bytes
+    ):
+        os.makedirs(self._get_chunks_directory(export_job), exist_ok=True)
+        # A chunk left over by a crashed worker is replaced as a whole
+        path = self._get_chunk_path(export_job, chunk)
+        with open(path + ".tmp", "wb") as chunk_file:
+            chunk_file.write(data)
+        os.replace(path + ".tmp", path)
+
+    def _complete(self, export_job: ExportJobDocument):
+        artifact_path = self.get_artifact_path(export_job)
+        with open(artifact_path + ".tmp", "wb") as artifact_file:
+            for chunk in export_job.chunks:
+                with open(self._get_chunk_path(export_job, chunk), "rb") as chunk_file:
+                    shutil.copyfileobj(chunk_file, artifact_file)
+        os.replace(artifact_path + ".tmp", artifact_path)
+        shutil.rmtree(self._get_chunks_directory(export_job), ignore_errors=True)
+
+
+class S3ExportStorage(ExportStorage):
+    """
+    Uploads the chunks of an export as the parts of a multipart upload.
+
+    Every attempt of the export has its own part number for a chunk, so an
+    export can have up to 10000 / `EXPORT_MAX_JOB_ATTEMPTS` chunks.
+    """
+
+    def __init__(self, aws_service: AWSS3Service, bucket: str, prefix: str):
+        self._aws_service = aws_service
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def get_key(self, export_job: ExportJobDocument) -> str:
+        return (
+            f"{self.prefix}/{export_job.workspace_id}/{get_artifact_name(export_job)}"
+        )
+
+    def get_download_url(self, export_job: ExportJobDocument) -> str:
+        return self._aws_service.generate_presigned_url(
+            self.bucket,
+            self.get_key(export_job),
+            settings.export_settings.DOWNLOAD_URL_EXPIRY_SECONDS,
+        )
+
+    async def start(self, export_job: ExportJobDocument) -> Optional[str]:
+        return await self._aws_service.create_multipart_upload(
+            self.bucket, self.get_key(export_job)
+        )
+
+    async def write_chunk(
+        self, export_job: ExportJobDocument, chunk: ExportChunk, data: bytes
+    ) -> Optional[str]:
+        return await self._aws_service.upload_part(
+            self.bucket,
+            self.get_key(export_job),
+            export_job.upload_id,
+            part_number=_get_part_number(chunk),
+            body=data,
+        )
+
+    async def complete(self, export_job: ExportJobDocument):
+        await self._aws_service.complete_multipart_upload(
+            self.bucket,
+            self.get_key(export_job),
+            export_job.upload_id,
+            [
+                {"PartNumber": _get_part_number(chunk), "ETag": chunk.etag}
+                for chunk in export_job.chunks
+            ],
+        )
+
+    async def abort(self, export_job: ExportJobDocument):
+        if export_job.upload_id:
+            await self._aws_service.abort_multipart_upload(
+                self.bucket, self.get_key(export_job), export_job.upload_id
+            )
+
+
+def _get_part_number(chunk: ExportChunk) -> int:
+    # The attempts of an export range from 1 to the maximum, which keeps the
+    # part numbers in the order of the chunks
+    return chunk.index * settings.export_settings.MAX_JOB_ATTEMPTS + chunk.attempt
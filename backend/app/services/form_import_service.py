@@ -1,38 +1,93 @@
-from typing import Any, Dict
+import datetime as dt
+import math
+import time
+from typing import Any, Dict, List
 
+from beanie import PydanticObjectId
+from loguru import logger
+
+from backend.app.models.form_import_result import FormImportResult
+from backend.app.repositories.form_repository import FormRepository
+from backend.app.repositories.form_response_repository import FormResponseRepository
 from backend.app.schemas.standard_form_response import (
     DeletionRequestStatus,
     FormResponseDeletionRequest,
     FormResponseDocument,
 )
 from backend.app.services.form_service import FormService
+from backend.app.utils.dates import as_utc
+from backend.app.utils.hashing import compute_content_hash
+from backend.app.utils.response_export import ANSWER_METADATA_KEYS
+from backend.app.utils.search_tokens import tokenize_values
+from backend.config import settings
 from common.models.form_import import FormImportResponse
-from common.models.standard_form import StandardForm
+from common.models.standard_form import StandardFormResponse
 
 
 class FormImportService:
-    def __init__(self, form_service: FormService):
+    def __init__(
+        self,
+        form_service: FormService,
+        form_repo: FormRepository,
+        form_response_repo: FormResponseRepository,
+    ):
         self.form_service = form_service
+        self._form_repo = form_repo
+        self._form_response_repo = form_response_repo
 
     async def save_converted_form_and_responses(
-        self, response_data: Dict[str, Any], form_response_data_owner: str
-    ) -> StandardForm | None:
+        self,
+        response_data: Dict[str, Any],
+        form_response_data_owner: str,
+        responses_since: dt.datetime = None,
+    ) -> FormImportResult | None:
+        """
+        Saves the converted form and upserts its responses.
+
+        Args:
+            response_data (Dict[str, Any]): The converted form and responses
+                returned by the provider plugin.
+            form_response_data_owner (str): The field of the form that holds the
+                identifier of the response owner.
+            responses_since (datetime, optional): High-water mark of a delta sync.
+                If provided only responses updated after it are written and the
+                deletion requests are not reconciled as the provider may have
+                returned a partial list of responses.
+
+        Returns:
+            FormImportResult | None: The summary of the import or None if
+                nothing was converted.
+        """
         form_data = FormImportResponse.parse_obj(response_data)
         if not (form_data.form or form_data.responses):
             return None
         standard_form = form_data.form
         await self.form_service.save_form(standard_form)
         responses = form_data.responses
+        latest_response_at = max(
+            filter(None, map(_get_response_timestamp, responses)), default=None
+        )
 
-        updated_responses_id = []
+        if responses_since:
+            responses = [
+                response
+                for response in responses
+                if _is_updated_after(response, responses_since)
+            ]
 
-        for response in responses:
-            existing_response = await FormResponseDocument.find_one(
-                {"response_id": response.response_id}
+        updated_responses_id = [response.response_id for response in responses]
+        existing_responses = (
+            await self._form_response_repo.get_existing_response_hashes(
+                updated_responses_id
             )
+            if updated_responses_id
+            else {}
+        )
+
+        response_documents = []
+        inserted_responses = updated_responses = unchanged_responses = 0
+        for response in responses:
             response_document = FormResponseDocument(**response.dict())
-            if existing_response:
-                response_document.id = existing_response.id
             response_document.form_id = standard_form.form_id
             data_owner_answer = response_document.answers.get(form_response_data_owner)
 
@@ -45,8 +100,50 @@ class FormImportService:
                     if data_owner_answer
                     else None
                 )
-            await response_document.save()
-            updated_responses_id.append(response.response_id)
+
+            response_document.content_hash = _compute_response_hash(response_document)
+            existing_response = existing_responses.get(response.response_id)
+            # A deleted response returned again by the provider is counted anew
+            if not existing_response or not existing_response.has_answers:
+                inserted_responses += 1
+            elif existing_response.content_hash != response_document.content_hash:
+                updated_responses += 1
+            else:
+                unchanged_responses += 1
+                continue
+            # Only the written responses are indexed again as the tokens are
+            # derived from the hashed answers
+            response_document.answer_tokens = get_answer_tokens(
+                response_document.answers
+            )
+            response_documents.append(response_document)
+
+        batch_timings = await self._bulk_upsert_responses(
+            form_id=standard_form.form_id,
+            response_documents=response_documents,
+            existing_response_ids={
+                response_id: existing_response.id
+                for response_id, existing_response in existing_responses.items()
+            },
+        )
+        await self._form_repo.increment_counters(
+            standard_form.form_id, responses=inserted_responses
+        )
+        logger.info(
+            f"Form {standard_form.form_id}: {inserted_responses} responses inserted,"
+            f" {updated_responses} updated and {unchanged_responses} unchanged."
+        )
+        import_result = FormImportResult(
+            form=standard_form,
+            batch_timings=batch_timings,
+            latest_response_at=latest_response_at,
+            inserted_responses=inserted_responses,
+            updated_responses=updated_responses,
+            unchanged_responses=unchanged_responses,
+        )
+
+        if responses_since:
+            return import_result
 
         deletion_requests_query = {
             "form_id": standard_form.form_id,
@@ -58,7 +155,7 @@ class FormImportService:
         ).to_list()
 
         if deletion_requests:
-            await FormResponseDocument.find(
+            deleted_responses = await FormResponseDocument.find(
                 {
                     "form_id": standard_form.form_id,
                     "answers": {"$exists": 1},
@@ -73,16 +170,114 @@ class FormImportService:
                 {
                     "$unset": {
                         "answers": 1,
+                        "answer_tokens": 1,
+                        "content_hash": 1,
                         "created_at": 1,
                         "updated_at": 1,
                         "published_at": 1,
                     }
                 }
             )
+            await self._form_repo.increment_counters(
+                standard_form.form_id, responses=-deleted_responses.modified_count
+            )
 
             await FormResponseDeletionRequest.find(deletion_requests_query).update_many(
                 {
                     "$set": {"status": DeletionRequestStatus.SUCCESS},
                 }
             )
-        return standard_form
+        return import_result
+
+    async def backfill_answer_tokens(self) -> int:
+        """
+        Indexes the answers of the responses saved before they were indexed for
+        the answer filter.
+
+        Returns:
+            int: The number of responses indexed.
+        """
+        indexed_responses = 0
+        last_id = None
+        while True:
+            responses = await self._form_response_repo.get_responses_without_tokens(
+                last_id, settings.form_import_settings.ANSWER_TOKENS_BACKFILL_BATCH_SIZE
+            )
+            if not responses:
+                return indexed_responses
+            await self._form_response_repo.set_answer_tokens(
+                {
+                    response["_id"]: get_answer_tokens(response.get("answers"))
+                    for response in responses
+                }
+            )
+            indexed_responses += len(responses)
+            last_id = responses[-1]["_id"]
+
+    async def _bulk_upsert_responses(
+        self,
+        *,
+        form_id: str,
+        response_documents: List[FormResponseDocument],
+        existing_response_ids: Dict[str, PydanticObjectId],
+    ) -> List[float]:
+        batch_size = settings.form_import_settings.BATCH_SIZE
+        total_batches = math.ceil(len(response_documents) / batch_size)
+        batch_timings = []
+        for index in range(0, len(response_documents), batch_size):
+            batch = response_documents[index : index + batch_size]
+            started_at = time.perf_counter()
+            result = await self._form_response_repo.bulk_upsert(
+                batch, existing_response_ids
+            )
+            elapsed = time.perf_counter() - started_at
+            batch_timings.append(elapsed)
+            logger.info(
+                f"Form {form_id}: response batch {len(batch_timings)}/{total_batches}"
+                f" ({len(batch)} responses, {result.upserted_count} inserted,"
+                f" {result.modified_count} modified) written in {elapsed:.3f}s."
+            )
+        return batch_timings
+
+
+def get_answer_tokens(answers: Dict[str, Any] | None) -> List[str]:
+    """Returns the normalized words of the answers of a response."""
+    answer_values = []
+    for answer in (answers or {}).values():
+        if not isinstance(answer, dict):
+            answer = answer.dict(exclude_none=True)
+        answer_values.append(
+            {
+                key: value
+                for key, value in answer.items()
+                if key not in ANSWER_METADATA_KEYS
+            }
+        )
+    return tokenize_values(
+        answer_values, settings.form_import_settings.MAX_ANSWER_TOKENS
+    )
+
+
+def _compute_response_hash(response_document: FormResponseDocument) -> str:
+    # Only the stored content is hashed, provider timestamps may change on re-sync
+    # without the answers being modified
+    return compute_content_hash(
+        {
+            "answers": {
+                field_id: answer.dict(exclude_none=True)
+                for field_id, answer in (response_document.answers or {}).items()
+            },
+            "dataOwnerIdentifier": response_document.dataOwnerIdentifier,
+        }
+    )
+
+
+def _get_response_timestamp(response: StandardFormResponse) -> dt.datetime | None:
+    timestamp = response.updated_at or response.published_at or response.created_at
+    return as_utc(timestamp) if isinstance(timestamp, dt.datetime) else None
+
+
+def _is_updated_after(response: StandardFormResponse, timestamp: dt.datetime) -> bool:
+    response_timestamp = _get_response_timestamp(response)
+    # Responses without any timestamp can't be compared so they are always written
+    return not response_timestamp or response_timestamp > as_utc(timestamp)
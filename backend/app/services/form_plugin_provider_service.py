@@ -7,13 +7,19 @@ from backend.app.repositories.form_plugin_provider_repository import (
     FormPluginProviderRepository,
 )
 from backend.app.schemas.form_plugin_config import FormPluginConfigDocument
+from backend.app.services.form_provider_registry import FormProviderRegistry
 from common.constants import MESSAGE_NOT_FOUND, MESSAGE_PROVIDER_IS_NOT_ENABLED
 from common.models.user import User
 
 
 class FormPluginProviderService:
-    def __init__(self, form_provider_repo: FormPluginProviderRepository):
+    def __init__(
+        self,
+        form_provider_repo: FormPluginProviderRepository,
+        form_provider_registry: FormProviderRegistry,
+    ):
         self._form_provider_repo = form_provider_repo
+        self._form_provider_registry = form_provider_registry
 
     async def get_providers(self, user: User):
         providers: List[FormProviderConfigDto] = await self._form_provider_repo.list()
@@ -26,34 +32,30 @@ class FormPluginProviderService:
         ]
 
     async def add_provider(self, provider: FormProviderConfigDto):
-        return await self._form_provider_repo.add(
+        saved_provider = await self._form_provider_repo.add(
             FormPluginConfigDocument(**provider.dict())
         )
+        await self._form_provider_registry.invalidate()
+        return saved_provider
 
     async def update_provider(
         self, provider_name: str, provider: FormProviderConfigDto
     ):
-        return await self._form_provider_repo.update(
+        saved_provider = await self._form_provider_repo.update(
             provider_name, FormPluginConfigDocument(**provider.dict())
         )
+        await self._form_provider_registry.invalidate()
+        return saved_provider
 
     async def get_provider(self, provider_name: str, user: User = None):
-        provider = await self._form_provider_repo.get(provider_name)
-        if not provider:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND, content=MESSAGE_NOT_FOUND
-            )
+        provider = await self._get_registered_provider(provider_name)
         if user.is_admin():
             return provider
         if provider.enabled:
             return {"provider_name": provider.provider_name}
 
     async def get_provider_if_enabled(self, provider_name):
-        provider = await self._form_provider_repo.get(provider_name)
-        if not provider:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND, content=MESSAGE_NOT_FOUND
-            )
+        provider = await self._get_registered_provider(provider_name)
         if not provider.enabled:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -64,5 +66,19 @@ class FormPluginProviderService:
         return provider
 
     async def get_provider_url(self, provider_name) -> str:
-        provider = await self._form_provider_repo.get_provider_url(provider_name)
+        provider = await self._get_registered_provider(provider_name)
         return provider.provider_url
+
+    async def _get_registered_provider(
+        self, provider_name: str
+    ) -> FormPluginConfigDocument:
+        # The registry is loaded on startup, this only loads it when used outside
+        # of the application e.g. from the cli
+        if not self._form_provider_registry.is_loaded:
+            await self._form_provider_registry.load()
+        provider = self._form_provider_registry.get(provider_name)
+        if not provider:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND, content=MESSAGE_NOT_FOUND
+            )
+        return provider
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+from loguru import logger
+
+from backend.app.schemas.cache_version import CacheVersionDocument
+from backend.app.schemas.form_plugin_config import FormPluginConfigDocument
+from backend.config import settings
+
+CACHE_VERSION_KEY = "form_plugin_configs"
+
+
+class FormProviderRegistry:
+    """
+    In-memory copy of the configs of the form provider plugins.
+
+    The configs are reloaded when the version of the configs is incremented by a
+    worker changing them, which is polled every few seconds, and at least once
+    per TTL.
+    """
+
+    def __init__(self):
+        self._providers: Dict[str, FormPluginConfigDocument] = {}
+        self._version: Optional[int] = None
+        self._loaded_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    async def start(self):
+        await self.load()
+        self._task = asyncio.create_task(self._poll())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    async def load(self):
+        version = await self._get_version()
+        providers = await FormPluginConfigDocument.find_many().to_list()
+        self._providers = {provider.provider_name: provider for provider in providers}
+        self._version = version
+        self._loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(providers)} form provider configs.")
+
+    def get(self, provider_name: str) -> Optional[FormPluginConfigDocument]:
+        return self._providers.get(provider_name)
+
+    async def invalidate(self):
+        """Reloads the configs in this worker and signals the other workers."""
+        await CacheVersionDocument.get_motor_collection().update_one(
+            {"key": CACHE_VERSION_KEY}, {"$inc": {"version": 1}}, upsert=True
+        )
+        await self.load()
+
+    async def _get_version(self) -> int:
+        cache_version = await CacheVersionDocument.find_one({"key": CACHE_VERSION_KEY})
+        return cache_version.version if cache_version else 0
+
+    async def _poll(self):
+        api_settings = settings.api_settings
+        while True:
+            await asyncio.sleep(api_settings.PROVIDER_REGISTRY_POLL_SECONDS)
+            try:
+                expired = (
+                    time.monotonic() - self._loaded_at
+                    >= api_settings.PROVIDER_REGISTRY_TTL_SECONDS
+                )
+                if expired or await self._get_version() != self._version:
+                    await self.load()
+            except Exception as e:
+                logger.opt(exception=e).error(
+                    "Failed to refresh the form provider configs."
+                )
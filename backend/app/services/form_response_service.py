@@ -1,15 +1,18 @@
 from http import HTTPStatus
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from beanie import PydanticObjectId
 
 from backend.app.exceptions import HTTPException
+from backend.app.models.authorization_facts import AuthorizationFacts
+from backend.app.models.cursor_page import CursorParams
 from backend.app.models.filter_queries.form_responses import FormResponseFilterQuery
 from backend.app.models.filter_queries.sort import SortRequest
 from backend.app.models.response_dtos import (
     StandardFormCamelModel,
     StandardFormResponseCamelModel,
 )
+from backend.app.repositories.form_repository import FormRepository
 from backend.app.repositories.form_response_repository import FormResponseRepository
 from backend.app.repositories.workspace_form_repository import WorkspaceFormRepository
 from backend.app.repositories.workspace_user_repository import WorkspaceUserRepository
@@ -18,7 +21,6 @@ from backend.app.schemas.standard_form_response import (
     FormResponseDeletionRequest,
     FormResponseDocument,
 )
-from backend.app.schemas.workspace_form import WorkspaceFormDocument
 from common.constants import MESSAGE_UNAUTHORIZED
 from common.models.user import User
 
@@ -29,8 +31,10 @@ class FormResponseService:
         form_response_repo: FormResponseRepository,
         workspace_form_repo: WorkspaceFormRepository,
         workspace_user_repo: WorkspaceUserRepository,
+        form_repo: FormRepository,
     ):
         self._form_response_repo = form_response_repo
+        self._form_repo = form_repo
         self._workspace_form_repo = workspace_form_repo
         self._workspace_user_repo = workspace_user_repo
 
@@ -42,6 +46,7 @@ class FormResponseService:
         request_for_deletion: bool,
         user: User,
         data_subjects: bool = None,
+        cursor_params: CursorParams = None,
     ):
         if not await self._workspace_user_repo.has_user_access_in_workspace(
             workspace_id=workspace_id, user=user
@@ -58,6 +63,7 @@ class FormResponseService:
             data_subjects=data_subjects,
             filter_query=filter_query,
             sort=sort,
+            cursor_params=cursor_params,
         )
 
     async def get_user_submissions(
@@ -81,6 +87,7 @@ class FormResponseService:
         filter_query: FormResponseFilterQuery,
         sort: SortRequest,
         user: User,
+        cursor_params: CursorParams = None,
     ):
         if not await self._workspace_user_repo.has_user_access_in_workspace(
             workspace_id, user
@@ -99,39 +106,37 @@ class FormResponseService:
             )
         # TODO : Refactor with mongo query instead of python
         form_responses = await self._form_response_repo.list(
-            [form_id], request_for_deletion, filter_query, sort
+            [form_id],
+            request_for_deletion,
+            filter_query,
+            sort,
+            cursor_params=cursor_params,
         )
         return form_responses
 
     async def get_workspace_submission(
         self, workspace_id: PydanticObjectId, response_id: str, user: User
     ):
-        is_admin = await self._workspace_user_repo.has_user_access_in_workspace(
-            workspace_id, user
-        )
         # TODO : Handle case for multiple form import by other user
-        # TODO : Combine all queries to one
-        response = await FormResponseDocument.find_one({"response_id": response_id})
-        form = await FormDocument.find_one({"form_id": response.form_id})
-        deletion_request = await FormResponseDeletionRequest.find_one(
-            {"response_id": response_id}
+        response, authorization = await self._get_response_with_authorization(
+            workspace_id, response_id, user
         )
-        workspace_form = await WorkspaceFormDocument.find(
-            {
-                "workspace_id": workspace_id,
-                "form_id": form.form_id,
-            }
-        ).to_list()
-        if not workspace_form:
+        form = response.pop("form", None)
+        deletion_status = response.pop("deletion_status", None)
+        if not form or not authorization.in_workspace:
             raise HTTPException(404, "Form not found in this workspace")
 
-        if not (is_admin or response.dataOwnerIdentifier == user.sub):
+        if not (
+            authorization.is_member or response.get("dataOwnerIdentifier") == user.sub
+        ):
             raise HTTPException(403, "You are not authorized to perform this action.")
 
-        response = StandardFormResponseCamelModel(**response.dict())
-        if deletion_request is not None:
-            response.deletion_status = deletion_request.status
-        form = StandardFormCamelModel(**form.dict())
+        response = StandardFormResponseCamelModel(
+            **FormResponseDocument.parse_obj(response).dict()
+        )
+        if deletion_status is not None:
+            response.deletion_status = deletion_status
+        form = StandardFormCamelModel(**FormDocument.parse_obj(form).dict())
 
         response.form_title = form.title
         return {"form": form, "response": response}
@@ -139,20 +144,17 @@ class FormResponseService:
     async def request_for_response_deletion(
         self, workspace_id: PydanticObjectId, response_id: str, user: User
     ):
-        is_admin = await self._workspace_user_repo.has_user_access_in_workspace(
-            workspace_id, user
-        )
         # TODO : Handle case for multiple form import by other user
-        response = await FormResponseDocument.find_one({"response_id": response_id})
+        response, authorization = await self._get_response_with_authorization(
+            workspace_id, response_id, user
+        )
 
-        if not (is_admin or response.dataOwnerIdentifier == user.sub):
+        if not (
+            authorization.is_member or response.get("dataOwnerIdentifier") == user.sub
+        ):
             raise HTTPException(403, "You are not authorized to perform this action.")
 
-        deletion_request = await FormResponseDeletionRequest.find_one(
-            {"response_id": response_id}
-        )
-
-        if deletion_request:
+        if response.get("deletion_status") is not None:
             raise HTTPException(
                 400,
                 "Error: Deletion request already exists for the response : "
@@ -160,10 +162,23 @@ class FormResponseService:
             )
 
         await FormResponseDeletionRequest(
-            form_id=response.form_id,
+            form_id=response["form_id"],
             response_id=response_id,
-            provider=response.provider,
+            provider=response.get("provider"),
         ).save()
+        await self._form_repo.increment_counters(
+            response["form_id"], deletion_requests=1
+        )
+
+    async def _get_response_with_authorization(
+        self, workspace_id: PydanticObjectId, response_id: str, user: User
+    ) -> Tuple[Dict[str, Any], AuthorizationFacts]:
+        response = await self._form_response_repo.get_response_with_authorization(
+            workspace_id, response_id, user.id
+        )
+        if not response:
+            raise HTTPException(HTTPStatus.NOT_FOUND, "Response not found")
+        return response, AuthorizationFacts(**response.pop("authorization"))
 
     async def get_responses_count_in_workspace(self, workspace_form_ids: List[str]):
         return await self._form_response_repo.count_responses_for_form_ids(
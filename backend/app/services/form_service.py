@@ -6,13 +6,16 @@ from fastapi_pagination import Page
 from fastapi_pagination.ext.beanie import paginate
 
 from backend.app.exceptions import HTTPException
+from backend.app.models.form_search_index import FormSearchIndex
 from backend.app.models.minified_form import MinifiedForm
 from backend.app.models.settings_patch import SettingsPatchDto
 from backend.app.repositories.form_repository import FormRepository
 from backend.app.repositories.workspace_form_repository import WorkspaceFormRepository
 from backend.app.repositories.workspace_user_repository import WorkspaceUserRepository
 from backend.app.schemas.standard_form import FormDocument
-from backend.app.utils import AiohttpClient
+from backend.app.services.user_profile_resolver import user_profile_resolver
+from backend.app.utils.hashing import compute_content_hash
+from backend.app.utils.search_tokens import tokenize
 from backend.config import settings
 from common.models.standard_form import StandardForm
 from common.models.user import User
@@ -63,20 +66,18 @@ class FormService:
         return forms_page
 
     async def fetch_user_details(self, user_ids):
-        response = await AiohttpClient.get_aiohttp_client().get(
-            f"{settings.auth_settings.BASE_URL}/users",
-            params={"user_ids": user_ids},
-        )
-        return await response.json()
+        return {"users_info": await user_profile_resolver.get_users_info(user_ids)}
 
     async def search_form_in_workspace(
         self, workspace_id: PydanticObjectId, query: str
     ):
-        form_ids = await self._workspace_form_repo.get_form_ids_in_workspace(
-            workspace_id, True
-        )
+        terms = tokenize(query)
+        if not terms:
+            return []
         forms = await self._form_repo.search_form_in_workspace(
-            workspace_id=workspace_id, form_ids=form_ids, query=query
+            workspace_id=workspace_id,
+            terms=terms,
+            limit=settings.api_settings.FORM_SEARCH_LIMIT,
         )
 
         user_ids = [form["imported_by"] for form in forms]
@@ -132,7 +133,12 @@ class FormService:
 
     async def save_form(self, form: StandardForm):
         existing_form = await FormDocument.find_one({"form_id": form.form_id})
-        form_document = FormDocument(**form.dict())
+        form_data = form.dict(exclude={"content_hash"})
+        content_hash = compute_content_hash(form_data)
+        if existing_form and existing_form.content_hash == content_hash:
+            return existing_form
+        form_document = FormDocument(**form_data)
+        form_document.content_hash = content_hash
         if existing_form:
             form_document.id = existing_form.id
             form_document.created_at = (
@@ -140,7 +146,42 @@ class FormService:
                 if existing_form.created_at
                 else datetime.utcnow()
             )
-        return await self._form_repo.save_form(form_document)
+            saved_form = await self._form_repo.update_form_content(form_document)
+        else:
+            saved_form = await self._form_repo.save_form(form_document)
+        await self._workspace_form_repo.update_search_indexes(
+            {form.form_id: FormSearchIndex.from_form(form.title, form.description)}
+        )
+        return saved_form
+
+    async def backfill_search_indexes(self) -> int:
+        """
+        Indexes the workspace forms saved before they were indexed for the search.
+
+        Returns:
+            int: The number of forms indexed.
+        """
+        indexed_forms = 0
+        while True:
+            form_ids = (
+                await self._workspace_form_repo.get_form_ids_without_search_index(
+                    settings.api_settings.FORM_SEARCH_BACKFILL_BATCH_SIZE
+                )
+            )
+            if not form_ids:
+                return indexed_forms
+            search_fields = await self._form_repo.get_search_fields(form_ids)
+            # The workspace forms of deleted forms get an empty index so they
+            # aren't picked up again
+            await self._workspace_form_repo.update_search_indexes(
+                {
+                    form_id: FormSearchIndex.from_form(
+                        *search_fields.get(form_id, (None, None))
+                    )
+                    for form_id in form_ids
+                }
+            )
+            indexed_forms += len(form_ids)
 
     async def patch_settings_in_workspace_form(
         self,
@@ -178,6 +219,23 @@ class FormService:
             workspace_form.settings.response_data_owner_field = (
                 settings.responseDataOwnerField
             )
+        if settings.syncIntervalMinMinutes is not None:
+            workspace_form.settings.sync_interval_min_minutes = (
+                settings.syncIntervalMinMinutes
+            )
+        if settings.syncIntervalMaxMinutes is not None:
+            workspace_form.settings.sync_interval_max_minutes = (
+                settings.syncIntervalMaxMinutes
+            )
+        if (
+            workspace_form.settings.sync_interval_min_minutes
+            and workspace_form.settings.sync_interval_max_minutes
+            and workspace_form.settings.sync_interval_min_minutes
+            > workspace_form.settings.sync_interval_max_minutes
+        ):
+            raise HTTPException(
+                400, "Minimum sync interval can't be greater than the maximum."
+            )
         return await self._workspace_form_repo.update(workspace_form.id, workspace_form)
 
     async def delete_form(self, form_id: str):
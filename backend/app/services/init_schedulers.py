@@ -1,18 +1,34 @@
+import asyncio
 from datetime import datetime as dt, timedelta
+from typing import Dict, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
 
 from backend.app.container import container
+from backend.app.models.scheduler_bootstrap_progress import SchedulerBootstrapProgress
+from backend.app.schedulers.form_schedular import clamp_interval, get_interval_bounds
+from backend.app.schedulers.worker_coordinator import WorkerCoordinator
 from backend.app.schemas.blacklisted_refresh_tokens import BlackListedRefreshTokens
 from backend.app.schemas.workspace_form import WorkspaceFormDocument
 from backend.app.schemas.workspace_invitation import WorkspaceUserInvitesDocument
 from backend.app.services.auth_cookie_service import get_expiry_epoch_after
-from backend.app.utils import AiohttpClient
+from backend.app.services.user_profile_resolver import user_profile_resolver
 from backend.config import settings
 from common.enums.workspace_invitation_status import InvitationStatus
 from common.models.user import User
 
+MAINTENANCE_JOB_IDS = (
+    "blacklisted_refresh_token_remover",
+    "invitations_expired_remover",
+    "form_counters_reconciler",
+    "form_search_index_backfill",
+    "answer_tokens_backfill",
+)
+
+bootstrap_progress = SchedulerBootstrapProgress()
+_scheduler_task: Optional[asyncio.Task] = None
+
 
 async def remove_expired_tokens_from_db():
     logger.info("Running expired refresh token remover scheduler")
@@ -27,49 +43,182 @@ async def update_expired_invitations_from_db():
     )
 
 
+async def reconcile_form_counters():
+    logger.info("Running scheduler to reconcile the counters of the forms")
+    fixed_forms = await container.form_repo().reconcile_counters()
+    if fixed_forms:
+        logger.warning(f"Fixed drifted response counters of {fixed_forms} forms.")
+
+
+async def backfill_form_search_indexes():
+    logger.info("Running scheduler to index the forms for the search")
+    indexed_forms = await container.form_service().backfill_search_indexes()
+    if indexed_forms:
+        logger.info(f"Indexed {indexed_forms} forms for the search.")
+
+
+async def backfill_answer_tokens():
+    logger.info("Running scheduler to index the answers of the responses")
+    indexed_responses = await container.form_import_service().backfill_answer_tokens()
+    if indexed_responses:
+        logger.info(f"Indexed the answers of {indexed_responses} responses.")
+
+
 async def update_all_scheduled_forms(scheduler: AsyncIOScheduler):
     workspace_forms = await WorkspaceFormDocument.find().to_list()
-    for workspace_form in workspace_forms:
-        users_response = await fetch_user_details([workspace_form.user_id])
-        if users_response:
-            user_response = users_response.get("users_info")[0]
-            user = User(
+    await schedule_forms(scheduler, workspace_forms, bootstrap_progress)
+
+
+async def reconcile_scheduled_forms(
+    scheduler: AsyncIOScheduler,
+    worker_coordinator: WorkerCoordinator,
+    progress: SchedulerBootstrapProgress,
+):
+    workspace_forms = await WorkspaceFormDocument.find().to_list()
+    owned_forms = {
+        get_form_job_id(workspace_form): workspace_form
+        for workspace_form in workspace_forms
+        if worker_coordinator.owns_form(workspace_form.form_id)
+    }
+    scheduled_job_ids = {
+        job.id for job in scheduler.get_jobs() if job.id not in MAINTENANCE_JOB_IDS
+    }
+    released_job_ids = scheduled_job_ids - owned_forms.keys()
+    for job_id in released_job_ids:
+        scheduler.remove_job(job_id)
+    new_forms = [
+        workspace_form
+        for job_id, workspace_form in owned_forms.items()
+        if job_id not in scheduled_job_ids
+    ]
+    if released_job_ids or new_forms:
+        logger.info(
+            f"Scheduler worker {worker_coordinator.worker_id} owns"
+            f" {len(owned_forms)} forms, released {len(released_job_ids)} and"
+            f" picked up {len(new_forms)}."
+        )
+    await schedule_forms(scheduler, new_forms, progress)
+
+
+async def schedule_forms(
+    scheduler: AsyncIOScheduler,
+    workspace_forms: List[WorkspaceFormDocument],
+    progress: SchedulerBootstrapProgress,
+):
+    batch_size = settings.schedular_settings.BOOTSTRAP_BATCH_SIZE
+    progress.total_forms = len(workspace_forms)
+    if workspace_forms:
+        logger.info(f"Scheduling {len(workspace_forms)} forms.")
+
+    user_ids = list({workspace_form.user_id for workspace_form in workspace_forms})
+    users = await fetch_users_in_batches(user_ids, batch_size)
+
+    for index in range(0, len(workspace_forms), batch_size):
+        batch = workspace_forms[index : index + batch_size]
+        # The forms are scheduled with the adaptive interval reached before restart
+        # within their current bounds
+        form_ids = [workspace_form.form_id for workspace_form in batch]
+        interval_minutes = await container.form_sync_state_repo().get_interval_minutes(
+            form_ids
+        )
+        form_settings = await container.workspace_form_repo().get_settings_for_form_ids(
+            form_ids
+        )
+        for workspace_form in batch:
+            user = users.get(workspace_form.user_id)
+            if not user:
+                progress.skipped_forms += 1
+                logger.warning(
+                    f"Skipping schedular for form {workspace_form.form_id} as its"
+                    f" importer {workspace_form.user_id} could not be fetched."
+                )
+                continue
+            add_form_job(
+                scheduler,
+                workspace_form,
+                user,
+                clamp_interval(
+                    interval_minutes.get(
+                        workspace_form.form_id,
+                        settings.schedular_settings.INTERVAL_MINUTES,
+                    ),
+                    get_interval_bounds(form_settings.get(workspace_form.form_id, [])),
+                ),
+            )
+            progress.scheduled_forms += 1
+        logger.info(
+            f"Scheduled {progress.scheduled_forms}/{progress.total_forms}"
+            f" forms ({progress.skipped_forms} skipped)."
+        )
+        # Adding jobs to the job store is blocking so the requests are given a turn
+        # in between the batches
+        await asyncio.sleep(0)
+    progress.finished_at = dt.utcnow()
+
+
+def get_form_job_id(workspace_form: WorkspaceFormDocument) -> str:
+    return f"{workspace_form.settings.provider}_{workspace_form.form_id}"
+
+
+def add_form_job(
+    scheduler: AsyncIOScheduler,
+    workspace_form: WorkspaceFormDocument,
+    user: User,
+    interval_minutes: float,
+):
+    scheduler.add_job(
+        container.form_schedular().update_form,
+        "interval",
+        id=get_form_job_id(workspace_form),
+        coalesce=True,
+        replace_existing=True,
+        kwargs={
+            "user": user,
+            "provider": workspace_form.settings.provider,
+            "form_id": workspace_form.form_id,
+            "response_data_owner": workspace_form.settings.response_data_owner_field,
+        },
+        minutes=interval_minutes,
+    )
+
+
+async def fetch_users_in_batches(
+    user_ids: List[str], batch_size: int
+) -> Dict[str, User]:
+    batches = [
+        user_ids[index : index + batch_size]
+        for index in range(0, len(user_ids), batch_size)
+    ]
+    semaphore = asyncio.Semaphore(
+        settings.schedular_settings.BOOTSTRAP_MAX_CONCURRENT_FETCHES
+    )
+
+    async def fetch_batch(batch: List[str]):
+        async with semaphore:
+            return await fetch_user_details(batch)
+
+    users_responses = await asyncio.gather(
+        *[fetch_batch(batch) for batch in batches], return_exceptions=True
+    )
+    users = {}
+    for batch, users_response in zip(batches, users_responses):
+        if isinstance(users_response, Exception):
+            logger.error(f"Failed to fetch {len(batch)} users: {users_response}")
+            continue
+        for user_response in users_response.get("users_info", []):
+            users[user_response.get("_id")] = User(
                 **user_response,
                 id=user_response.get("_id"),
                 sub=user_response.get("email"),
             )
-            logger.info(
-                "Updating schedular for form with provider: "
-                + workspace_form.settings.provider
-                + " and id: "
-                + workspace_form.form_id
-            )
-            scheduler.add_job(
-                container.form_schedular().update_form,
-                "interval",
-                id=f"{workspace_form.settings.provider}_{workspace_form.form_id}",
-                coalesce=True,
-                replace_existing=True,
-                kwargs={
-                    "user": user,
-                    "provider": workspace_form.settings.provider,
-                    "form_id": workspace_form.form_id,
-                    "response_data_owner": workspace_form.settings.response_data_owner_field,
-                },
-                minutes=settings.schedular_settings.INTERVAL_MINUTES,
-            )
+    return users
 
 
 async def fetch_user_details(user_ids):
-    response = await AiohttpClient.get_aiohttp_client().get(
-        f"{settings.auth_settings.BASE_URL}/users",
-        params={"user_ids": user_ids},
-    )
-    return await response.json()
+    return {"users_info": await user_profile_resolver.get_users_info(user_ids)}
 
 
-async def init_schedulers(scheduler: AsyncIOScheduler):
-    scheduler.start()
+def add_maintenance_jobs(scheduler: AsyncIOScheduler):
     scheduler.add_job(
         remove_expired_tokens_from_db,
         "interval",
@@ -86,4 +235,110 @@ async def init_schedulers(scheduler: AsyncIOScheduler):
         replace_existing=True,
         minutes=1440,
     )
-    await update_all_scheduled_forms(scheduler=scheduler)
+    # Also run on start so the counters of the forms imported before they were
+    # maintained are filled in
+    scheduler.add_job(
+        reconcile_form_counters,
+        "interval",
+        id="form_counters_reconciler",
+        coalesce=True,
+        replace_existing=True,
+        minutes=settings.schedular_settings.COUNTERS_RECONCILE_INTERVAL_MINUTES,
+        next_run_time=dt.now(),
+    )
+    # Indexes the forms imported before the search index on start, the forms are
+    # indexed when saved afterwards
+    scheduler.add_job(
+        backfill_form_search_indexes,
+        "interval",
+        id="form_search_index_backfill",
+        coalesce=True,
+        replace_existing=True,
+        minutes=1440,
+        next_run_time=dt.now(),
+    )
+    scheduler.add_job(
+        backfill_answer_tokens,
+        "interval",
+        id="answer_tokens_backfill",
+        coalesce=True,
+        replace_existing=True,
+        minutes=1440,
+        next_run_time=dt.now(),
+    )
+
+
+def remove_maintenance_jobs(scheduler: AsyncIOScheduler):
+    for job_id in MAINTENANCE_JOB_IDS:
+        if scheduler.get_job(job_id):
+            scheduler.remove_job(job_id)
+
+
+async def run_distributed_schedulers(
+    scheduler: AsyncIOScheduler, worker_coordinator: WorkerCoordinator
+):
+    schedular_settings = settings.schedular_settings
+    last_reconciled_at = None
+    while True:
+        try:
+            membership_changed, leadership_changed = await worker_coordinator.refresh()
+            if leadership_changed:
+                if worker_coordinator.is_leader:
+                    add_maintenance_jobs(scheduler)
+                else:
+                    remove_maintenance_jobs(scheduler)
+
+            now = dt.utcnow()
+            if (
+                membership_changed
+                or not last_reconciled_at
+                or (now - last_reconciled_at).total_seconds()
+                >= schedular_settings.RECONCILE_INTERVAL_SECONDS
+            ):
+                progress = (
+                    bootstrap_progress
+                    if not last_reconciled_at
+                    else SchedulerBootstrapProgress(started_at=now)
+                )
+                await reconcile_scheduled_forms(scheduler, worker_coordinator, progress)
+                last_reconciled_at = now
+        except Exception as e:
+            logger.opt(exception=e).error("Failed to coordinate the scheduler.")
+        await asyncio.sleep(schedular_settings.HEARTBEAT_SECONDS)
+
+
+async def init_schedulers(
+    scheduler: AsyncIOScheduler, worker_coordinator: WorkerCoordinator
+):
+    scheduler.start()
+    # Scheduling the forms is left to run in the background so the startup isn't
+    # blocked on it
+    global _scheduler_task
+    bootstrap_progress.started_at = dt.utcnow()
+    if worker_coordinator.enabled:
+        _scheduler_task = asyncio.create_task(
+            run_distributed_schedulers(scheduler, worker_coordinator)
+        )
+    else:
+        add_maintenance_jobs(scheduler)
+        _scheduler_task = asyncio.create_task(update_all_scheduled_forms(scheduler))
+    _scheduler_task.add_done_callback(_on_scheduler_task_done)
+
+
+async def shutdown_schedulers(worker_coordinator: WorkerCoordinator):
+    if _scheduler_task and not _scheduler_task.done():
+        _scheduler_task.cancel()
+    if worker_coordinator.enabled:
+        await worker_coordinator.leave()
+
+
+def _on_scheduler_task_done(task: asyncio.Task):
+    if task.cancelled():
+        logger.warning("Scheduling of the forms was cancelled.")
+    elif task.exception():
+        logger.opt(exception=task.exception()).error("Failed to schedule the forms.")
+    else:
+        logger.info(
+            f"Scheduled {bootstrap_progress.scheduled_forms} forms in"
+            f" {bootstrap_progress.finished_at - bootstrap_progress.started_at}."
+        )
@@ -2,48 +2,122 @@ import logging
 from http import HTTPStatus
 from typing import Any, Mapping
 
+import httpx
 from httpx import ConnectError
+from starlette.background import BackgroundTask
 from starlette.requests import Request
+from starlette.responses import StreamingResponse
 
 from backend.app.constants import messages
 from backend.app.exceptions import HTTPException
+from backend.app.utils.upstream_client import (
+    PLUGIN_UPSTREAM,
+    get_plugin_upstream,
+    upstream_clients,
+)
 from common.constants import MESSAGE_NOT_FOUND
 from common.enums.http_methods import HTTPMethods
-from common.services.http_client import HttpClient
 
+# Headers of the plugin responses describing the body, the hop-by-hop ones and
+# the ones set by the plugin for itself e.g. cookies aren't forwarded
+FORWARDED_RESPONSE_HEADERS = {
+    "content-type",
+    "content-encoding",
+    "content-length",
+    "content-disposition",
+    "content-language",
+    "cache-control",
+    "etag",
+    "last-modified",
+    "expires",
+    "vary",
+}
 
-class PluginProxyService:
-    def __init__(self, http_client: HttpClient):
-        self.http_client = http_client
 
+class PluginProxyService:
     async def pass_request(
         self,
         request: Request,
         url: str,
         *,
+        provider: str = None,
         method: HTTPMethods = None,
         data: Mapping[str, Any] = None,
     ) -> Mapping[str, Any]:
+        """
+        Passes the request to the plugin and returns its parsed response, for the
+        callers that need to inspect the data.
+        """
+        response = await self._send(
+            request, url, provider=provider, method=method, data=data, stream=False
+        )
+        return response.json()
+
+    async def stream_request(
+        self,
+        request: Request,
+        url: str,
+        *,
+        provider: str = None,
+        method: HTTPMethods = None,
+        data: Mapping[str, Any] = None,
+    ) -> StreamingResponse:
+        """
+        Passes the request to the plugin and pipes its response body to the client
+        as it is received, without parsing it.
+        """
+        response = await self._send(
+            request, url, provider=provider, method=method, data=data, stream=True
+        )
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key.lower() in FORWARDED_RESPONSE_HEADERS
+        }
+        # The raw bytes are forwarded along with their content encoding
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers=headers,
+            background=BackgroundTask(response.aclose),
+        )
+
+    async def _send(
+        self,
+        request: Request,
+        url: str,
+        *,
+        provider: str,
+        method: HTTPMethods,
+        data: Mapping[str, Any],
+        stream: bool,
+    ) -> httpx.Response:
+        upstream = get_plugin_upstream(provider) if provider else PLUGIN_UPSTREAM
         # Merge query params if params is not none
         try:
-            response = await self.http_client.request(
-                method=method if method else request.method,
-                url=url,
+            response = await upstream_clients.get(upstream).request(
+                method if method else request.method,
+                url,
+                stream=stream,
                 json=data,
                 params=request.query_params,
                 headers=request.headers,
                 cookies=request.cookies,
                 timeout=60,
             )
-            if response.status_code != HTTPStatus.OK:
-                logging.error(response.url)
-                logging.error(response.status_code)
-                logging.error(response.content)
-                raise HTTPException(
-                    HTTPStatus.INTERNAL_SERVER_ERROR, messages.proxy_server_error
-                )
-            return response.json()
         except ConnectError:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, content=MESSAGE_NOT_FOUND
             )
+        if response.status_code != HTTPStatus.OK:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            logging.error(response.url)
+            logging.error(response.status_code)
+            logging.error(response.content)
+            raise HTTPException(
+                HTTPStatus.INTERNAL_SERVER_ERROR, messages.proxy_server_error
+            )
+        return response
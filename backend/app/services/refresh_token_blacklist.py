@@ -0,0 +1,145 @@
+import asyncio
+import datetime as dt
+import hashlib
+from typing import Optional, Set
+
+import jwt
+from bson import ObjectId
+from loguru import logger
+
+from backend.app.schemas.blacklisted_refresh_tokens import BlackListedRefreshTokens
+from backend.app.utils.bloom_filter import BloomFilter
+from backend.config import settings
+
+POLL_OVERLAP = dt.timedelta(minutes=1)
+
+
+def get_blacklist_key(token: str) -> str:
+    """
+    Returns the key identifying a refresh token in the blacklist i.e. its jti or
+    the hash of the token for the tokens issued without one.
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        claims = {}
+    return claims.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+
+
+class RefreshTokenBlacklist:
+    """
+    In-memory copy of the blacklisted refresh tokens of the worker.
+
+    A Bloom filter answers for the tokens that were never blacklisted, which is
+    almost every refresh, and an exact set of the keys answers on filter hits.
+    The database is only queried for the false positives of the filter.
+
+    The tokens blacklisted by the other workers are polled every few seconds and
+    everything is reloaded periodically to drop the expired tokens removed from
+    the database.
+    """
+
+    def __init__(self):
+        self._keys: Set[str] = set()
+        self._bloom_filter = BloomFilter(capacity=1)
+        self._last_id: Optional[ObjectId] = None
+        self._loaded_at: Optional[dt.datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self.load()
+        self._task = asyncio.create_task(self._poll())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    async def load(self):
+        blacklisted_tokens = (
+            await BlackListedRefreshTokens.get_motor_collection()
+            .find({}, {"token": 1, "jti": 1})
+            .sort("_id", 1)
+            .to_list(length=None)
+        )
+        keys = {
+            blacklisted_token.get("jti")
+            or get_blacklist_key(blacklisted_token["token"])
+            for blacklisted_token in blacklisted_tokens
+        }
+        # Sized with room for the tokens blacklisted until the next reload
+        bloom_filter = BloomFilter(
+            capacity=max(2 * len(keys), 1000),
+            false_positive_rate=settings.auth_settings.BLACKLIST_FALSE_POSITIVE_RATE,
+        )
+        for key in keys:
+            bloom_filter.add(key)
+        self._keys = keys
+        self._bloom_filter = bloom_filter
+        if blacklisted_tokens:
+            self._last_id = blacklisted_tokens[-1]["_id"]
+        self._loaded_at = dt.datetime.utcnow()
+        logger.info(f"Loaded {len(keys)} blacklisted refresh tokens.")
+
+    async def refresh(self):
+        # The ids generated by different workers are not strictly ordered so the
+        # poll overlaps with the previous one
+        query = (
+            {
+                "_id": {
+                    "$gt": ObjectId.from_datetime(
+                        self._last_id.generation_time - POLL_OVERLAP
+                    )
+                }
+            }
+            if self._last_id
+            else {}
+        )
+        blacklisted_tokens = (
+            await BlackListedRefreshTokens.get_motor_collection()
+            .find(query, {"token": 1, "jti": 1})
+            .sort("_id", 1)
+            .to_list(length=None)
+        )
+        for blacklisted_token in blacklisted_tokens:
+            self.add(
+                blacklisted_token.get("jti")
+                or get_blacklist_key(blacklisted_token["token"])
+            )
+            self._last_id = max(
+                self._last_id or blacklisted_token["_id"], blacklisted_token["_id"]
+            )
+
+    def add(self, key: str):
+        self._keys.add(key)
+        self._bloom_filter.add(key)
+
+    async def is_blacklisted(self, token: str) -> bool:
+        key = get_blacklist_key(token)
+        if key not in self._bloom_filter:
+            return False
+        if key in self._keys:
+            return True
+        blacklisted_token = await BlackListedRefreshTokens.find_one(
+            {"$or": [{"jti": key}, {"token": token}]}
+        )
+        if blacklisted_token:
+            self.add(key)
+        return blacklisted_token is not None
+
+    async def _poll(self):
+        auth_settings = settings.auth_settings
+        reload_interval = dt.timedelta(minutes=auth_settings.BLACKLIST_RELOAD_MINUTES)
+        while True:
+            await asyncio.sleep(auth_settings.BLACKLIST_REFRESH_SECONDS)
+            try:
+                if dt.datetime.utcnow() - self._loaded_at >= reload_interval:
+                    await self.load()
+                else:
+                    await self.refresh()
+            except Exception as e:
+                logger.opt(exception=e).error(
+                    "Failed to refresh the blacklisted refresh tokens."
+                )
+
+
+refresh_token_blacklist = RefreshTokenBlacklist()
@@ -0,0 +1,132 @@
+from typing import AsyncIterator, Optional, Tuple
+
+from beanie import PydanticObjectId
+from starlette.responses import StreamingResponse
+
+from backend.app.models.enum.export_format import ExportFormat
+from backend.app.models.filter_queries.form_responses import FormResponseFilterQuery
+from backend.app.models.response_export import ResponseExportQuery
+from backend.app.repositories.form_repository import FormRepository
+from backend.app.repositories.form_response_repository import FormResponseRepository
+from backend.app.repositories.workspace_form_repository import WorkspaceFormRepository
+from backend.app.services.workspace_user_service import WorkspaceUserService
+from backend.app.utils.filter_compiler import compile_filter
+from backend.app.utils.response_export import (
+    MEDIA_TYPES,
+    ResponseExportEncoder,
+    flatten_response,
+    get_export_fields,
+)
+from backend.config import settings
+from common.models.user import User
+
+
+class ResponseExportService:
+    def __init__(
+        self,
+        form_response_repo: FormResponseRepository,
+        form_repo: FormRepository,
+        workspace_form_repo: WorkspaceFormRepository,
+        workspace_user_service: WorkspaceUserService,
+    ):
+        self._form_response_repo = form_response_repo
+        self._form_repo = form_repo
+        self._workspace_form_repo = workspace_form_repo
+        self._workspace_user_service = workspace_user_service
+
+    async def export_responses(
+        self,
+        workspace_id: PydanticObjectId,
+        user: User,
+        export_format: ExportFormat,
+        form_id: str = None,
+        filter_query: FormResponseFilterQuery = None,
+    ) -> StreamingResponse:
+        """
+        Streams the responses of a form, or of all the forms of the workspace, as
+        they are read from the database.
+        """
+        export_query = await self.create_export_query(
+            workspace_id, user, export_format, form_id, filter_query
+        )
+        file_name = f"{form_id or workspace_id}-responses.{export_format.value}"
+        return StreamingResponse(
+            self._stream_export(export_query),
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
+        )
+
+    async def create_export_query(
+        self,
+        workspace_id: PydanticObjectId,
+        user: User,
+        export_format: ExportFormat,
+        form_id: str = None,
+        filter_query: FormResponseFilterQuery = None,
+    ) -> ResponseExportQuery:
+        await self._workspace_user_service.check_user_has_access_in_workspace(
+            workspace_id, user
+        )
+        if form_id:
+            workspace_form = (
+                await self._workspace_form_repo.get_workspace_form_in_workspace(
+                    workspace_id, form_id
+                )
+            )
+            form_ids = [workspace_form.form_id]
+        else:
+            form_ids = await self._workspace_form_repo.get_form_ids_in_workspace(
+                workspace_id
+            )
+        forms = await self._form_repo.get_forms_fields(form_ids)
+        return ResponseExportQuery(
+            export_format=export_format,
+            form_ids=form_ids,
+            filters=filter_query.dict(exclude_none=True) if filter_query else {},
+            fields=get_export_fields(forms),
+        )
+
+    async def count_export_responses(self, export_query: ResponseExportQuery) -> int:
+        match_query = compile_filter(
+            FormResponseFilterQuery(**export_query.filters)
+        ).base
+        return await self._form_response_repo.count_responses_in_forms(
+            export_query.form_ids, match_query
+        )
+
+    async def iter_export_chunks(
+        self,
+        export_query: ResponseExportQuery,
+        after_id: Optional[PydanticObjectId] = None,
+    ) -> AsyncIterator[Tuple[bytes, int, PydanticObjectId]]:
+        """
+        Encodes the responses of the export a batch at a time.
+
+        Yields:
+            Tuple[bytes, int, PydanticObjectId]: The encoded batch, its number of
+                responses and the _id of its last response, the export can be
+                resumed after it.
+        """
+        encoder = ResponseExportEncoder(export_query.export_format, export_query.fields)
+        match_query = compile_filter(
+            FormResponseFilterQuery(**export_query.filters)
+        ).base
+        async for batch in self._form_response_repo.iter_response_batches(
+            export_query.form_ids,
+            match_query,
+            after_id=after_id,
+            batch_size=settings.export_settings.BATCH_SIZE,
+        ):
+            rows = [
+                flatten_response(response, export_query.fields) for response in batch
+            ]
+            yield encoder.encode(rows), len(rows), batch[-1]["_id"]
+
+    async def _stream_export(
+        self, export_query: ResponseExportQuery
+    ) -> AsyncIterator[bytes]:
+        yield ResponseExportEncoder(
+            export_query.export_format, export_query.fields
+        ).encode_header()
+        async for chunk, _, _ in self.iter_export_chunks(export_query):
+            yield chunk
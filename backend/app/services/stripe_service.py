@@ -3,39 +3,37 @@ from fastapi import Request
 from backend.app.services.form_plugin_provider_service import FormPluginProviderService
 from backend.app.services.plugin_proxy_service import PluginProxyService
 from backend.app.services.workspace_service import WorkspaceService
+from backend.app.utils.upstream_client import AUTH_UPSTREAM, upstream_clients
 from backend.config import settings
-from common.services.http_client import HttpClient
 from common.services.jwt_service import JwtService
 
 
 class StripeService:
     def __init__(
         self,
-        http_client: HttpClient,
         plugin_proxy_service: PluginProxyService,
         form_provider_service: FormPluginProviderService,
         jwt_service: JwtService,
         workspace_service: WorkspaceService,
     ):
-        self.http_client = http_client
         self.plugin_proxy_service = plugin_proxy_service
         self.form_provider_service = form_provider_service
         self.jwt_service = jwt_service
         self.workspace_service = workspace_service
 
     async def get_plans(self):
-        return await self.http_client.get(
+        return await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/stripe/plans"
         )
 
     async def create_checkout_session(self, user, price_id: str):
-        return await self.http_client.get(
+        return await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/stripe/session/create/checkout",
             params={"user_id": user.id, "price_id": price_id},
         )
 
     async def create_portal_session(self, user):
-        return await self.http_client.get(
+        return await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/stripe/session/create/portal",
             params={"user_id": user.id},
         )
@@ -43,7 +41,8 @@ class StripeService:
     async def webhooks(self, request: Request):
         body = await request.body()
         signature = request.headers.get("stripe-signature")
-        response = await self.http_client.post(
+        response = await upstream_clients.get(AUTH_UPSTREAM).request(
+            "POST",
             settings.auth_settings.BASE_URL + "/stripe/webhooks",
             params={"stripe_signature": signature},
             content=body,
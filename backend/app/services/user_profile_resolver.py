@@ -0,0 +1,196 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from backend.app.utils.ttl_cache import TTLCache
+from backend.app.utils.upstream_client import AUTH_UPSTREAM, upstream_clients
+from backend.config import redis, settings
+
+REDIS_KEY_PREFIX = "user_profile:"
+
+# Time the profile was fetched at and the profile, None if the user doesn't exist
+ProfileEntry = Tuple[float, Optional[Dict[str, Any]]]
+
+
+def _consume_exception(future: asyncio.Future):
+    # The revalidations in the background are not awaited by anyone
+    if not future.cancelled():
+        future.exception()
+
+
+class UserProfileResolver:
+    """
+    Resolves the profiles of the users from the `/users` endpoint of the auth
+    service.
+
+    The lookups issued in the same event loop tick are coalesced into batched
+    calls. The profiles are cached in memory and, if enabled, in Redis to share
+    them between the workers. A profile older than the cache TTL is still served
+    while it is revalidated in the background, until it is older than the stale
+    TTL as well.
+    """
+
+    def __init__(self):
+        auth_settings = settings.auth_settings
+        self._profiles = TTLCache(
+            ttl_seconds=auth_settings.USER_PROFILE_CACHE_SECONDS
+            + auth_settings.USER_PROFILE_STALE_SECONDS,
+            max_size=auth_settings.USER_PROFILE_CACHE_SIZE,
+        )
+        self._queued_ids: Set[str] = set()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._redis: Optional[Redis] = None
+
+    async def get_users_info(self, user_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Returns the profiles of the users in the order of the given ids, the users
+        that don't exist are left out.
+        """
+        user_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        fresh_seconds = settings.auth_settings.USER_PROFILE_CACHE_SECONDS
+        now = time.time()
+        profiles = {}
+        lookups = {}
+        for user_id in user_ids:
+            entry: Optional[ProfileEntry] = self._profiles.get(user_id)
+            if entry is None:
+                lookups[user_id] = self._request(user_id)
+                continue
+            fetched_at, profile = entry
+            profiles[user_id] = profile
+            if now - fetched_at > fresh_seconds:
+                self._request(user_id)
+        if lookups:
+            # Shielded as the lookups are shared with the other callers
+            results = await asyncio.gather(
+                *[asyncio.shield(lookup) for lookup in lookups.values()]
+            )
+            profiles.update(zip(lookups, results))
+        return [profiles[user_id] for user_id in user_ids if profiles.get(user_id)]
+
+    async def close(self):
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+
+    def _request(self, user_id: str) -> asyncio.Future:
+        lookup = self._in_flight.get(user_id)
+        if lookup:
+            return lookup
+        loop = asyncio.get_running_loop()
+        lookup = loop.create_future()
+        lookup.add_done_callback(_consume_exception)
+        self._in_flight[user_id] = lookup
+        if not self._queued_ids:
+            loop.call_soon(self._dispatch)
+        self._queued_ids.add(user_id)
+        return lookup
+
+    def _dispatch(self):
+        user_ids = list(self._queued_ids)
+        self._queued_ids.clear()
+        batch_size = settings.auth_settings.USER_PROFILE_BATCH_SIZE
+        for index in range(0, len(user_ids), batch_size):
+            task = asyncio.create_task(
+                self._resolve_batch(user_ids[index : index + batch_size])
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve_batch(self, user_ids: List[str]):
+        try:
+            entries = await self._get_cached_entries(user_ids)
+            missing_ids = [user_id for user_id in user_ids if user_id not in entries]
+            if missing_ids:
+                fetched_profiles = await self._fetch_profiles(missing_ids)
+                fetched_at = time.time()
+                fetched_entries = {
+                    user_id: (fetched_at, fetched_profiles.get(user_id))
+                    for user_id in missing_ids
+                }
+                await self._set_cached_entries(fetched_entries)
+                entries.update(fetched_entries)
+            for user_id, entry in entries.items():
+                self._profiles.set(user_id, entry)
+                lookup = self._in_flight.pop(user_id, None)
+                if lookup and not lookup.done():
+                    lookup.set_result(entry[1])
+        except Exception as e:
+            logger.opt(exception=e).error(
+                f"Failed to resolve the profiles of {len(user_ids)} users."
+            )
+            for user_id in user_ids:
+                lookup = self._in_flight.pop(user_id, None)
+                if lookup and not lookup.done():
+                    lookup.set_exception(e)
+
+    async def _fetch_profiles(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        response = await upstream_clients.get(AUTH_UPSTREAM).request(
+            "GET",
+            f"{settings.auth_settings.BASE_URL}/users",
+            params={"user_ids": user_ids},
+        )
+        response.raise_for_status()
+        users_info = response.json().get("users_info", [])
+        return {user_info.get("_id"): user_info for user_info in users_info}
+
+    def _get_redis(self) -> Optional[Redis]:
+        if not settings.auth_settings.USER_PROFILE_USE_REDIS:
+            return None
+        if self._redis is None:
+            self._redis = Redis(
+                host=redis.REDIS_HOST,
+                port=redis.REDIS_PORT,
+                username=redis.REDIS_USERNAME,
+                password=redis.REDIS_PASSWORD,
+            )
+        return self._redis
+
+    async def _get_cached_entries(self, user_ids: List[str]) -> Dict[str, ProfileEntry]:
+        # Only the fresh profiles shared by the other workers are used, the
+        # stale ones are fetched again
+        redis_client = self._get_redis()
+        if not redis_client:
+            return {}
+        try:
+            values = await redis_client.mget(
+                [REDIS_KEY_PREFIX + user_id for user_id in user_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get the user profiles from Redis: {e}")
+            return {}
+        fresh_after = time.time() - settings.auth_settings.USER_PROFILE_CACHE_SECONDS
+        entries = {}
+        for user_id, value in zip(user_ids, values):
+            if value is None:
+                continue
+            entry = json.loads(value)
+            if entry["fetched_at"] > fresh_after:
+                entries[user_id] = (entry["fetched_at"], entry["profile"])
+        return entries
+
+    async def _set_cached_entries(self, entries: Dict[str, ProfileEntry]):
+        redis_client = self._get_redis()
+        if not redis_client:
+            return
+        auth_settings = settings.auth_settings
+        try:
+            async with redis_client.pipeline(transaction=False) as pipeline:
+                for user_id, (fetched_at, profile) in entries.items():
+                    pipeline.set(
+                        REDIS_KEY_PREFIX + user_id,
+                        json.dumps({"fetched_at": fetched_at, "profile": profile}),
+                        ex=auth_settings.USER_PROFILE_CACHE_SECONDS
+                        + auth_settings.USER_PROFILE_STALE_SECONDS,
+                    )
+                await pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Failed to cache the user profiles in Redis: {e}")
+
+
+user_profile_resolver = UserProfileResolver()
@@ -7,11 +7,15 @@ from starlette.responses import Response
 from backend.app.exceptions import HTTPException
 from backend.app.schemas.blacklisted_refresh_tokens import BlackListedRefreshTokens
 from backend.app.services.auth_cookie_service import set_access_token_to_response
+from backend.app.services.refresh_token_blacklist import (
+    get_blacklist_key,
+    refresh_token_blacklist,
+)
 from backend.config import settings
 from common.models.user import User
 
 
-def get_logged_user(request: Request, response: Response) -> User:
+async def get_logged_user(request: Request, response: Response) -> User:
     token = get_access_token(request)
     try:
         return get_user_from_token(token)
@@ -20,7 +24,7 @@ def get_logged_user(request: Request, response: Response) -> User:
         refresh_token = get_refresh_token(request)
         try:
             user = get_user_from_token(refresh_token)
-            check_if_refresh_token_is_blacklisted(refresh_token)
+            await check_if_refresh_token_is_blacklisted(refresh_token)
             set_access_token_to_response(user=user, response=response)
             return user
         except Exception as e:
@@ -38,9 +42,9 @@ def get_user_from_token(token: str) -> User:
     return user
 
 
-def get_user_if_logged_in(request: Request, response: Response) -> User | None:
+async def get_user_if_logged_in(request: Request, response: Response) -> User | None:
     try:
-        return get_logged_user(request=request, response=response)
+        return await get_logged_user(request=request, response=response)
     except HTTPException:
         return None
 
@@ -59,17 +63,16 @@ def get_refresh_token(request: Request) -> str:
     return refresh_token
 
 
-def get_logged_admin(request: Request, response: Response):
-    user = get_logged_user(request, response)
+async def get_logged_admin(request: Request, response: Response):
+    user = await get_logged_user(request, response)
     if user.is_admin():
         return user
     else:
         raise HTTPException(403, "You are not authorized to perform this action.")
 
 
-def check_if_refresh_token_is_blacklisted(token: str):
-    blacklisted_tokens = BlackListedRefreshTokens.find_sync({"token": token})
-    if len(blacklisted_tokens) != 0:
+async def check_if_refresh_token_is_blacklisted(token: str):
+    if await refresh_token_blacklist.is_blacklisted(token):
         raise HTTPException(401, "Invalid JWT")
 
 
@@ -81,6 +84,9 @@ async def add_refresh_token_to_blacklist(request: Request):
         algorithms=["HS256"],
     )
     token_to_save = BlackListedRefreshTokens(
-        token=refresh_token, expiry=jwt_response.get("exp")
+        token=refresh_token,
+        jti=get_blacklist_key(refresh_token),
+        expiry=jwt_response.get("exp"),
     )
     await token_to_save.save()
+    refresh_token_blacklist.add(token_to_save.jti)
@@ -5,9 +5,13 @@ from beanie import PydanticObjectId
 from starlette.requests import Request
 
 from backend.app.exceptions import HTTPException
+from backend.app.models.form_search_index import FormSearchIndex
+from backend.app.models.settings_patch import SettingsPatchDto
 from backend.app.models.workspace import WorkspaceFormSettings
 from backend.app.repositories.workspace_form_repository import WorkspaceFormRepository
 from backend.app.schedulers.form_schedular import FormSchedular
+from backend.app.schedulers.sync_executor import SyncPriority
+from backend.app.schedulers.worker_coordinator import WorkerCoordinator
 from backend.app.services.form_import_service import FormImportService
 from backend.app.services.form_plugin_provider_service import FormPluginProviderService
 from backend.app.services.form_response_service import FormResponseService
@@ -15,7 +19,6 @@ from backend.app.services.form_service import FormService
 from backend.app.services.plugin_proxy_service import PluginProxyService
 from backend.app.services.responder_groups_service import ResponderGroupsService
 from backend.app.services.workspace_user_service import WorkspaceUserService
-from backend.app.utils import AiohttpClient
 from backend.config import settings
 from common.enums.plan import Plans
 from common.models.form_import import FormImportRequestBody
@@ -33,6 +36,7 @@ class WorkspaceFormService:
         form_schedular: FormSchedular,
         form_import_service: FormImportService,
         schedular: AsyncIOScheduler,
+        worker_coordinator: WorkerCoordinator,
         form_response_service: FormResponseService,
         responder_groups_service: ResponderGroupsService,
     ):
@@ -44,6 +48,7 @@ class WorkspaceFormService:
         self.form_schedular = form_schedular
         self.form_import_service = form_import_service
         self.schedular = schedular
+        self.worker_coordinator = worker_coordinator
         self.form_response_service = form_response_service
         self.responder_groups_service = responder_groups_service
 
@@ -74,15 +79,16 @@ class WorkspaceFormService:
         response_data = await self.convert_form(
             provider=provider, request=request, form_import=form_import
         )
-        standard_form = (
+        import_result = (
             await self.form_import_service.save_converted_form_and_responses(
                 response_data, form_import.response_data_owner
             )
         )
-        if not standard_form:
+        if not import_result:
             raise HTTPException(
                 HTTPStatus.INTERNAL_SERVER_ERROR, content="Failed to import form"
             )
+        standard_form = import_result.form
         embed_url = (
             standard_form.settings.embed_url
             if standard_form.settings and standard_form.settings.embed_url
@@ -101,7 +107,13 @@ class WorkspaceFormService:
                 provider=standard_form.settings.provider,
                 private=not standard_form.settings.is_public,
             ),
+            search_index=FormSearchIndex.from_form(
+                standard_form.title, standard_form.description
+            ),
         )
+        # Forms owned by other workers are scheduled by them on their next reconcile
+        if not self.worker_coordinator.owns_form(standard_form.form_id):
+            return
         self.schedular.add_job(
             self.form_schedular.update_form,
             "interval",
@@ -118,15 +130,18 @@ class WorkspaceFormService:
         )
 
     async def convert_form(self, *, provider, request, form_import):
-        provider_url = await self.form_provider_service.get_provider_url(provider)
-        response = await AiohttpClient.get_aiohttp_client().post(
-            url=f"{provider_url}/{provider}/forms/convert/standard_form",
-            json=form_import.form,
+        return await self.form_schedular.perform_request(
+            provider=provider,
+            append_url="/convert/standard_form",
+            method="POST",
             cookies=request.cookies,
-            timeout=60,
+            json=form_import.form,
+            priority=SyncPriority.MANUAL,
+            plugin_operation="convert_form",
+            plugin_call=lambda plugin: plugin.convert_form(
+                form_import.form, cookies=request.cookies
+            ),
         )
-        response_data = await response.json()
-        return response_data
 
     async def check_if_user_can_import_more_forms(
         self, user: User, workspace_id: PydanticObjectId
@@ -156,12 +171,34 @@ class WorkspaceFormService:
         )
         if len(workspace_ids) > 1:
             return "Form deleted form workspace."
-        self.schedular.remove_job(f"{workspace_form.settings.provider}_{form_id}")
+        job_id = f"{workspace_form.settings.provider}_{form_id}"
+        if self.schedular.get_job(job_id):
+            self.schedular.remove_job(job_id)
         await self.form_service.delete_form(form_id=form_id)
         await self.form_response_service.delete_form_responses(form_id=form_id)
         await self.form_response_service.delete_deletion_requests(form_id=form_id)
+        await self.form_schedular.remove_sync_state(form_id=form_id)
         return "Form deleted form workspace."
 
+    async def patch_form_settings(
+        self,
+        workspace_id: PydanticObjectId,
+        form_id: str,
+        settings: SettingsPatchDto,
+        user: User,
+    ):
+        workspace_form = await self.form_service.patch_settings_in_workspace_form(
+            workspace_id, form_id, settings, user
+        )
+        if (
+            settings.syncIntervalMinMinutes is not None
+            or settings.syncIntervalMaxMinutes is not None
+        ):
+            await self.form_schedular.apply_interval_bounds(
+                workspace_form.settings.provider, workspace_form.form_id
+            )
+        return workspace_form
+
     async def get_form_ids_in_workspace(self, workspace_id: PydanticObjectId):
         return await self.workspace_form_repository.get_form_ids_in_workspace(
             workspace_id
@@ -11,14 +11,15 @@ from backend.app.models.workspace_member_dto import WorkspaceMemberDto
 from backend.app.repositories.workspace_invitation_repo import WorkspaceInvitationRepo
 from backend.app.schemas.workspace import WorkspaceDocument
 from backend.app.services.auth_cookie_service import get_expiry_epoch_after
+from backend.app.services.user_profile_resolver import user_profile_resolver
 from backend.app.services.workspace_form_service import WorkspaceFormService
 from backend.app.services.workspace_user_service import WorkspaceUserService
+from backend.app.utils.upstream_client import AUTH_UPSTREAM, upstream_clients
 from backend.config import settings
 from common.constants import MESSAGE_NOT_FOUND
 from common.enums.plan import Plans
 from common.enums.workspace_invitation_status import InvitationStatus
 from common.models.user import User
-from common.services.http_client import HttpClient
 
 
 class WorkspaceMembersService:
@@ -26,12 +27,10 @@ class WorkspaceMembersService:
         self,
         workspace_user_service: WorkspaceUserService,
         workspace_invitation_repo: WorkspaceInvitationRepo,
-        http_client: HttpClient,
         workspace_form_service: WorkspaceFormService,
     ):
         self.workspace_user_service = workspace_user_service
         self.workspace_invitation_repository = workspace_invitation_repo
-        self.http_client = http_client
         self.workspace_form_service = workspace_form_service
 
     async def get_workspace_members(self, workspace_id: PydanticObjectId, user: User):
@@ -75,7 +74,7 @@ class WorkspaceMembersService:
                 workspace_id=workspace_id, invitation=invitation
             )
         )
-        await self.http_client.get(
+        await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/users/invite/send/mail",
             params={
                 "workspace_title": workspace.title,
@@ -169,10 +168,7 @@ class WorkspaceMembersService:
     async def _get_user_info_from_ids(
         self, user_ids: List[PydanticObjectId]
     ) -> List[Any]:
-        response_data = await self.http_client.get(
-            settings.auth_settings.BASE_URL + "/users", params={"user_ids": user_ids}
-        )
-        return response_data.get("users_info")
+        return await user_profile_resolver.get_users_info(user_ids)
 
     async def delete_workspace_member(self, workspace_id, user_id, user):
         await self.workspace_user_service.check_is_admin_in_workspace(
@@ -14,31 +14,38 @@ from backend.app.models.workspace import (
     WorkspaceResponseDto,
 )
 from backend.app.repositories.workspace_repository import WorkspaceRepository
+from backend.app.repositories.workspace_user_repository import (
+    invalidate_workspace_permissions,
+)
 from backend.app.schemas.allowed_origin import AllowedOriginsDocument
 from backend.app.schemas.workspace import WorkspaceDocument
 from backend.app.schemas.workspace_user import WorkspaceUserDocument
+from backend.app.services.allowed_origin_registry import allowed_origin_registry
 from backend.app.services.aws_service import AWSS3Service
 from backend.app.services.form_response_service import FormResponseService
 from backend.app.services.workspace_form_service import WorkspaceFormService
 from backend.app.services.workspace_user_service import WorkspaceUserService
+from backend.app.utils.request_cache import invalidate_request_cache
+from backend.app.utils.upstream_client import (
+    AUTH_UPSTREAM,
+    HTTPS_CERT_UPSTREAM,
+    upstream_clients,
+)
 from backend.config import settings
 from common.constants import MESSAGE_FORBIDDEN
 from common.enums.plan import Plans
 from common.models.user import User
-from common.services.http_client import HttpClient
 
 
 class WorkspaceService:
     def __init__(
         self,
-        http_client: HttpClient,
         workspace_repo: WorkspaceRepository,
         aws_service: AWSS3Service,
         workspace_user_service: WorkspaceUserService,
         workspace_form_service: WorkspaceFormService,
         form_response_service: FormResponseService,
     ):
-        self.http_client = http_client
         self._workspace_repo = workspace_repo
         self._aws_service = aws_service
         self._workspace_user_service = workspace_user_service
@@ -95,6 +102,7 @@ class WorkspaceService:
             banner_image_file=banner_image_file,
         )
         workspace_document = await workspace_document.save()
+        invalidate_request_cache("workspaces")
         existing_workspace_user = await WorkspaceUserDocument.find_one(
             {
                 "workspace_id": workspace_document.id,
@@ -108,6 +116,7 @@ class WorkspaceService:
                 roles=[WorkspaceRoles.ADMIN],
             )
             await workspace_user.save()
+            invalidate_workspace_permissions(workspace_document.id, user.id)
         return WorkspaceResponseDto(**workspace_document.dict())
 
     async def patch_workspace(
@@ -173,6 +182,7 @@ class WorkspaceService:
                     await AllowedOriginsDocument.find_one(
                         {"origin": "https://" + existing_custom_domain or ""}
                     ).delete()
+                    allowed_origin_registry.remove("https://" + existing_custom_domain)
                     allowed_origin = await AllowedOriginsDocument.find_one(
                         {"origin": "https://" + workspace_patch.custom_domain}
                     )
@@ -182,6 +192,9 @@ class WorkspaceService:
                                 origin="https://" + workspace_patch.custom_domain
                             )
                         )
+                    allowed_origin_registry.add(
+                        "https://" + workspace_patch.custom_domain
+                    )
                     await self.update_https_server_for_certificate(
                         old_domain=workspace_document.custom_domain,
                         new_domain=workspace_patch.custom_domain,
@@ -218,6 +231,13 @@ class WorkspaceService:
         workspace_document = await self._workspace_repo.get_workspace_by_id(
             workspace_id=workspace_id
         )
+        if workspace_document.custom_domain:
+            await AllowedOriginsDocument.find_one(
+                {"origin": "https://" + workspace_document.custom_domain}
+            ).delete()
+            allowed_origin_registry.remove(
+                "https://" + workspace_document.custom_domain
+            )
         await self.update_https_server_for_certificate(
             old_domain=workspace_document.custom_domain
         )
@@ -238,7 +258,7 @@ class WorkspaceService:
         self, workspace_id: PydanticObjectId, receiver_email: EmailStr
     ):
         workspace = await self._workspace_repo.get_workspace_by_id(workspace_id)
-        await self.http_client.get(
+        await upstream_clients.get(AUTH_UPSTREAM).get_json(
             settings.auth_settings.BASE_URL + "/auth/otp/send",
             params={
                 "receiver_email": receiver_email,
@@ -280,6 +300,8 @@ class WorkspaceService:
                 workspace.disabled = True
             workspace.custom_domain_disabled = True
             await workspace.save()
+            invalidate_workspace_permissions(workspace.id)
+            invalidate_request_cache("workspaces")
             await self._workspace_user_service.disable_other_users_in_workspace(
                 workspace_id=workspace.id, user_id=PydanticObjectId(user_id)
             )
@@ -290,6 +312,8 @@ class WorkspaceService:
             workspace.disabled = False
             workspace.custom_domain_disabled = False
             await workspace.save()
+            invalidate_workspace_permissions(workspace.id)
+            invalidate_request_cache("workspaces")
             await self._workspace_user_service.enable_all_users_in_workspace(
                 workspace_id=workspace.id
             )
@@ -299,13 +323,15 @@ class WorkspaceService:
     ):
         try:
             if old_domain:
-                await self.http_client.delete(
+                await upstream_clients.get(HTTPS_CERT_UPSTREAM).request(
+                    "DELETE",
                     f"{settings.https_cert_api_settings.host}/domains",
                     headers={"api_key": settings.https_cert_api_settings.key},
                     params={"domain": new_domain},
                 )
             if new_domain:
-                await self.http_client.post(
+                await upstream_clients.get(HTTPS_CERT_UPSTREAM).request(
+                    "POST",
                     f"{settings.https_cert_api_settings.host}/domains",
                     headers={"api_key": settings.https_cert_api_settings.key},
                     params={"domain": new_domain},
@@ -366,3 +392,4 @@ async def create_workspace(user: User):
             workspace_id=workspace.id, user_id=user.id, roles=[WorkspaceRoles.ADMIN]
         )
         await workspace_user.save()
+        invalidate_workspace_permissions(workspace.id, user.id)
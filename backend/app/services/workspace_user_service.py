@@ -5,7 +5,6 @@ from beanie import PydanticObjectId
 from backend.app.exceptions import HTTPException
 from backend.app.models.enum.workspace_roles import WorkspaceRoles
 from backend.app.repositories.workspace_user_repository import WorkspaceUserRepository
-from backend.app.schemas.workspace import WorkspaceDocument
 from backend.app.schemas.workspace_user import WorkspaceUserDocument
 from backend.config import settings
 from common.constants import MESSAGE_FORBIDDEN
@@ -19,11 +18,10 @@ class WorkspaceUserService:
     async def check_user_has_access_in_workspace(
         self, workspace_id: PydanticObjectId, user: User
     ):
-        workspace = await WorkspaceDocument.find_one({"_id": workspace_id})
-        has_access = await self.workspace_user_repository.has_user_access_in_workspace(
-            workspace_id, user
+        permission = await self.workspace_user_repository.get_workspace_permission(
+            workspace_id, user.id
         )
-        if not has_access or workspace.disabled:
+        if not permission or not permission.has_access or permission.workspace_disabled:
             raise HTTPException(
                 status_code=HTTPStatus.FORBIDDEN, content=MESSAGE_FORBIDDEN
             )
@@ -31,11 +29,10 @@ class WorkspaceUserService:
     async def check_is_admin_in_workspace(
         self, workspace_id: PydanticObjectId, user: User
     ):
-        workspace = await WorkspaceDocument.find_one({"_id": workspace_id})
-        is_admin = await self.workspace_user_repository.is_user_admin_in_workspace(
-            workspace_id=workspace_id, user=user
+        permission = await self.workspace_user_repository.get_workspace_permission(
+            workspace_id, user.id
         )
-        if not is_admin or workspace.disabled:
+        if not permission or not permission.is_admin or permission.workspace_disabled:
             raise HTTPException(
                 status_code=HTTPStatus.FORBIDDEN, content=MESSAGE_FORBIDDEN
             )
@@ -1,10 +1,10 @@
 """Application implementation - utilities.
 
 Resources:
-    1. https://aioredis.readthedocs.io/en/latest/
+    1. https://www.python-httpx.org/advanced/
 
 """
-from backend.app.utils.aiohttp_client import AiohttpClient
+from backend.app.utils.upstream_client import UpstreamClients, upstream_clients
 
 
-__all__ = "AiohttpClient"
+__all__ = ("UpstreamClients", "upstream_clients")
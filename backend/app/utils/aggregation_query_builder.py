@@ -1,27 +1,110 @@
-from camel_converter import to_camel, to_snake
+from beanie import PydanticObjectId
 
 from backend.app.models.filter_queries.sort import SortRequest, SortOrder
+from backend.app.utils.filter_compiler import compile_filter
 
 
 def create_filter_pipeline(
     filter_object=None, sort: SortRequest = None, default_sort: bool = True
 ):
+    """
+    Creates the stages matching all the filters of the query and sorting the
+    documents. The queries with joins should match the conditions of
+    `compile_filter` on the base collection ahead of the joins instead.
+    """
     pipeline = []
-    if filter_object:
-        matching_dict = filter_object.dict(exclude_unset=True, exclude_none=True)
-        if matching_dict:
-            all_matchers = []
-            for k, v in matching_dict.items():
-                all_matchers.append(
-                    {
-                        "$or": [
-                            {to_camel(k): {"$regex": v, "$options": "i"}},
-                            {to_snake(k): {"$regex": v, "$options": "i"}},
-                        ]
-                    }
-                )
-            pipeline.append({"$match": {"$and": all_matchers}})
+    compiled_filter = compile_filter(filter_object)
+    match_query = {**compiled_filter.base, **compiled_filter.joined}
+    if match_query:
+        pipeline.append({"$match": match_query})
     if sort and sort.sort_by and default_sort:
         sort_order = 1 if sort.sort_order == SortOrder.ASCENDING else -1
         pipeline.append({"$sort": {sort.sort_by: sort_order}})
     return pipeline
+
+
+def create_authorization_pipeline(
+    workspace_id: PydanticObjectId,
+    user_id: str | None,
+    form_id_field: str = "form_id",
+):
+    """
+    Creates the stages joining the authorization facts of the user in the
+    workspace to the matched documents as an `authorization` field, which can
+    be parsed into `AuthorizationFacts`.
+
+    Args:
+        workspace_id (PydanticObjectId): The workspace the documents are
+            requested in.
+        user_id (str | None): The requesting user.
+        form_id_field (str): The field of the documents holding their form id.
+    """
+    workspace_id = PydanticObjectId(workspace_id)
+    user_id = PydanticObjectId(user_id) if user_id else None
+    return [
+        {
+            "$lookup": {
+                "from": "workspace_forms",
+                "let": {"form_id": f"${form_id_field}"},
+                "pipeline": [
+                    {
+                        "$match": {
+                            "workspace_id": workspace_id,
+                            "$expr": {"$eq": ["$form_id", "$$form_id"]},
+                        }
+                    },
+                    {"$limit": 1},
+                    {"$project": {"_id": 1}},
+                ],
+                "as": "_workspace_forms",
+            }
+        },
+        {
+            "$lookup": {
+                "from": "workspace_users",
+                "pipeline": [
+                    {"$match": {"workspace_id": workspace_id, "user_id": user_id}},
+                    {"$project": {"disabled": 1}},
+                ],
+                "as": "_workspace_users",
+            }
+        },
+        {
+            "$lookup": {
+                "from": "workspaces",
+                "pipeline": [
+                    {"$match": {"_id": workspace_id}},
+                    {"$project": {"disabled": 1}},
+                ],
+                "as": "_workspaces",
+            }
+        },
+        {
+            "$set": {
+                "authorization": {
+                    "in_workspace": {"$gt": [{"$size": "$_workspace_forms"}, 0]},
+                    "is_member": {
+                        "$anyElementTrue": [
+                            {
+                                "$map": {
+                                    "input": "$_workspace_users",
+                                    "in": {"$ne": ["$$this.disabled", True]},
+                                }
+                            }
+                        ]
+                    },
+                    "workspace_disabled": {
+                        "$anyElementTrue": [
+                            {
+                                "$map": {
+                                    "input": "$_workspaces",
+                                    "in": {"$eq": ["$$this.disabled", True]},
+                                }
+                            }
+                        ]
+                    },
+                }
+            }
+        },
+        {"$unset": ["_workspace_forms", "_workspace_users", "_workspaces"]},
+    ]
@@ -0,0 +1,38 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Probabilistic set answering whether a key might have been added. A negative
+    answer is always correct while a positive one is wrong with the configured
+    false positive rate.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = math.ceil(
+            -capacity * math.log(false_positive_rate) / (math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray(math.ceil(self.size / 8))
+
+    def add(self, key: str):
+        for position in self._get_positions(key):
+            self._bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position // 8] & (1 << (position % 8))
+            for position in self._get_positions(key)
+        )
+
+    def _get_positions(self, key: str):
+        # Double hashing derives all the positions from a single digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "big")
+        second_hash = int.from_bytes(digest[8:], "big") | 1
+        return (
+            (first_hash + index * second_hash) % self.size
+            for index in range(self.hash_count)
+        )
@@ -0,0 +1,13 @@
+import datetime as dt
+
+
+def as_utc(value: dt.datetime) -> dt.datetime:
+    """
+    Returns the given datetime as a timezone aware datetime in UTC.
+
+    Naive datetimes are considered to be in UTC as this is how they are stored
+    in and returned by mongo.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
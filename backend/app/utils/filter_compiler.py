@@ -0,0 +1,98 @@
+import re
+from http import HTTPStatus
+from typing import Any, Collection, Dict, NamedTuple
+
+from pydantic import ValidationError, parse_obj_as
+
+from backend.app.exceptions import HTTPException
+from backend.app.models.filter_queries.base_filter_query import (
+    BaseFilterQuery,
+    FilterOperator,
+)
+from backend.app.utils.search_tokens import tokenize
+
+RANGE_SEPARATOR = ".."
+PREFIX_WILDCARD = "*"
+
+
+class CompiledFilter(NamedTuple):
+    # Conditions on the fields of the queried collection, matched before the joins
+    base: Dict[str, Any]
+    # Conditions on the fields set by the joins of the query
+    joined: Dict[str, Any]
+
+
+def compile_filter(
+    filter_object: BaseFilterQuery = None, joined_fields: Collection[str] = ()
+) -> CompiledFilter:
+    """
+    Compiles the filters of the query into Mongo conditions on the stored fields,
+    which can use the indexes of the fields unlike unanchored regexes.
+
+    Args:
+        filter_object (BaseFilterQuery, optional): The filter query.
+        joined_fields (Collection[str]): The stored names of the fields set by
+            the joins of the query, their conditions can only be matched after
+            the joins.
+
+    Raises:
+        HTTPException: If a filter value uses an operator the filter doesn't
+            support or can't be parsed.
+    """
+    compiled_filter = CompiledFilter({}, {})
+    if not filter_object:
+        return compiled_filter
+    for name, value in filter_object.dict(exclude_none=True).items():
+        field = filter_object.__fields__[name]
+        stored_name = field.field_info.extra.get("stored_name", name)
+        operators = field.field_info.extra.get("operators", (FilterOperator.EXACT,))
+        value_type = field.field_info.extra.get("value_type", str)
+        condition = _compile_condition(field.alias, value, operators, value_type)
+        target = (
+            compiled_filter.joined
+            if stored_name in joined_fields
+            else compiled_filter.base
+        )
+        target[stored_name] = condition
+    return compiled_filter
+
+
+def _compile_condition(alias: str, value: Any, operators, value_type) -> Any:
+    if not isinstance(value, str):
+        return value
+    if FilterOperator.TOKENS in operators:
+        *words, last_word = tokenize(value) or [None]
+        if last_word:
+            # The last word is matched as a prefix for search-as-you-type
+            condition = {"$regex": "^" + re.escape(last_word)}
+            if words:
+                condition["$all"] = words
+            return condition
+    elif FilterOperator.RANGE in operators and RANGE_SEPARATOR in value:
+        lower, upper = value.split(RANGE_SEPARATOR, 1)
+        condition = {}
+        if lower:
+            condition["$gte"] = _parse_value(alias, lower, value_type)
+        if upper:
+            condition["$lte"] = _parse_value(alias, upper, value_type)
+        if condition:
+            return condition
+    elif FilterOperator.PREFIX in operators and value.endswith(PREFIX_WILDCARD):
+        # Anchored and case sensitive so the index bounds can be derived from it
+        return {"$regex": "^" + re.escape(value[: -len(PREFIX_WILDCARD)])}
+    elif FilterOperator.EXACT in operators:
+        return _parse_value(alias, value, value_type)
+    raise HTTPException(
+        HTTPStatus.BAD_REQUEST,
+        f"Filter {alias} supports the operators: "
+        + ", ".join(operator.value for operator in operators),
+    )
+
+
+def _parse_value(alias: str, value: str, value_type) -> Any:
+    try:
+        return parse_obj_as(value_type, value)
+    except ValidationError:
+        raise HTTPException(
+            HTTPStatus.BAD_REQUEST, f"Invalid value of filter {alias}: {value}"
+        )
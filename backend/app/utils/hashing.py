@@ -0,0 +1,23 @@
+import hashlib
+import json
+from typing import Any
+
+
+def compute_content_hash(data: Any) -> str:
+    """
+    Returns a stable sha256 hex digest for JSON serializable data.
+
+    Keys are sorted and separators are fixed so that the same content always
+    produces the same hash regardless of dictionary ordering. Values which are
+    not JSON serializable (datetime, ObjectId...) are hashed by their string form.
+
+    Args:
+        data (Any): The data to hash.
+
+    Returns:
+        str: The hex digest of the canonicalized data.
+    """
+    canonical_data = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical_data.encode("utf-8")).hexdigest()
@@ -0,0 +1,110 @@
+import base64
+import binascii
+import json
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional
+
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+
+from backend.app.exceptions import HTTPException
+from backend.app.models.filter_queries.sort import SortOrder, SortRequest
+
+
+def encode_cursor(sort: SortRequest, document: Dict[str, Any]) -> str:
+    """
+    Encodes the position of the document in the listing as an opaque cursor.
+
+    Args:
+        sort (SortRequest): The sort of the listing.
+        document (Dict[str, Any]): The last document of the page.
+
+    Returns:
+        str: The url safe cursor.
+    """
+    cursor = {
+        "sort_by": sort.sort_by,
+        "sort_order": sort.sort_order,
+        "value": _get_value(document, sort.sort_by),
+        "id": str(document["_id"]),
+    }
+    return base64.urlsafe_b64encode(
+        json.dumps(cursor, default=str, separators=(",", ":")).encode()
+    ).decode()
+
+
+def create_keyset_pipeline(
+    sort: SortRequest, cursor: Optional[str], size: int
+) -> List[Dict[str, Any]]:
+    """
+    Creates the stages selecting the page after the cursor. The documents are
+    sorted by the sort key with the _id as tiebreaker so the position of every
+    document is unique.
+
+    Args:
+        sort (SortRequest): The sort of the listing.
+        cursor (str, optional): The cursor of the previous page.
+        size (int): The size of the page. One more document is fetched to know if
+            there is a next page.
+
+    Returns:
+        List[Dict[str, Any]]: The aggregation pipeline stages.
+    """
+    direction = 1 if sort.sort_order == SortOrder.ASCENDING else -1
+    pipeline = []
+    if cursor:
+        value, last_id = _decode_cursor(cursor, sort)
+        pipeline.append(
+            {"$match": _create_after_query(sort.sort_by, direction, value, last_id)}
+        )
+    pipeline.extend(
+        [
+            {"$sort": {sort.sort_by: direction, "_id": direction}},
+            {"$limit": size + 1},
+        ]
+    )
+    return pipeline
+
+
+def _create_after_query(
+    sort_by: str, direction: int, value: Any, last_id: PydanticObjectId
+) -> Dict[str, Any]:
+    operator = "$gt" if direction == 1 else "$lt"
+    # Documents without the sort key are sorted before all the others
+    if value is None:
+        after_nulls = {sort_by: None, "_id": {operator: last_id}}
+        if direction == 1:
+            return {"$or": [after_nulls, {sort_by: {"$ne": None}}]}
+        return after_nulls
+    after_value = [
+        {sort_by: {operator: value}},
+        {sort_by: value, "_id": {operator: last_id}},
+    ]
+    if direction == -1:
+        after_value.append({sort_by: None})
+    return {"$or": after_value}
+
+
+def _decode_cursor(cursor: str, sort: SortRequest):
+    try:
+        decoded_cursor = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        last_id = PydanticObjectId(decoded_cursor["id"])
+        value = decoded_cursor["value"]
+        is_same_sort = (
+            decoded_cursor["sort_by"] == sort.sort_by
+            and decoded_cursor["sort_order"] == sort.sort_order
+        )
+    except (binascii.Error, InvalidId, ValueError, KeyError, TypeError):
+        raise HTTPException(HTTPStatus.BAD_REQUEST, "Invalid cursor.")
+    if not is_same_sort:
+        raise HTTPException(
+            HTTPStatus.BAD_REQUEST, "Cursor doesn't match the requested sort."
+        )
+    return value, last_id
+
+
+def _get_value(document: Dict[str, Any], key: str):
+    value = document
+    for part in key.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
@@ -0,0 +1,126 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from pymongo import monitoring
+
+
+class RequestCache:
+    """
+    Unit of work of a request memoizing the repository reads by query and
+    counting the Mongo commands issued on its behalf.
+    """
+
+    def __init__(self):
+        self.mongo_calls = 0
+        # Set once the request is over, the context of the request can still be
+        # copied by the tasks it scheduled e.g. the timers of the scheduler
+        self.closed = False
+        self._entries: Dict[Tuple[str, Hashable], Any] = {}
+
+    def invalidate(self, *namespaces: str):
+        for key in [key for key in self._entries if key[0] in namespaces]:
+            del self._entries[key]
+
+
+_request_cache: ContextVar[Optional[RequestCache]] = ContextVar(
+    "request_cache", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[RequestCache]:
+    request_cache = RequestCache()
+    token = _request_cache.set(request_cache)
+    try:
+        yield request_cache
+    finally:
+        request_cache.closed = True
+        request_cache._entries.clear()
+        _request_cache.reset(token)
+
+
+def get_request_cache() -> Optional[RequestCache]:
+    request_cache = _request_cache.get()
+    if request_cache is None or request_cache.closed:
+        return None
+    return request_cache
+
+
+def invalidate_request_cache(*namespaces: str):
+    request_cache = get_request_cache()
+    if request_cache:
+        request_cache.invalidate(*namespaces)
+
+
+def memoized_read(namespace: str):
+    """
+    Memoizes the results of a repository read for the rest of the request.
+
+    Calls made outside a request, e.g. by the schedulers, are not memoized. The
+    same objects are returned to every caller of the request like an identity map.
+
+    Args:
+        namespace (str): The collection read by the method, used to invalidate
+            the memoized results on writes.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request_cache = get_request_cache()
+            if request_cache is None:
+                return await func(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = (
+                namespace,
+                (
+                    func.__qualname__,
+                    # The repository instance isn't part of the query
+                    repr(list(arguments.arguments.items())[1:]),
+                ),
+            )
+            if key not in request_cache._entries:
+                request_cache._entries[key] = await func(*args, **kwargs)
+            return request_cache._entries[key]
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*namespaces: str):
+    """Drops the memoized reads of the namespaces once the decorated write ran."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                invalidate_request_cache(*namespaces)
+
+        return wrapper
+
+    return decorator
+
+
+class MongoCallCounter(monitoring.CommandListener):
+    """Counts the Mongo commands started by the request they are issued in."""
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        # Motor runs the commands with a copy of the context of the caller
+        request_cache = get_request_cache()
+        if request_cache:
+            request_cache.mongo_calls += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        pass
@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, List
+
+from backend.app.models.enum.export_format import ExportFormat
+from backend.app.models.response_export import ExportField
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+# Keys of the answers describing the field answered instead of the answer
+ANSWER_METADATA_KEYS = {"field", "type"}
+# Leading characters of the cells evaluated as formulas by the spreadsheets
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+BASE_COLUMNS = {
+    "response_id": "Response ID",
+    "form_id": "Form ID",
+    "data_owner_identifier": "Data Owner",
+    "created_at": "Created At",
+    "updated_at": "Updated At",
+}
+
+
+def get_export_fields(forms: Iterable[Dict[str, Any]]) -> List[ExportField]:
+    """Returns the distinct fields of the forms in their order."""
+    fields = {}
+    for form in forms:
+        for field in form.get("fields") or []:
+            field_id = field.get("id")
+            if field_id and field_id not in fields:
+                fields[field_id] = ExportField(id=field_id, title=field.get("title"))
+    return list(fields.values())
+
+
+def flatten_response(
+    response: Dict[str, Any], fields: List[ExportField]
+) -> Dict[str, Any]:
+    """Flattens the answers of the response in the order of the form fields."""
+    answers = response.get("answers") or {}
+    return {
+        "response_id": response.get("response_id"),
+        "form_id": response.get("form_id"),
+        "data_owner_identifier": response.get("dataOwnerIdentifier"),
+        "created_at": response.get("created_at"),
+        "updated_at": response.get("updated_at"),
+        "answers": {
+            field.id: format_answer(answers[field.id])
+            for field in fields
+            if field.id in answers
+        },
+    }
+
+
+def format_answer(answer: Any) -> Any:
+    """Returns the value of an answer, the values of a multi-valued one joined."""
+    if not isinstance(answer, dict):
+        return answer
+    values = []
+    stack = [value for key, value in answer.items() if key not in ANSWER_METADATA_KEYS]
+    stack.reverse()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        elif value is not None:
+            values.append(value)
+    if len(values) == 1:
+        return values[0]
+    return "; ".join(map(str, values))
+
+
+class ResponseExportEncoder:
+    """Encodes the flattened responses of an export into chunks of the format."""
+
+    def __init__(self, export_format: ExportFormat, fields: List[ExportField]):
+        self.export_format = export_format
+        self.fields = fields
+
+    def encode_header(self) -> bytes:
+        if self.export_format != ExportFormat.CSV:
+            return b""
+        return self._encode_csv_rows(
+            [
+                [
+                    *BASE_COLUMNS.values(),
+                    *(field.title or field.id for field in self.fields),
+                ]
+            ]
+        )
+
+    def encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        if self.export_format == ExportFormat.NDJSON:
+            return "".join(
+                json.dumps(row, default=str, separators=(",", ":")) + "\n"
+                for row in rows
+            ).encode()
+        return self._encode_csv_rows(
+            [
+                [
+                    *(row[column] for column in BASE_COLUMNS),
+                    *(row["answers"].get(field.id) for field in self.fields),
+                ]
+                for row in rows
+            ]
+        )
+
+    @staticmethod
+    def _encode_csv_rows(rows: List[List[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            [[escape_csv_cell(cell) for cell in row] for row in rows]
+        )
+        return buffer.getvalue().encode()
+
+
+def escape_csv_cell(cell: Any) -> Any:
+    """
+    Prefixes the text cells that spreadsheets would evaluate as formulas, the
+    answers are supplied by the respondents.
+    """
+    if isinstance(cell, str) and cell.startswith(FORMULA_PREFIXES):
+        return "'" + cell
+    return cell
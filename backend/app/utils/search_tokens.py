@@ -0,0 +1,49 @@
+import re
+import unicodedata
+from typing import Any, Iterable, List
+
+# Longer words are indexed and searched by their prefix of this length
+MAX_TOKEN_LENGTH = 20
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Lower cases the text and strips the accents of its letters."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        character for character in decomposed if not unicodedata.combining(character)
+    ).casefold()
+
+
+def tokenize(text: str | None) -> List[str]:
+    """Splits the text into its distinct normalized words, in order."""
+    if not text:
+        return []
+    words = (word[:MAX_TOKEN_LENGTH] for word in WORD_PATTERN.findall(normalize(text)))
+    return list(dict.fromkeys(words))
+
+
+def tokenize_values(value: Any, max_tokens: int) -> List[str]:
+    """
+    Returns the distinct normalized words of the strings and numbers nested in the
+    value, up to the maximum number of tokens.
+    """
+    tokens = {}
+    stack = [value]
+    while stack and len(tokens) < max_tokens:
+        current = stack.pop()
+        if isinstance(current, dict):
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, (list, tuple, set)):
+            stack.extend(reversed(list(current)))
+        elif isinstance(current, (str, int, float)) and not isinstance(current, bool):
+            tokens.update(dict.fromkeys(tokenize(str(current))))
+    return list(tokens)[:max_tokens]
+
+
+def edge_ngrams(words: Iterable[str]) -> List[str]:
+    """Returns the distinct prefixes of the words, matched by search-as-you-type."""
+    ngrams = dict.fromkeys(
+        word[:length] for word in words for length in range(1, len(word) + 1)
+    )
+    return list(ngrams)
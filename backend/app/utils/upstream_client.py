@@ -0,0 +1,295 @@
+"""Pooled HTTP clients of the upstream services called by the application."""
+import asyncio
+import enum
+import importlib.util
+import random
+import time
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional
+
+import httpx
+from loguru import logger
+from pydantic import BaseModel
+
+from backend.app.exceptions import HTTPException
+from backend.config import settings
+
+AUTH_UPSTREAM = "auth"
+HTTPS_CERT_UPSTREAM = "https_cert"
+# Upstream of the plugin requests whose provider isn't known
+PLUGIN_UPSTREAM = "plugin"
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_STATUS_CODES = {
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+}
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def get_plugin_upstream(provider: str) -> str:
+    return f"plugin:{provider}"
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Rejects the requests to an upstream after consecutive failures.
+
+    Once the reset time has passed a single trial request is let through, the
+    circuit is closed again if it succeeds and reopened otherwise.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def release_trial(self):
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+
+class UpstreamMetrics(BaseModel):
+    """Model for the metrics of the requests sent to an upstream."""
+
+    name: str
+    max_connections: int
+    in_flight: int
+    max_in_flight: int
+    total_requests: int
+    failed_requests: int
+    retried_requests: int
+    rejected_requests: int
+    circuit_state: CircuitState
+    # Number of requests that took at most the given seconds, "+Inf" counts all
+    latency_buckets: Dict[str, int]
+    latency_sum_seconds: float
+
+
+class UpstreamClient:
+    """
+    HTTP client with its own connection pool, timeouts and circuit breaker for an
+    upstream.
+
+    The idempotent requests failing with a connection error or an unavailable
+    response are retried with a jittered exponential backoff.
+    """
+
+    def __init__(self, name: str):
+        client_settings = settings.http_client_settings
+        self.name = name
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=client_settings.MAX_CONNECTIONS,
+                max_keepalive_connections=client_settings.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=client_settings.KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(
+                client_settings.UPSTREAM_TIMEOUTS.get(
+                    name, client_settings.TIMEOUT_SECONDS
+                ),
+                connect=client_settings.CONNECT_TIMEOUT_SECONDS,
+            ),
+            http2=client_settings.HTTP2 and _is_http2_available(),
+        )
+        self._circuit_breaker = CircuitBreaker(
+            failure_threshold=client_settings.CIRCUIT_FAILURE_THRESHOLD,
+            reset_seconds=client_settings.CIRCUIT_RESET_SECONDS,
+        )
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._total_requests = 0
+        self._failed_requests = 0
+        self._retried_requests = 0
+        self._rejected_requests = 0
+        self._latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latency_sum = 0.0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: bool = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends a request to the upstream.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL of the request.
+            retry (bool, optional): Whether the request can be retried, defaults
+                to whether the method is idempotent.
+            stream (bool): Whether to return once the headers are received
+                without reading the body. The response must then be closed by
+                the caller.
+            **kwargs: The arguments of `httpx.AsyncClient.request`.
+
+        Raises:
+            HTTPException: If the circuit of the upstream is open.
+        """
+        client_settings = settings.http_client_settings
+        method = method.upper()
+        retry = method in IDEMPOTENT_METHODS if retry is None else retry
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(method, url, stream, **kwargs)
+            except httpx.TransportError as e:
+                # Requests that failed to connect never reached the upstream
+                can_retry = retry or isinstance(e, httpx.ConnectError)
+                if not can_retry or attempt >= client_settings.RETRIES:
+                    raise
+                logger.warning(f"Retrying {method} {url} after error: {e!r}")
+            else:
+                if (
+                    not retry
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= client_settings.RETRIES
+                ):
+                    return response
+                await response.aclose()
+                logger.warning(f"Retrying {method} {url} after {response.status_code}")
+            attempt += 1
+            self._retried_requests += 1
+            await asyncio.sleep(
+                random.uniform(0, client_settings.RETRY_BACKOFF_SECONDS * 2**attempt)
+            )
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        response = await self.request("GET", url, **kwargs)
+        return response.json()
+
+    def metrics(self) -> UpstreamMetrics:
+        latency_buckets = {}
+        count = 0
+        for upper_bound, bucket_count in zip(
+            (*map(str, LATENCY_BUCKETS), "+Inf"), self._latency_counts
+        ):
+            count += bucket_count
+            latency_buckets[upper_bound] = count
+        return UpstreamMetrics(
+            name=self.name,
+            max_connections=settings.http_client_settings.MAX_CONNECTIONS,
+            in_flight=self._in_flight,
+            max_in_flight=self._max_in_flight,
+            total_requests=self._total_requests,
+            failed_requests=self._failed_requests,
+            retried_requests=self._retried_requests,
+            rejected_requests=self._rejected_requests,
+            circuit_state=self._circuit_breaker.state,
+            latency_buckets=latency_buckets,
+            latency_sum_seconds=round(self._latency_sum, 3),
+        )
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def _send(
+        self, method: str, url: str, stream: bool, **kwargs
+    ) -> httpx.Response:
+        if not self._circuit_breaker.allow_request():
+            self._rejected_requests += 1
+            raise HTTPException(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                f"Upstream {self.name} is unavailable.",
+            )
+        self._total_requests += 1
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        started_at = time.perf_counter()
+        try:
+            response = await self._client.send(
+                self._client.build_request(method, url, **kwargs), stream=stream
+            )
+        except httpx.TransportError:
+            self._failed_requests += 1
+            self._circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # e.g. cancelled, the upstream may not be at fault
+            self._circuit_breaker.release_trial()
+            raise
+        finally:
+            self._in_flight -= 1
+            self._observe_latency(time.perf_counter() - started_at)
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self._failed_requests += 1
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+        return response
+
+    def _observe_latency(self, seconds: float):
+        self._latency_sum += seconds
+        for index, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                self._latency_counts[index] += 1
+                return
+        self._latency_counts[-1] += 1
+
+
+class UpstreamClients:
+    """Registry of the clients of the upstreams created on their first use."""
+
+    def __init__(self):
+        self._clients: Dict[str, UpstreamClient] = {}
+
+    def get(self, name: str) -> UpstreamClient:
+        if name not in self._clients:
+            self._clients[name] = UpstreamClient(name)
+        return self._clients[name]
+
+    def metrics(self) -> List[UpstreamMetrics]:
+        return [client.metrics() for client in self._clients.values()]
+
+    async def aclose(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*[client.aclose() for client in clients])
+
+
+def _is_http2_available() -> bool:
+    # HTTP/2 support of httpx depends on the optional h2 package
+    return importlib.util.find_spec("h2") is not None
+
+
+upstream_clients = UpstreamClients()
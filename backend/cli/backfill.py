@@ -0,0 +1,62 @@
+"""Command-line interface - backfill command."""
+import asyncio
+
+import click
+
+cmd_short_help = "Fill in the derived data of the existing forms and responses."
+cmd_help = """\
+Reconcile the response counters of the forms, index the forms for the search and
+index the answers of the responses.
+
+These run as maintenance jobs of the scheduler leader. Run this command instead
+when the scheduler is disabled, e.g. from a cron job.
+"""
+
+TASKS = ("counters", "search-index", "answer-tokens")
+
+
+@click.command(
+    help=cmd_help,
+    short_help=cmd_short_help,
+)
+@click.option(
+    "--only",
+    help="Run only the given task, can be repeated.",
+    type=click.Choice(TASKS),
+    multiple=True,
+)
+def backfill(**options):
+    """Define command entrypoint.
+
+    Args:
+        options (typing.Dict[str, typing.Any]): Map of command option names to
+            their parsed values.
+
+    """
+    asyncio.run(_backfill(options["only"] or TASKS))
+
+
+async def _backfill(tasks):
+    # Imported here as the app settings are loaded on import
+    from backend.app.container import container
+    from backend.app.handlers.database import close_db, init_db
+    from backend.app.services.init_schedulers import (
+        backfill_answer_tokens,
+        backfill_form_search_indexes,
+        reconcile_form_counters,
+    )
+    from backend.config import settings
+
+    task_functions = {
+        "counters": reconcile_form_counters,
+        "search-index": backfill_form_search_indexes,
+        "answer-tokens": backfill_answer_tokens,
+    }
+    client = container.database_client()
+    await init_db(settings.mongo_settings.DB, client)
+    try:
+        for task in tasks:
+            click.echo(f"Running {task} backfill.")
+            await task_functions[task]()
+    finally:
+        await close_db(client)
@@ -1,6 +1,8 @@
 """Command-line interface - root."""
 import logging
 
+from backend.cli.backfill import backfill
+from backend.cli.indexes import indexes
 from backend.cli.serve import serve
 
 import click
@@ -38,3 +40,5 @@ def cli(**options):
 
 
 cli.add_command(serve)
+cli.add_command(indexes)
+cli.add_command(backfill)
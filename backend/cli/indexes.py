@@ -0,0 +1,165 @@
+"""Command-line interface - indexes command."""
+from typing import Dict, List, Tuple
+
+import click
+from pymongo import IndexModel, MongoClient
+
+cmd_short_help = "Compare declared and live database indexes."
+cmd_help = """\
+Compare the indexes declared on the document models with the indexes in the
+database and report the queries recorded by the database profiler that scanned
+whole collections.
+"""
+
+
+@click.command(
+    help=cmd_help,
+    short_help=cmd_short_help,
+)
+@click.option(
+    "--profile/--no-profile",
+    help="Report the collection scans recorded by the database profiler.",
+    default=True,
+)
+@click.option(
+    "--slowms",
+    help="Enable the database profiler for operations slower than SLOWMS.",
+    type=click.IntRange(min=0),
+    required=False,
+)
+@click.option(
+    "--limit",
+    help="The number of collection scan query shapes to report.",
+    type=click.IntRange(min=1),
+    default=20,
+)
+def indexes(**options):
+    """Define command entrypoint.
+
+    Args:
+        options (typing.Dict[str, typing.Any]): Map of command option names to
+            their parsed values.
+
+    """
+    # Imported here as the app settings are loaded on import
+    from backend.app.handlers.database import get_document_models
+    from backend.config import settings
+
+    # Registers the models declared with the entity decorator
+    import backend.app.schemas.workspace_responder  # noqa: F401
+
+    client = MongoClient(settings.mongo_settings.URI)
+    db = client[settings.mongo_settings.DB]
+
+    has_missing_indexes = False
+    for model in get_document_models():
+        collection_name = model.Settings.name
+        declared_indexes = _get_declared_indexes(model)
+        live_indexes = {
+            _get_index_key(index["key"]): name
+            for name, index in db[collection_name].index_information().items()
+            if name != "_id_"
+        }
+        missing = declared_indexes.keys() - live_indexes.keys()
+        undeclared = live_indexes.keys() - declared_indexes.keys()
+        has_missing_indexes = has_missing_indexes or bool(missing)
+        if not missing and not undeclared:
+            click.echo(f"{collection_name}: {len(declared_indexes)} indexes in sync")
+            continue
+        click.echo(f"{collection_name}:")
+        for key in sorted(missing):
+            click.echo(f"  missing     {_format_index_key(key)}")
+        for key in sorted(undeclared):
+            click.echo(f"  undeclared  {_format_index_key(key)} ({live_indexes[key]})")
+
+    if options["slowms"] is not None:
+        db.command("profile", 1, slowms=options["slowms"])
+        click.echo(
+            f"\nProfiler enabled for operations slower than {options['slowms']}ms."
+        )
+    if options["profile"]:
+        _report_collection_scans(db, options["limit"])
+
+    client.close()
+    if has_missing_indexes:
+        click.echo("\nMissing indexes are created when the application starts.")
+
+
+def _get_declared_indexes(model) -> Dict[Tuple, IndexModel]:
+    # Same as how beanie collects the indexes of a model on initialization
+    declared_indexes = [
+        IndexModel([(field_name, field.type_._indexed[0])], **field.type_._indexed[1])
+        for field_name, field in model.__fields__.items()
+        if getattr(field.type_, "_indexed", None)
+    ]
+    declared_indexes += getattr(model.Settings, "indexes", None) or []
+    return {_get_index_key(index.document["key"]): index for index in declared_indexes}
+
+
+def _get_index_key(key) -> Tuple:
+    return tuple((field, direction) for field, direction in dict(key).items())
+
+
+def _format_index_key(key: Tuple) -> str:
+    return ", ".join(f"{field}: {direction}" for field, direction in key)
+
+
+def _report_collection_scans(db, limit: int):
+    profile_status = db.command("profile", -1)
+    click.echo(
+        f"\nCollection scans (profiling level {profile_status.get('was')}, "
+        f"slowms {profile_status.get('slowms')}):"
+    )
+    collection_scans: List[Dict] = list(
+        db["system.profile"].aggregate(
+            [
+                {"$match": {"planSummary": "COLLSCAN"}},
+                {
+                    "$group": {
+                        "_id": {"ns": "$ns", "op": "$op"},
+                        "count": {"$sum": 1},
+                        "total_millis": {"$sum": "$millis"},
+                        "max_docs_examined": {"$max": "$docsExamined"},
+                        "command": {"$last": "$command"},
+                    }
+                },
+                {"$sort": {"total_millis": -1}},
+                {"$limit": limit},
+            ]
+        )
+    )
+    if not collection_scans:
+        click.echo("  none recorded")
+        if not profile_status.get("was"):
+            click.echo("  the profiler is disabled, enable it with --slowms")
+        return
+    for collection_scan in collection_scans:
+        click.echo(
+            f"  {collection_scan['_id']['ns']} {collection_scan['_id']['op']}:"
+            f" {collection_scan['count']} scans, {collection_scan['total_millis']}ms,"
+            f" up to {collection_scan['max_docs_examined']} documents examined,"
+            f" fields {sorted(_get_filtered_fields(collection_scan['command']))}"
+        )
+
+
+def _get_filtered_fields(command: Dict) -> set:
+    query = command.get("filter") or command.get("q") or {}
+    for stage in command.get("pipeline", []):
+        if "$match" in stage:
+            query = stage["$match"]
+            break
+    return _collect_fields(query)
+
+
+def _collect_fields(query) -> set:
+    fields = set()
+    if isinstance(query, dict):
+        for key, value in query.items():
+            if key.startswith("$"):
+                fields |= _collect_fields(value)
+            else:
+                fields.add(key)
+    elif isinstance(query, list):
+        for item in query:
+            fields |= _collect_fields(item)
+    return fields
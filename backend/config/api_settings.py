@@ -11,6 +11,24 @@ class ApiSettings(BaseSettings):
     HOST: str = ""
     ALLOWED_COLLABORATORS = 10
     ALLOWED_WORKSPACES = 3
+    CORS_ORIGINS_REFRESH_SECONDS: int = 300
+    # Origins rejected by CORS are not looked up again until they expire
+    CORS_NEGATIVE_CACHE_SECONDS: int = 60
+    CORS_NEGATIVE_CACHE_SIZE: int = 10000
+    WORKSPACE_PERMISSION_CACHE_SECONDS: int = 30
+    WORKSPACE_PERMISSION_CACHE_SIZE: int = 10000
+    # Interval of the check for the form provider configs changed by the other
+    # workers, the configs are reloaded at least once per TTL
+    PROVIDER_REGISTRY_POLL_SECONDS: int = 5
+    PROVIDER_REGISTRY_TTL_SECONDS: int = 300
+    # Runs the form provider plugins listed in the plugin config in the worker
+    # instead of sending their operations to the plugin services, the bundled
+    # config is used if no path is given. The bundled plugins don't define any
+    # form operation yet so they are all sent to the services
+    IN_PROCESS_PLUGINS: bool = False
+    PLUGIN_CONFIG_PATH: str = ""
+    FORM_SEARCH_LIMIT: int = 50
+    FORM_SEARCH_BACKFILL_BATCH_SIZE: int = 500
 
     class Config:
         env_prefix = "API_"
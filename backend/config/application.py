@@ -7,6 +7,9 @@ from backend.config.api_settings import ApiSettings
 from backend.config.auth_settings import AuthSettings
 from backend.config.aws import AWSSettings
 from backend.config.database import MongoSettings
+from backend.config.export_settings import ExportSettings
+from backend.config.form_import_settings import FormImportSettings
+from backend.config.http_client_settings import HttpClientSettings
 from backend.config.https_certificate import HttpsCertificateApiSettings
 from backend.config.schedular_settings import SchedularSettings
 
@@ -40,8 +43,11 @@ class Application(BaseSettings):
     auth_settings: AuthSettings = AuthSettings()
     mongo_settings: MongoSettings = MongoSettings()
     schedular_settings: SchedularSettings = SchedularSettings()
+    form_import_settings: FormImportSettings = FormImportSettings()
     aws_settings: AWSSettings = AWSSettings()
     https_cert_api_settings: HttpsCertificateApiSettings = HttpsCertificateApiSettings()
+    http_client_settings: HttpClientSettings = HttpClientSettings()
+    export_settings: ExportSettings = ExportSettings()
 
     # All your additional application configuration should go either here or in
     # separate file in this submodule.
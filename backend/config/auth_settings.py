@@ -6,6 +6,19 @@ class AuthSettings(BaseSettings):
     JWT_SECRET: str
     ACCESS_TOKEN_EXPIRY_IN_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRY_IN_DAYS: int = 30
+    # Polling interval of the tokens blacklisted by the other workers
+    BLACKLIST_REFRESH_SECONDS: int = 5
+    BLACKLIST_RELOAD_MINUTES: int = 60
+    BLACKLIST_FALSE_POSITIVE_RATE: float = 0.01
+    # Profiles of the users fetched from the auth service are served from the
+    # cache for USER_PROFILE_CACHE_SECONDS and then revalidated in the background
+    # for up to USER_PROFILE_STALE_SECONDS
+    USER_PROFILE_CACHE_SECONDS: int = 300
+    USER_PROFILE_STALE_SECONDS: int = 3600
+    USER_PROFILE_CACHE_SIZE: int = 10000
+    USER_PROFILE_BATCH_SIZE: int = 100
+    # Shares the cached profiles between the workers through Redis
+    USER_PROFILE_USE_REDIS: bool = False
 
     BASE_URL: str = "http://localhost:8001/api/v1"
     CALLBACK_URI: str = f"{BASE_URL}/auth/callback"
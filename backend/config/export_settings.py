@@ -0,0 +1,32 @@
+from pydantic import BaseSettings
+
+
+class ExportSettings(BaseSettings):
+    # Responses fetched and encoded at once while streaming an export
+    BATCH_SIZE: int = 1000
+    # Runs the background export jobs in this worker
+    JOBS_ENABLED: bool = True
+    MAX_CONCURRENT_JOBS: int = 2
+    JOBS_POLL_SECONDS: int = 5
+    # Time after which the job of a dead worker is resumed by another one, the
+    # lock is renewed after every chunk
+    JOB_LOCK_SECONDS: int = 300
+    # Must not change while exports to S3 are running, their part numbers are
+    # derived from it
+    MAX_JOB_ATTEMPTS: int = 3
+    # Compressed size after which a chunk is written, the parts of a multipart
+    # upload on S3 must be at least 5 MiB
+    CHUNK_MIN_BYTES: int = 8 * 1024 * 1024
+    # Storage of the exports, local or s3. A local export is run and downloaded
+    # only on the host it was requested on, which must run the jobs, unless
+    # LOCAL_DIR is a volume shared between the hosts. Use s3 or a shared volume
+    # when the requests are balanced between several hosts.
+    STORAGE: str = "local"
+    LOCAL_DIR: str = "exports"
+    LOCAL_DIR_SHARED: bool = False
+    S3_BUCKET: str = "bettercollected"
+    S3_PREFIX: str = "exports"
+    DOWNLOAD_URL_EXPIRY_SECONDS: int = 3600
+
+    class Config:
+        env_prefix = "EXPORT_"
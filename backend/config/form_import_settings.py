@@ -0,0 +1,11 @@
+from pydantic import BaseSettings
+
+
+class FormImportSettings(BaseSettings):
+    BATCH_SIZE: int = 500
+    # Distinct words of the answers of a response indexed for the answer filter
+    MAX_ANSWER_TOKENS: int = 500
+    ANSWER_TOKENS_BACKFILL_BATCH_SIZE: int = 1000
+
+    class Config:
+        env_prefix = "FORM_IMPORT_"
@@ -0,0 +1,27 @@
+from typing import Dict
+
+from pydantic import BaseSettings
+
+
+class HttpClientSettings(BaseSettings):
+    # Connection pool of each upstream i.e. the auth service, the https
+    # certificate API and every form provider plugin
+    MAX_CONNECTIONS: int = 100
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KEEPALIVE_EXPIRY_SECONDS: float = 30
+    CONNECT_TIMEOUT_SECONDS: float = 5
+    TIMEOUT_SECONDS: float = 30
+    # Timeouts of specific upstreams e.g. {"auth": 10, "plugin:google": 60}
+    UPSTREAM_TIMEOUTS: Dict[str, float] = {}
+    HTTP2: bool = True
+    # Retries of the idempotent requests failing with connection errors or
+    # unavailable responses
+    RETRIES: int = 2
+    RETRY_BACKOFF_SECONDS: float = 0.2
+    # Consecutive failures after which the requests to an upstream are rejected
+    # until it is probed again
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_SECONDS: float = 30
+
+    class Config:
+        env_prefix = "HTTP_CLIENT_"
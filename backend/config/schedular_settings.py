@@ -1,9 +1,36 @@
+from typing import Dict
+
 from pydantic import BaseSettings
 
 
 class SchedularSettings(BaseSettings):
     ENABLED: bool = True
+    # Sync interval of active forms, the interval of the forms without new
+    # responses is multiplied by the backoff factor up to the maximum interval
     INTERVAL_MINUTES: int = 1
+    MAX_INTERVAL_MINUTES: int = 1440
+    INTERVAL_BACKOFF_FACTOR: float = 2
+    FULL_SYNC_INTERVAL_MINUTES: int = 60
+    # Interval of the job fixing the drift of the response counters of the forms
+    COUNTERS_RECONCILE_INTERVAL_MINUTES: int = 360
+    # Number of forms scheduled and users fetched per batch during startup
+    BOOTSTRAP_BATCH_SIZE: int = 100
+    # Batches of users fetched from the auth service at once during startup
+    BOOTSTRAP_MAX_CONCURRENT_FETCHES: int = 4
+    # Partitions the form syncs between the workers instead of sharing a job store
+    DISTRIBUTED: bool = False
+    HEARTBEAT_SECONDS: int = 10
+    # Workers and leader lease without a heartbeat for this long are considered dead
+    WORKER_TIMEOUT_SECONDS: int = 30
+    RECONCILE_INTERVAL_SECONDS: int = 60
+    # Time after which a form sync lock held by a dead worker can be taken over
+    SYNC_LOCK_SECONDS: int = 300
+    # Limits of the requests sent to the form provider plugins
+    MAX_CONCURRENT_SYNCS: int = 10
+    PROVIDER_REQUESTS_PER_SECOND: float = 5
+    PROVIDER_BURST: int = 10
+    # Requests per second of specific providers e.g. {"google": 2}
+    PROVIDER_RATE_LIMITS: Dict[str, float] = {}
 
     class Config:
         env_prefix = "SCHEDULAR_"